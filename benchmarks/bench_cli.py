@@ -0,0 +1,240 @@
+"""End-to-end latency harness for the command line interface.
+
+Launches ``python -m jmbuilder`` as a subprocess over realistic scenarios
+(``-V``, ``-h``, ``--fix-mf`` and ``--fix-prop`` on small and huge inputs),
+and reports the latency distributions (p50/p95) and the peak RSS of:
+
+- cold runs, where the package has no compiled bytecode (as right after
+  being installed or updated), so each run also compiles its modules;
+- warm runs, where the bytecode of the package is already cached.
+
+The cold and warm runs are interleaved. The peak RSS is not measured where
+`os.wait4` is not available (i.e., Windows).
+
+Both are run from private copies of the package, so the bytecode of the
+working tree is left untouched. The results are compared against a budget
+file (``benchmarks/cli_budget.json`` by default), and the script exits with
+1 if any of them exceeds its budget.
+
+Usage::
+
+    $ python benchmarks/bench_cli.py [--runs N] [--budget FILE] [--output FILE]
+
+    # Regenerate the budget file from the measured values
+    $ python benchmarks/bench_cli.py --write-budget [--headroom 2.0]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import threading
+import subprocess
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from bench_micro import generate_manifest, generate_properties, parse_size
+
+ROOTDIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli_budget.json')
+
+POM: str = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>example</artifactId>
+  <version>1.2.3</version>
+  <name>Example</name>
+  <url>https://example.com</url>
+  <properties>
+    <package.mainClass>com.example.Main</package.mainClass>
+  </properties>
+</project>
+'''
+
+# The size of the huge inputs
+HUGE: str = '4M'
+
+# The measured metrics, compared against the budget
+METRICS: Tuple[str, ...] = ('cold_p50_ms', 'cold_p95_ms', 'warm_p50_ms', 'warm_p95_ms',
+                            'peak_rss_kb')
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of the values."""
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, round(len(values) * pct) - 1))]
+
+
+def _run(cmd: List[str], env: Dict[str, str], cwd: str) -> Tuple[float, Optional[int]]:
+    """
+    Run the command and return its latency in milliseconds and peak RSS in KiB,
+    the latter being None where `os.wait4` is not available (i.e., Windows).
+    """
+    stderr: List[bytes] = []
+    rusage: Optional[Any] = None
+    start: float = time.perf_counter()
+    with subprocess.Popen(cmd, env=env, cwd=cwd,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as proc:
+        if hasattr(os, 'wait4'):
+            # Drain the error output while waiting, so a full pipe cannot block
+            # the child (`communicate` would reap it, discarding its usage)
+            reader = threading.Thread(target=lambda: stderr.append(proc.stderr.read()))
+            reader.start()
+            _, status, rusage = os.wait4(proc.pid, 0)
+            elapsed: float = (time.perf_counter() - start) * 1000
+            reader.join()
+            proc.returncode = os.waitstatus_to_exitcode(status) \
+                if hasattr(os, 'waitstatus_to_exitcode') else status >> 8
+        else:
+            stderr.append(proc.communicate()[1])
+            elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr[0])
+
+    if rusage is None:
+        return elapsed, None
+    # `ru_maxrss` is in bytes on macOS, in kilobytes elsewhere
+    rss: int = rusage.ru_maxrss // 1024 if sys.platform == 'darwin' else rusage.ru_maxrss
+    return elapsed, rss
+
+
+def _copy_package(dest: str) -> str:
+    """Copy the package without its bytecode into `dest`, return the new PYTHONPATH."""
+    shutil.copytree(os.path.join(ROOTDIR, 'jmbuilder'), os.path.join(dest, 'jmbuilder'),
+                    ignore=shutil.ignore_patterns('__pycache__', 'tests'))
+    return dest
+
+
+def _scenarios(tmpdir: str) -> Dict[str, List[str]]:
+    """Generate the input files and return the arguments of each scenario."""
+    files: Dict[str, str] = {
+        'pom.xml': POM,
+        'MANIFEST.MF': 'Main-Class: ${package.mainClass}\nVersion: ${project.version}\n',
+        'app.properties': 'name = ${project.name}\nversion = ${project.version}\n',
+        'huge-MANIFEST.MF': generate_manifest(parse_size(HUGE)),
+        'huge-app.properties': generate_properties(parse_size(HUGE))
+    }
+    for name, contents in files.items():
+        with open(os.path.join(tmpdir, name), 'w', encoding='utf-8') as file:
+            file.write(contents)
+
+    def fix(option: str, name: str) -> List[str]:
+        return [option, 'pom.xml', name, os.path.join('out', name)]
+
+    return {
+        'version': ['-V'],
+        'help': ['-h'],
+        'fix-mf': fix('--fix-mf', 'MANIFEST.MF'),
+        'fix-prop': fix('--fix-prop', 'app.properties'),
+        f'fix-mf-{HUGE}': fix('--fix-mf', 'huge-MANIFEST.MF'),
+        f'fix-prop-{HUGE}': fix('--fix-prop', 'huge-app.properties')
+    }
+
+
+def measure(runs: int) -> Dict[str, Dict[str, float]]:
+    """Run every scenario cold and warm, and return the measured metrics."""
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scenarios: Dict[str, List[str]] = _scenarios(tmpdir)
+        cold_path: str = _copy_package(os.path.join(tmpdir, 'cold'))
+        warm_path: str = _copy_package(os.path.join(tmpdir, 'warm'))
+
+        env: Dict[str, str] = {
+            key: val for key, val in os.environ.items() if not key.startswith('PYTHON')
+        }
+        cold_env: Dict[str, str] = dict(env, PYTHONPATH=cold_path, PYTHONDONTWRITEBYTECODE='1')
+        warm_env: Dict[str, str] = dict(env, PYTHONPATH=warm_path)
+
+        for name, args in scenarios.items():
+            cmd: List[str] = [sys.executable, '-m', 'jmbuilder', *args]
+            _run(cmd, warm_env, tmpdir)  # Prime the bytecode (and the page cache)
+
+            cold: List[Tuple[float, Optional[int]]] = []
+            warm: List[Tuple[float, Optional[int]]] = []
+            for _ in range(runs):  # Interleaved, so a drift of the machine affects both
+                cold.append(_run(cmd, cold_env, tmpdir))
+                warm.append(_run(cmd, warm_env, tmpdir))
+            results[name] = {
+                'cold_p50_ms': _percentile([lat for lat, _ in cold], 0.50),
+                'cold_p95_ms': _percentile([lat for lat, _ in cold], 0.95),
+                'warm_p50_ms': _percentile([lat for lat, _ in warm], 0.50),
+                'warm_p95_ms': _percentile([lat for lat, _ in warm], 0.95)
+            }
+            rss: List[int] = [rss for _, rss in cold + warm if rss is not None]
+            if rss:  # Not measured on Windows
+                results[name]['peak_rss_kb'] = max(rss)
+            print(f'{name:<14} cold p50 {results[name]["cold_p50_ms"]:8.2f} ms  '
+                  f'p95 {results[name]["cold_p95_ms"]:8.2f} ms   '
+                  f'warm p50 {results[name]["warm_p50_ms"]:8.2f} ms  '
+                  f'p95 {results[name]["warm_p95_ms"]:8.2f} ms' +
+                  (f'   peak RSS {max(rss) / 1024:7.1f} MiB' if rss else ''), flush=True)
+
+    return results
+
+
+def check(results: Dict[str, Dict[str, float]], budget: Dict[str, Dict[str, float]]) -> List[str]:
+    """Return the descriptions of metrics exceeding their budget."""
+    exceeded: List[str] = []
+    for name, metrics in results.items():
+        for metric, limit in budget.get(name, {}).items():
+            if metric in metrics and metrics[metric] > limit:
+                exceeded.append(f'{name}.{metric}: {metrics[metric]:.1f} > {limit:.1f}')
+    return exceeded
+
+
+def main() -> int:
+    """Run the harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=30,
+                        help='number of cold and warm runs per scenario (default: 30)')
+    parser.add_argument('--budget', default=BUDGET,
+                        help='the budget file to compare against (default: %(default)s)')
+    parser.add_argument('--output', help='write the JSON results to this file')
+    parser.add_argument('--write-budget', action='store_true',
+                        help='write the measured values times the headroom to the budget file')
+    parser.add_argument('--headroom', type=float, default=2.0,
+                        help='the multiplier applied when writing the budget (default: 2.0)')
+    opts = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = measure(opts.runs)
+
+    if opts.output:
+        with open(opts.output, 'w', encoding='utf-8') as file:
+            json.dump({
+                'meta': {
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'platform': platform.platform(),
+                    'runs': opts.runs
+                },
+                'results': results
+            }, file, indent=2)
+
+    if opts.write_budget:
+        with open(opts.budget, 'w', encoding='utf-8') as file:
+            json.dump({
+                name: {metric: round(metrics[metric] * opts.headroom, 1) for metric in METRICS
+                       if metric in metrics}
+                for name, metrics in results.items()
+            }, file, indent=2)
+            file.write('\n')
+        return 0
+
+    with open(opts.budget, 'r', encoding='utf-8') as file:
+        exceeded: List[str] = check(results, json.load(file))
+    if exceeded:
+        print(f'{len(exceeded)} metric(s) over budget:', *exceeded,
+              sep='\n  ', file=sys.stderr)
+        return 1
+    print('all scenarios within budget')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
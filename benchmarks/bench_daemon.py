@@ -0,0 +1,101 @@
+"""Benchmark the per-request latency of the daemon against cold CLI runs.
+
+Generates a small POM with a manifest and a properties file in a temporary
+directory, then times the same ``--fix-mf``/``--fix-prop`` request run as
+``python -m jmbuilder`` (cold) and forwarded by ``jmbuilder/client.py`` to
+a warm daemon.
+
+Usage::
+
+    $ python benchmarks/bench_daemon.py [--runs N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOTDIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIENT: str = os.path.join(ROOTDIR, 'jmbuilder', 'client.py')
+
+POM: str = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>example</artifactId>
+  <version>1.2.3</version>
+  <name>Example</name>
+  <url>https://example.com</url>
+  <properties>
+    <package.mainClass>com.example.Main</package.mainClass>
+  </properties>
+</project>
+'''
+
+
+def _time_runs(cmd: list, runs: int, env: dict) -> list:
+    """Run the command `runs` times and return the latencies in milliseconds."""
+    latencies: list = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        subprocess.run(cmd, env=env, check=True, stdout=subprocess.DEVNULL)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(name: str, latencies: list) -> None:
+    """Print the summary of latencies."""
+    latencies = sorted(latencies)
+    p95: float = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f'{name:<8} median {statistics.median(latencies):8.2f} ms   '
+          f'p95 {p95:8.2f} ms   min {latencies[0]:8.2f} ms')
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, contents in (('pom.xml', POM),
+                               ('MANIFEST.MF', 'Main-Class: ${package.mainClass}\n'),
+                               ('app.properties', 'version = ${project.version}\n')):
+            with open(os.path.join(tmpdir, name), 'w', encoding='utf-8') as file:
+                file.write(contents)
+
+        env: dict = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOTDIR, env.get('PYTHONPATH')]))
+        env['JMBUILDER_SOCKET'] = os.path.join(tmpdir, 'daemon.sock')
+
+        args: list = [
+            '--fix-mf', os.path.join(tmpdir, 'pom.xml'), os.path.join(tmpdir, 'MANIFEST.MF'),
+            os.path.join(tmpdir, 'out', 'MANIFEST.MF'),
+            '--fix-prop', os.path.join(tmpdir, 'pom.xml'),
+            os.path.join(tmpdir, 'app.properties'), os.path.join(tmpdir, 'out', 'app.properties')
+        ]
+
+        cold: list = _time_runs([sys.executable, '-m', 'jmbuilder', *args], opts.runs, env)
+
+        daemon = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, '-m', 'jmbuilder', '--daemon', '--idle-timeout', '60'],
+            env=env, stderr=subprocess.PIPE)
+        try:
+            daemon.stderr.readline()  # Wait until the daemon is listening
+            warm: list = _time_runs([sys.executable, '-S', CLIENT, *args], opts.runs, env)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    _report('cold', cold)
+    _report('daemon', warm)
+    print(f'speedup  {statistics.median(cold) / statistics.median(warm):.1f}x')
+
+
+if __name__ == '__main__':
+    main()
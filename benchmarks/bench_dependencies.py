@@ -0,0 +1,119 @@
+"""Benchmark the extraction of dependencies from large POM files.
+
+Generates POM files with thousands of dependencies, half of them managed by
+the ``<dependencyManagement>`` and all versions using ``${...}`` properties,
+then compares:
+
+- the scraping with ``soup.find_all`` loops, searching the managed
+  dependencies once per dependency and each property through
+  ``PomParser.get_property``;
+- ``PomParser.get_dependencies``, collecting all sections in a single
+  traversal and filling the versions in through indexed lookups (measured
+  on a new `PomParser` each time, i.e. without its cache).
+
+Both must return the same versions. The scraping is quadratic in the number
+of dependencies, so large counts take minutes.
+
+Usage::
+
+    $ python benchmarks/bench_dependencies.py [--deps 500,2000] [--repeat N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.core import PomParser, _import_bs4
+
+
+def generate_pom(deps: int) -> str:
+    """Generate a POM with the given number of dependencies."""
+    props: List[str] = [f'<v{idx}>{idx}.0.${{patch}}</v{idx}>' for idx in range(deps)]
+    managed: List[str] = [
+        f'<dependency><groupId>com.example.g{idx}</groupId><artifactId>a{idx}</artifactId>'
+        f'<version>${{v{idx}}}</version></dependency>' for idx in range(0, deps, 2)
+    ]
+    declared: List[str] = [
+        f'<dependency><groupId>com.example.g{idx}</groupId><artifactId>a{idx}</artifactId>'
+        + ('' if idx % 2 == 0 else f'<version>${{v{idx}}}</version>')
+        + '<scope>compile</scope></dependency>' for idx in range(deps)
+    ]
+    return '\n'.join([
+        '<?xml version="1.0" encoding="UTF-8"?>', '<project>',
+        '<groupId>com.example</groupId><artifactId>example</artifactId><version>1.0</version>',
+        '<properties><patch>7</patch>', *props, '</properties>',
+        '<dependencyManagement><dependencies>', *managed, '</dependencies></dependencyManagement>',
+        '<dependencies>', *declared, '</dependencies>', '</project>'
+    ])
+
+
+def scrape(pom: PomParser) -> List[Tuple[str, str, Optional[str]]]:
+    """Extract the dependencies with ``soup.find_all`` loops."""
+    def text(tag, name: str) -> Optional[str]:
+        element = tag.find(name)
+        return element.text if element else None
+
+    def resolve(value: Optional[str]) -> Optional[str]:
+        while value and value.startswith('${'):
+            value = pom.get_property(value[2:value.index('}')], dot=False) + \
+                value[value.index('}') + 1:]
+        return value.replace('${patch}', pom.get_property('patch')) if value else value
+
+    management = pom.soup.find('dependencyManagement')
+    results: List[Tuple[str, str, Optional[str]]] = []
+    for dep in pom.project_tag.find('dependencies', recursive=False).find_all('dependency'):
+        group_id, artifact_id = text(dep, 'groupId'), text(dep, 'artifactId')
+        version: Optional[str] = text(dep, 'version')
+        if version is None:
+            for managed in management.find_all('dependency'):
+                if text(managed, 'groupId') == group_id and \
+                        text(managed, 'artifactId') == artifact_id:
+                    version = text(managed, 'version')
+                    break
+        results.append((group_id, artifact_id, resolve(version)))
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--deps', default='500,2000',
+                        help='comma-separated numbers of dependencies')
+    parser.add_argument('--repeat', type=int, default=1)
+    opts = parser.parse_args()
+
+    bs4 = _import_bs4()
+    for deps in (int(count) for count in opts.deps.split(',')):
+        soup = bs4.BeautifulSoup(generate_pom(deps), 'xml')
+        funcs: Dict[str, Callable[[], list]] = {
+            'find_all loops': lambda: scrape(PomParser(soup)),
+            'get_dependencies': lambda: [(dep.group_id, dep.artifact_id, dep.version)
+                                         for dep in PomParser(soup).get_dependencies()]
+        }
+
+        timings: Dict[str, float] = {}
+        results: List[list] = []
+        for name, func in funcs.items():
+            timings[name] = float('inf')
+            for _ in range(opts.repeat):
+                start: float = time.perf_counter()
+                result: list = func()
+                timings[name] = min(timings[name], time.perf_counter() - start)
+            results.append(result)
+        if results[0] != results[1]:
+            raise AssertionError('The extracted dependencies differ')
+
+        print(f'{deps:>6} dependencies: ' + '   '.join(
+            f'{name} {seconds * 1e3:10.1f} ms' for name, seconds in timings.items()) +
+              f'   speedup {timings["find_all loops"] / timings["get_dependencies"]:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark the raise/catch throughput of the custom exceptions.
+
+Raises and catches exceptions at a given stack depth (as in a batch loop
+over many files, nested in the build tool), comparing:
+
+- the built-in `ValueError`, as a reference;
+- `JMException`, which only captures the raw frames on creation;
+- an eager variant, extracting the stack traces on creation as
+  `JMException` used to (``traceback.extract_stack()``, which also reads
+  the source lines through `linecache`);
+- `JMException` with its `traces` accessed after being caught.
+
+Usage::
+
+    $ python benchmarks/bench_exception.py [--iterations N] [--depth N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import argparse
+import traceback
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jmbuilder.exception import JMException  # pylint: disable=wrong-import-position
+
+
+class EagerJMException(JMException):
+    """A `JMException` extracting the stack traces on creation, as it used to."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.eager_traces: traceback.StackSummary = traceback.extract_stack()
+
+
+def _at_depth(depth: int, func: Callable[[], None]) -> None:
+    """Call the function with the given number of additional frames on the stack."""
+    if depth > 0:
+        _at_depth(depth - 1, func)
+    else:
+        func()
+
+
+def _throughput(exc_class: type, iterations: int, depth: int, access: bool = False) -> float:
+    """Return the number of raised and caught exceptions per second."""
+    def loop() -> None:
+        for idx in range(iterations):
+            try:
+                raise exc_class('Invalid file: %d', idx)
+            except exc_class as exc:
+                if access:
+                    _ = exc.traces
+
+    start: float = time.perf_counter()
+    _at_depth(depth, loop)
+    return iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--depth', type=int, default=20)
+    opts = parser.parse_args()
+
+    lazy: float = _throughput(JMException, opts.iterations, opts.depth)
+    eager: float = _throughput(EagerJMException, opts.iterations, opts.depth)
+    for name, rate in (
+            ('ValueError', _throughput(ValueError, opts.iterations, opts.depth)),
+            ('JMException (lazy)', lazy),
+            ('JMException (eager)', eager),
+            ('lazy + traces access', _throughput(JMException, opts.iterations,
+                                                 opts.depth, access=True))):
+        print(f'{name:<22} {rate:12,.0f} raise/catch per second')
+    print(f'speedup (lazy vs eager) {lazy / eager:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the logging overhead per record.
+
+Logs the same records to a file through:
+
+- a synchronous ``FileHandler`` attached to the logger, as `init_logger`
+  used to do (once, and after being called three times, which used to add
+  three handlers and write every record three times);
+- `init_logger`, which passes the records through a queue to a background
+  thread. Both the time spent by the logging thread and the total time until
+  all records are written (``stop_logger``) are reported.
+
+Usage::
+
+    $ python benchmarks/bench_logger.py [--records N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.utils.logger import CUSTOM_FORMAT, init_logger, stop_logger
+
+
+def _sync_logger(name: str, filename: str, handlers: int) -> logging.Logger:
+    """Create a logger writing synchronously through the given number of file handlers."""
+    logger: logging.Logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    for _ in range(handlers):
+        handler: logging.Handler = logging.FileHandler(filename)
+        handler.setFormatter(logging.Formatter(CUSTOM_FORMAT))
+        logger.addHandler(handler)
+    return logger
+
+
+def _log_records(logger: logging.Logger, records: int) -> float:
+    """Log the records and return the elapsed time in seconds."""
+    start: float = time.perf_counter()
+    for idx in range(records):
+        logger.info('Rendered %s (%d placeholders)', 'MANIFEST.MF', idx)
+    return time.perf_counter() - start
+
+
+def _report(name: str, elapsed: float, records: int, total: float = None) -> None:
+    """Print the time per record."""
+    line: str = f'{name:<22} {elapsed * 1e6 / records:8.2f} us/record (logging thread)'
+    if total is not None:
+        line += f'   {total * 1e6 / records:8.2f} us/record (until written)'
+    print(line)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=50000)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for handlers in (1, 3):
+            logger: logging.Logger = _sync_logger(
+                f'sync-{handlers}', os.path.join(tmpdir, f'sync-{handlers}.log'), handlers)
+            elapsed: float = _log_records(logger, opts.records)
+            for handler in logger.handlers:
+                handler.close()
+            _report(f'sync, {handlers} handler(s)', elapsed, opts.records)
+
+        filename: str = os.path.join(tmpdir, 'queued.log')
+        for _ in range(3):
+            logger = init_logger(filename)  # Idempotent, still a single handler
+        logger.propagate = False
+
+        start: float = time.perf_counter()
+        elapsed = _log_records(logger, opts.records)
+        stop_logger(logger)
+        _report('queued (init_logger)', elapsed, opts.records, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+"""Microbenchmark suite for the parsing and rendering hot paths.
+
+Generates synthetic POM, properties and manifest files of the requested
+sizes (from 1 KB up to tens of MB), then times:
+
+- ``PomParser.parse`` and every ``PomParser.get*`` method,
+- ``JMProperties`` construction,
+- ``remove_comments`` and ``remove_blanks``,
+- ``JMRepairer.fix_manifest`` and ``JMRepairer.fix_properties``.
+
+The results are written as JSON, and can be compared against a previously
+saved baseline, failing (exit code 1) if any benchmark is slower than the
+baseline by more than the given threshold. Only the standard library is
+required besides the `JMBuilder` dependencies.
+
+Usage::
+
+    # Save a baseline
+    $ python benchmarks/bench_micro.py --output baseline.json
+
+    # Compare against the baseline, allowing up to 15% slowdown
+    $ python benchmarks/bench_micro.py --baseline baseline.json --threshold 0.15
+
+    # Select the sizes and the benchmarks (substring match)
+    $ python benchmarks/bench_micro.py --sizes 1K,1M,32M --filter parse
+
+The progress and the comparison are printed to the standard error, so the
+standard output only holds the JSON results if no output file is given.
+Only the inputs used by the selected benchmarks are generated.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import statistics
+import tempfile
+from functools import partial
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder._globals import VERSION
+from jmbuilder.core import JMRepairer, PomParser
+from jmbuilder.utils.utils import JMProperties, readfile, remove_blanks, remove_comments
+
+
+DEFAULT_SIZES: str = '1K,64K,1M,16M'
+
+_UNITS: Dict[str, int] = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+_POM_HEAD: str = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <!-- Synthetic POM generated by bench_micro.py -->
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>com.example</groupId>
+  <artifactId>example</artifactId>
+  <version>1.2.3</version>
+  <name>Example</name>
+  <url>https://example.com</url>
+  <inceptionYear>2023</inceptionYear>
+  <developers>
+    <developer><id>dev</id><name>Developer</name><url>https://example.com/dev</url></developer>
+  </developers>
+  <licenses>
+    <license><name>MIT License</name><url>https://opensource.org/licenses/MIT</url>
+      <distribution>repo</distribution></license>
+  </licenses>
+  <properties>
+    <package.mainClass>com.example.Main</package.mainClass>
+    <package.licenseFile>LICENSE</package.licenseFile>
+'''
+
+_POM_DEPENDENCY: str = '''\
+    <dependency>
+      <groupId>com.example.group{0}</groupId>
+      <artifactId>artifact-{0}</artifactId>
+      <version>{0}.0.0</version>
+      <!-- dependency {0} -->
+    </dependency>
+'''
+
+
+def parse_size(size: str) -> int:
+    """Convert a human readable size (e.g., '64K', '16M') into bytes."""
+    size = size.strip().upper()
+    if size[-1] in _UNITS:
+        return int(float(size[:-1]) * _UNITS[size[-1]])
+    return int(size)
+
+
+def _fill(head: str, tail: str, line: Callable[[int], str], size: int) -> str:
+    """Repeat the generated lines between head and tail until the size is reached."""
+    parts: List[str] = [head]
+    total: int = len(head) + len(tail)
+    idx: int = 0
+    while total < size:
+        text: str = line(idx)
+        parts.append(text)
+        total += len(text)
+        idx += 1
+    parts.append(tail)
+    return ''.join(parts)
+
+
+def generate_pom(size: int) -> str:
+    """Generate a synthetic POM of approximately the given size."""
+    head: str = _POM_HEAD + '    <project.build.sourceEncoding>UTF-8' + \
+        '</project.build.sourceEncoding>\n  </properties>\n  <dependencies>\n'
+    return _fill(head, '  </dependencies>\n</project>\n', _POM_DEPENDENCY.format, size)
+
+
+def generate_properties(size: int) -> str:
+    """Generate a synthetic properties file of approximately the given size."""
+    def line(idx: int) -> str:
+        if idx % 10 == 0:
+            return f'# Comment line {idx}\n\n'
+        return f'key.{idx} = ${{project.version}}\n' if idx % 2 else f'key.{idx} = value {idx}\n'
+    return _fill('', '', line, size)
+
+
+def generate_manifest(size: int) -> str:
+    """Generate a synthetic manifest file of approximately the given size."""
+    def line(idx: int) -> str:
+        return f'Key-{idx}: ${{project.version}}\n' if idx % 2 else f'Key-{idx}: value {idx}\n'
+    return _fill('Manifest-Version: 1.0\nID: ${project.id}\n', '', line, size)
+
+
+_GENERATORS: Dict[str, Callable[[int], str]] = {
+    'pom.xml': generate_pom,
+    'app.properties': generate_properties,
+    'MANIFEST.MF': generate_manifest
+}
+
+
+def measure(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Time the function and return the statistics of seconds per call."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times: List[float] = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'median': statistics.median(times),
+        'min': min(times),
+        'max': max(times),
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def collect(tmpdir: str, size: int,
+            name_filter: str = '') -> List[Tuple[str, Callable[[], object]]]:
+    """
+    Return the benchmarks whose name contains the filter, generating (and
+    parsing) only the inputs of the given size that they use.
+    """
+    inputs: Dict[str, Any] = {}
+
+    def generated(name: str) -> str:
+        if name not in inputs:
+            inputs[name] = os.path.join(tmpdir, f'{size}-{name}')
+            with open(inputs[name], 'w', encoding='utf-8') as file:
+                file.write(_GENERATORS[name](size))
+        return inputs[name]
+
+    def pom() -> PomParser:
+        if 'pom' not in inputs:
+            inputs['pom'] = PomParser.parse(generated('pom.xml'))
+        return inputs['pom']
+
+    def repairer() -> JMRepairer:
+        if 'repairer' not in inputs:
+            inputs['repairer'] = JMRepairer(pom())
+        return inputs['repairer']
+
+    def lines() -> List[str]:
+        if 'lines' not in inputs:
+            inputs['lines'] = [line.strip() for line in readfile(generated('app.properties'))]
+        return inputs['lines']
+
+    outdir: str = os.path.join(tmpdir, 'out')
+    # The benchmarks by their names, with the setup returning the timed function
+    setups: List[Tuple[str, Callable[[], Callable[[], object]]]] = [
+        ('PomParser.parse', lambda: partial(PomParser.parse, generated('pom.xml'))),
+        ('PomParser.get', lambda: partial(pom().get, 'project.developers.developer.name')),
+        ('PomParser.get_name', lambda: pom().get_name),
+        ('PomParser.get_version', lambda: pom().get_version),
+        ('PomParser.get_id', lambda: pom().get_id),
+        ('PomParser.get_url', lambda: pom().get_url),
+        ('PomParser.get_inception_year', lambda: pom().get_inception_year),
+        ('PomParser.get_author', lambda: pom().get_author),
+        ('PomParser.get_license', lambda: pom().get_license),
+        ('PomParser.get_property',
+         lambda: partial(pom().get_property, 'package.mainClass', dot=False)),
+        ('JMRepairer.__init__', lambda: partial(JMRepairer, pom())),
+        ('JMProperties', lambda: partial(JMProperties, generated('app.properties'))),
+        ('remove_comments', lambda: partial(remove_comments, lines())),
+        ('remove_blanks', lambda: partial(remove_blanks, lines())),
+        ('JMRepairer.fix_manifest', lambda: partial(
+            repairer().fix_manifest, generated('MANIFEST.MF'),
+            os.path.join(outdir, 'MANIFEST.MF'))),
+        ('JMRepairer.fix_properties', lambda: partial(
+            repairer().fix_properties, generated('app.properties'),
+            os.path.join(outdir, 'app.properties')))
+    ]
+    return [(name, setup()) for name, setup in setups if name_filter in name]
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict],
+            threshold: float) -> List[str]:
+    """Return the descriptions of benchmarks that regressed against the baseline."""
+    regressions: List[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio: float = result['median'] / baseline[name]['median']
+        marker: str = ''
+        if ratio > 1 + threshold:
+            marker = '  <-- REGRESSION'
+            regressions.append(f'{name}: {ratio:.2f}x slower')
+        print(f'{name:<45} {ratio:6.2f}x{marker}', file=sys.stderr)
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f'comma-separated input sizes (default: {DEFAULT_SIZES})')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of timed repeats per benchmark (default: 5)')
+    parser.add_argument('--filter', default='',
+                        help='run only the benchmarks whose name contains this string')
+    parser.add_argument('--output', help='write the JSON results to this file')
+    parser.add_argument('--baseline', help='compare against this JSON results file')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='allowed slowdown against the baseline (default: 0.10)')
+    opts = parser.parse_args()
+
+    results: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size_name in opts.sizes.split(','):
+            size: int = parse_size(size_name)
+            for name, func in collect(tmpdir, size, opts.filter):
+                key: str = f'{name}[{size_name.strip().upper()}]'
+                results[key] = measure(func, opts.repeat)
+                # The progress is kept apart from the JSON results
+                print(f'{key:<45} {results[key]["median"] * 1e6:14.2f} us',
+                      file=sys.stderr, flush=True)
+
+    report: dict = {
+        'meta': {
+            'jmbuilder': VERSION,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        },
+        'results': results
+    }
+
+    if opts.output:
+        with open(opts.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if opts.baseline:
+        with open(opts.baseline, 'r', encoding='utf-8') as file:
+            baseline: dict = json.load(file)['results']
+        regressions: List[str] = compare(results, baseline, opts.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s) above {opts.threshold:.0%}:',
+                  *regressions, sep='\n  ', file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Benchmark the memory retained for each POM, as parsed or as its model.
+
+Parses a number of synthetic POM files and keeps, for each of them, either:
+
+- the `PomParser`, keeping the whole `BeautifulSoup` document alive (as the
+  repairers and the daemon's cache used to);
+- only its `PomModel` (``PomParser.to_model()``), releasing the document.
+
+The memory still allocated afterwards (measured with `tracemalloc`) is
+reported per POM, along with the time to extract the model.
+
+Usage::
+
+    $ python benchmarks/bench_model.py [--poms N] [--size 64K]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import gc
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.core import PomModel, PomParser
+from bench_micro import generate_pom, parse_size
+
+
+def retained(paths: List[str], load: Callable[[str], object]) -> int:
+    """Load every POM file and return the bytes retained by the loaded objects."""
+    gc.collect()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    loaded: List[object] = [load(path) for path in paths]
+    gc.collect()  # The documents have reference cycles
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded
+    return after - before
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--poms', type=int, default=50)
+    parser.add_argument('--size', default='64K', help='approximate size of each POM')
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path: str = os.path.join(tmpdir, 'pom.xml')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(generate_pom(parse_size(opts.size)))
+        paths: List[str] = [path] * opts.poms
+
+        pom: PomParser = PomParser.parse(path)
+        start: float = time.perf_counter()
+        model: PomModel = pom.to_model()
+        print(f'{len(model.dependencies)} dependencies per POM ({opts.size}), '
+              f'to_model: {(time.perf_counter() - start) * 1e3:.1f} ms per POM')
+        del pom, model
+
+        parsers: int = retained(paths, PomParser.parse)
+        models: int = retained(paths, lambda path: PomParser.parse(path).to_model())
+        print(f"{'PomParser (document)':<22} {parsers / opts.poms / 1024:10.1f} KiB per POM")
+        print(f"{'PomModel':<22} {models / opts.poms / 1024:10.1f} KiB per POM"
+              f'   ({parsers / max(models, 1):.0f}x less)')
+
+
+if __name__ == '__main__':
+    main()
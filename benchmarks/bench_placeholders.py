@@ -0,0 +1,126 @@
+"""Benchmark evaluating the plug-in placeholders of a multi-module build.
+
+Generates a Git repository with a number of modules, each rendering a
+build-info template that references several ``git.*`` placeholders (each
+costing a subprocess), then measures:
+
+- evaluating every known ``git.*`` key eagerly for each module, one after
+  another, as a resolver without laziness nor memoization would;
+- evaluating only the referenced keys for each module, one after another;
+- rendering the modules in a single run (`jmbuilder.placeholders.Placeholders`
+  shared by the repairers), the referenced keys evaluated concurrently and once;
+- rendering a template without any plug-in placeholder, which runs nothing.
+
+Usage::
+
+    $ python benchmarks/bench_placeholders.py [--modules N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder import placeholders as jmplaceholders
+from jmbuilder.core import JMRepairer
+
+POM: str = '''<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>{name}</artifactId>
+  <version>1.2.3</version>
+</project>
+'''
+
+TEMPLATE: str = '''\
+class BuildInfo {
+    static final String VERSION = "${project.version}";
+    static final String COMMIT = "${git.commit}", SHORT = "${git.commit.short}";
+    static final String BRANCH = "${git.branch}", DESCRIBE = "${git.describe}";
+    static final boolean DIRTY = ${git.dirty};
+}
+'''
+
+KEYS: Tuple[str, ...] = ('git.commit', 'git.commit.short', 'git.branch', 'git.describe',
+                         'git.dirty')
+ALL_KEYS: Tuple[str, ...] = KEYS + ('git.tag', 'java.version', 'java.vendor')
+
+
+def _git(cwd: str, *args: str) -> None:
+    subprocess.run(['git', '-c', 'user.name=bench', '-c', 'user.email=bench@example.com',
+                    '-c', 'commit.gpgsign=false', *args], cwd=cwd, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _measure(func: Callable[[], int]) -> Tuple[float, int]:
+    """Return the elapsed seconds and the number of evaluated keys."""
+    start: float = time.perf_counter()
+    evaluated: int = func()
+    return time.perf_counter() - start, evaluated
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modules', type=int, default=10, help='the number of modules')
+    opts = parser.parse_args()
+    if not shutil.which('git'):
+        sys.exit('Git is required to run this benchmark')
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _git(tmpdir, 'init', '-q')
+        modules: List[str] = []
+        for idx in range(opts.modules):
+            module: str = os.path.join(tmpdir, f'module-{idx}')
+            os.makedirs(module)
+            with open(os.path.join(module, 'pom.xml'), 'w', encoding='utf-8') as file:
+                file.write(POM.format(name=f'module-{idx}'))
+            modules.append(module)
+        _git(tmpdir, 'add', '.')
+        _git(tmpdir, 'commit', '-q', '-m', 'init')
+        _git(tmpdir, 'tag', 'v1.2.3')
+
+        def eager() -> int:
+            for module in modules:
+                placeholders = jmplaceholders.Placeholders(workers=1)
+                for key in ALL_KEYS:
+                    placeholders.get(key, module)
+            return len(modules) * len(ALL_KEYS)
+
+        def lazy() -> int:
+            for module in modules:
+                placeholders = jmplaceholders.Placeholders(workers=1)
+                JMRepairer(os.path.join(module, 'pom.xml'),
+                           placeholders=placeholders).render_text(TEMPLATE)
+            return len(modules) * len(KEYS)
+
+        def single_run(template: str) -> Callable[[], int]:
+            def run() -> int:
+                placeholders = jmplaceholders.Placeholders()
+                for module in modules:
+                    JMRepairer(os.path.join(module, 'pom.xml'),
+                               placeholders=placeholders).render_text(template)
+                return len(placeholders)
+            return run
+
+        print(f'{opts.modules} modules, {len(KEYS)} git.* keys per template')
+        for label, func in (
+                ('eager, sequential', eager),
+                ('lazy, sequential', lazy),
+                ('lazy, concurrent (a run)', single_run(TEMPLATE)),
+                ('no plug-in placeholder', single_run('${project.version}\n'))):
+            elapsed, evaluated = _measure(func)
+            print(f'{label:<26} {elapsed * 1e3:10.1f} ms {evaluated:6d} keys evaluated')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark repeated path queries against many POM files.
+
+Parses a number of synthetic POM files, then runs the same set of queries
+(those used to index a POM by `JMRepairer`) against every POM through:
+
+- the former ``PomParser.get``, splitting the key on every call and chaining
+  recursive ``find`` calls;
+- ``PomParser.get`` with the compiled queries, cached by their strings;
+- the same queries compiled again on every call (``Query(key)``), to show
+  the share of the compilation;
+- ``PomParser.get_all`` with wildcard queries, returning every match.
+
+Usage::
+
+    $ python benchmarks/bench_query.py [--poms N] [--size 16K] [--repeat N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import argparse
+from typing import Callable, List, Optional, Union
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.core import PomParser, Query, _import_bs4
+from bench_micro import generate_pom, parse_size
+
+
+QUERIES: List[Union[str, List[str]]] = [
+    'project.name', 'project.version', 'project.url', 'project.groupId',
+    'project.artifactId', 'project.inceptionYear',
+    'project.developers.developer.id', 'project.developers.developer.name',
+    'project.developers.developer.url', 'project.licenses.license.name',
+    'project.licenses.license.url', 'project.licenses.license.distribution',
+    ['properties', 'package.mainClass']
+]
+
+WILDCARD_QUERIES: List[str] = [
+    'project.developers.developer[*].*', 'project.licenses.license[-1].name',
+    'project.dependencies.dependency[*].version'
+]
+
+
+def legacy_get(pom: PomParser, key: Union[str, List[str]]) -> Optional['bs4.element.Tag']:
+    """Find the element as the former ``PomParser.get`` did."""
+    keys: List[str] = key.split('.') if isinstance(key, str) else key
+    result = pom.soup.find(keys[0])
+    for k in keys[1:]:
+        if not result:
+            break
+        result = result.find(k)
+    return result
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    """Return the best time of the function, in seconds."""
+    best: float = float('inf')
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--poms', type=int, default=200)
+    parser.add_argument('--size', default='16K', help='approximate size of each POM')
+    parser.add_argument('--repeat', type=int, default=5)
+    opts = parser.parse_args()
+
+    bs4 = _import_bs4()
+    poms: List[PomParser] = [
+        PomParser(bs4.BeautifulSoup(generate_pom(parse_size(opts.size)), 'xml'))
+        for _ in range(opts.poms)
+    ]
+    lookups: int = len(poms) * len(QUERIES)
+
+    for name, func in (
+            ('former get (split + find)',
+             lambda: [legacy_get(pom, key) for pom in poms for key in QUERIES]),
+            ('get (compiled, cached)',
+             lambda: [pom.get(key) for pom in poms for key in QUERIES]),
+            ('get (compiled every call)',
+             lambda: [next(Query(key if isinstance(key, str) else tuple(key)).select(pom.soup),
+                           None) for pom in poms for key in QUERIES])):
+        print(f'{name:<28} {_time(func, opts.repeat) * 1e6 / lookups:8.2f} us/query')
+
+    matches: int = sum(len(pom.get_all(key)) for pom in poms for key in WILDCARD_QUERIES)
+    elapsed: float = _time(
+        lambda: [pom.get_all(key) for pom in poms for key in WILDCARD_QUERIES], opts.repeat)
+    print(f"{'get_all (wildcards)':<28} {elapsed * 1e6 / matches:8.2f} us/match "
+          f'({matches // len(poms)} matches per POM)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark rendering a large text file with the POM values.
+
+Generates a stand-in POM and a large text file (e.g., a generated source or
+documentation), with a placeholder every few lines, some of them escaped or
+unknown, then measures:
+
+- rendering the whole file in memory (`JMRepairer.render_text`) and writing it,
+  as a non-streaming implementation would;
+- streaming the file into its output (`JMRepairer.render_file`);
+- streaming it again, with the output already up to date (nothing written).
+
+The time of each, and its peak of traced memory in a separate run, are printed.
+
+Usage::
+
+    $ python benchmarks/bench_render.py [--size MB]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.core import JMRepairer
+
+POM: str = '''<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>example</artifactId>
+  <version>1.2.3</version>
+  <name>Example</name>
+</project>
+'''
+
+LINES: Tuple[str, ...] = (
+    '    // Generated from ${project.groupId}:${project.artifactId}, do not edit.\n',
+    '    public static final String VERSION = "${project.version}";\n',
+    '    public static final String TEMPLATE = "\\${project.version}";\n',
+    '    private static final String UNKNOWN = "${unknown.key}"; // $5 per unit\n',
+    '    private int counter = 0;  /* plain text without any placeholder */\n'
+)
+
+
+def generate(path: str, size: int) -> None:
+    """Generate the text file of about the given size in bytes."""
+    block: str = ''.join(LINES) * 64
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        for _ in range(max(1, size // len(block))):
+            file.write(block)
+
+
+def _measure(func: Callable[[], object]) -> Tuple[float, int]:
+    start: float = time.perf_counter()
+    func()
+    elapsed: float = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=64, help='the size of the file in MB')
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pom: str = os.path.join(tmpdir, 'pom.xml')
+        with open(pom, 'w', encoding='utf-8') as file:
+            file.write(POM)
+        infile: str = os.path.join(tmpdir, 'BuildInfo.java.in')
+        generate(infile, opts.size * 1024 * 1024)
+        size: int = os.stat(infile).st_size
+        repairer: JMRepairer = JMRepairer(pom)
+
+        def in_memory() -> None:
+            with open(infile, 'rb') as i_file:
+                data: bytes = repairer.render_text(i_file)
+            with open(os.path.join(tmpdir, 'in-memory.java'), 'wb') as o_file:
+                o_file.write(data)
+
+        def streamed(name: str) -> Callable[[], object]:
+            return lambda: repairer.render_file(infile, os.path.join(tmpdir, name))
+
+        print(f'{size / 2 ** 20:.1f} MB')
+        streamed('up-to-date.java')()  # Write the output first
+        for label, func in (('in memory, then written', in_memory),
+                            ('render_file (streamed)', streamed('streamed.java')),
+                            ('render_file, up to date', streamed('up-to-date.java'))):
+            elapsed, peak = _measure(func)
+            print(f'{label:<26} {elapsed * 1e3:10.1f} ms {size / 2 ** 20 / elapsed:8.1f} MB/s'
+                  f'   peak {peak / 2 ** 20:8.1f} MB')
+
+        with open(os.path.join(tmpdir, 'in-memory.java'), 'rb') as first, \
+                open(os.path.join(tmpdir, 'streamed.java'), 'rb') as second:
+            if first.read() != second.read():
+                raise AssertionError('The rendered files differ')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark indexing a large local Maven repository.
+
+Generates a stand-in repository (``<group>/<artifact>/<version>/`` with a POM
+and a JAR in each version directory), then measures:
+
+- a sequential ``os.walk`` finding every POM, as a naive indexing would;
+- the first walk of `LocalRepository`, with one thread and with a pool;
+- a refresh by a new instance loading the persisted index, with nothing
+  changed (only the status of each directory is checked);
+- the refresh after installing a new version, reading only the changed
+  directories.
+
+Usage::
+
+    $ python benchmarks/bench_repository.py [--artifacts N] [--versions N] [--workers N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.repository import LocalRepository
+
+
+def install(root: str, group_id: str, artifact_id: str, version: str) -> None:
+    """Install an empty artifact version into the repository."""
+    versiondir: str = os.path.join(root, *group_id.split('.'), artifact_id, version)
+    os.makedirs(versiondir, exist_ok=True)
+    for ext in ('pom', 'jar'):
+        with open(os.path.join(versiondir, f'{artifact_id}-{version}.{ext}'), 'wb'):
+            pass
+
+
+def generate(root: str, artifacts: int, versions: int) -> None:
+    """Generate the repository, with 50 artifacts per group."""
+    for idx in range(artifacts):
+        for version in range(versions):
+            install(root, f'com.example.g{idx // 50}', f'a{idx}', f'1.{version}')
+    # Leave no directory as recent as the walk, they would be read on every refresh
+    past: float = time.time() - 60
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def naive_walk(root: str) -> int:
+    """Find the POM of every version with ``os.walk``."""
+    found: int = 0
+    for dirpath, _, filenames in os.walk(root):
+        parts: Tuple[str, ...] = tuple(os.path.relpath(dirpath, root).split(os.sep))
+        if len(parts) >= 3 and f'{parts[-2]}-{parts[-1]}.pom' in filenames:
+            found += 1
+    return found
+
+
+def _time(func: Callable[[], object]) -> Tuple[float, object]:
+    start: float = time.perf_counter()
+    result: object = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--artifacts', type=int, default=20000)
+    parser.add_argument('--versions', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=8)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root: str = os.path.join(tmpdir, 'repository')
+        generate(root, opts.artifacts, opts.versions)
+
+        def repository(name: str, workers: int) -> LocalRepository:
+            return LocalRepository(root, index_file=os.path.join(tmpdir, name), workers=workers)
+
+        elapsed, found = _time(lambda: naive_walk(root))
+        print(f'{found} versions')
+        print(f"{'os.walk (sequential)':<28} {elapsed * 1e3:10.1f} ms")
+        for workers in (1, opts.workers):
+            elapsed, scanned = _time(repository(f'index-{workers}.json', workers).refresh)
+            print(f"{f'first walk ({workers} threads)':<28} {elapsed * 1e3:10.1f} ms"
+                  f'   ({scanned} directories read)')
+
+        repo: LocalRepository = repository(f'index-{opts.workers}.json', opts.workers)
+        elapsed, scanned = _time(repo.refresh)
+        print(f"{'refresh, unchanged (cache)':<28} {elapsed * 1e3:10.1f} ms"
+              f'   ({scanned} directories read)')
+
+        install(root, 'com.example.g0', 'a0', '9.9')
+        elapsed, scanned = _time(repo.refresh)
+        print(f"{'refresh, one new version':<28} {elapsed * 1e3:10.1f} ms"
+              f'   ({scanned} directories read)')
+        if len(repo) != found + 1:
+            raise AssertionError('The indexed versions differ')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark the offline resolution of large transitive dependency graphs.
+
+Generates a stand-in local repository holding a random acyclic graph of
+artifacts (each depending on a few of the next 49 artifacts, in either of
+their two versions to be mediated), then resolves the whole graph from a project
+depending on the first artifacts:
+
+- cold, loading each POM with a single thread and with a pool;
+- warm, with the POMs already loaded (memoized) by the resolver.
+
+Usage::
+
+    $ python benchmarks/bench_resolver.py [--nodes 2000] [--fanout 4] [--workers 8]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.repository import LocalRepository
+from jmbuilder.resolver import Resolver
+
+
+def _pom(artifact_id: str, version: str, deps: List[str]) -> str:
+    return ''.join([
+        '<?xml version="1.0" encoding="UTF-8"?><project><groupId>com.example</groupId>',
+        f'<artifactId>{artifact_id}</artifactId><version>{version}</version><dependencies>',
+        *(f'<dependency><groupId>com.example</groupId><artifactId>{dep.split(":")[0]}'
+          f'</artifactId><version>{dep.split(":")[1]}</version></dependency>' for dep in deps),
+        '</dependencies></project>'
+    ])
+
+
+def generate(root: str, nodes: int, fanout: int) -> str:
+    """Generate the repository and the project, return the path to the project POM."""
+    rng: random.Random = random.Random(42)
+    for idx in range(nodes):
+        deps: List[str] = [
+            f'a{dep}:{rng.choice(("1.0", "1.1"))}'
+            for dep in sorted(rng.sample(range(idx + 1, min(idx + 50, nodes)),
+                                         min(fanout, nodes - idx - 1, 49)))
+        ]
+        for version in ('1.0', '1.1'):
+            versiondir: str = os.path.join(root, 'com', 'example', f'a{idx}', version)
+            os.makedirs(versiondir)
+            with open(os.path.join(versiondir, f'a{idx}-{version}.pom'), 'w',
+                      encoding='utf-8') as file:
+                file.write(_pom(f'a{idx}', version, deps))
+
+    project: str = os.path.join(os.path.dirname(root), 'project', 'pom.xml')
+    os.makedirs(os.path.dirname(project))
+    with open(project, 'w', encoding='utf-8') as file:
+        file.write(_pom('project', '1.0', [f'a{idx}:1.0' for idx in range(min(fanout, nodes))]))
+    return project
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--nodes', type=int, default=2000)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=8)
+    opts = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project: str = generate(os.path.join(tmpdir, 'repository'), opts.nodes, opts.fanout)
+        repository: LocalRepository = LocalRepository(os.path.join(tmpdir, 'repository'),
+                                                      index_file='')
+        repository.refresh()
+
+        for workers in (1, opts.workers):
+            resolver: Resolver = Resolver(repository, workers=workers)
+            start: float = time.perf_counter()
+            resolution = resolver.resolve(project)
+            cold: float = time.perf_counter() - start
+            start = time.perf_counter()
+            resolver.resolve(project)
+            warm: float = time.perf_counter() - start
+            print(f'{len(resolution)} nodes ({len(resolution.omitted)} omitted), '
+                  f'{workers} threads: cold {cold * 1e3:8.1f} ms   warm {warm * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark sorting a large list of Maven versions.
+
+Generates random versions (numbers, qualifiers such as ``-rc2`` or
+``-SNAPSHOT``, and service packs), then measures sorting them:
+
+- with a comparator parsing both versions on every comparison, as a naive
+  port of Maven's ``ComparableVersion.compareTo`` would;
+- with `version_key` on a cold cache, each version parsed once;
+- with `version_key` on a warm cache, e.g. the index of the local repository
+  sorting the versions again after a refresh.
+
+Usage::
+
+    $ python benchmarks/bench_versions.py [--versions N] [--seed N]
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import functools
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jmbuilder.versions import version_key
+
+QUALIFIERS: Tuple[str, ...] = ('', '', '', '-SNAPSHOT', '-alpha{}', '-beta-{}', '-M{}', '-RC{}',
+                               '.Final', '-sp{}', '-jre', '.v{}')
+
+
+def generate(count: int, seed: int) -> List[str]:
+    """Generate random versions, with some duplicates as in real version lists."""
+    rng: random.Random = random.Random(seed)
+    versions: List[str] = []
+    for _ in range(count):
+        numbers: str = '.'.join(str(rng.randrange(30)) for _ in range(rng.randint(1, 4)))
+        versions.append(numbers + rng.choice(QUALIFIERS).format(rng.randrange(1, 20)))
+    return versions
+
+
+def _time(func: Callable[[], object]) -> Tuple[float, object]:
+    start: float = time.perf_counter()
+    result: object = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--versions', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    opts = parser.parse_args()
+
+    versions: List[str] = generate(opts.versions, opts.seed)
+    parse: Callable[[str], tuple] = version_key.__wrapped__
+
+    def compare(first: str, second: str) -> int:
+        first_key, second_key = parse(first), parse(second)
+        return (first_key > second_key) - (first_key < second_key)
+
+    print(f'{len(versions)} versions ({len(set(versions))} distinct)')
+    naive, expected = _time(lambda: sorted(versions, key=functools.cmp_to_key(compare)))
+    print(f"{'parse on each comparison':<28} {naive * 1e3:10.1f} ms")
+
+    version_key.cache_clear()
+    cold, result = _time(lambda: sorted(versions, key=version_key))
+    print(f"{'version_key, cold cache':<28} {cold * 1e3:10.1f} ms   ({naive / cold:.1f}x)")
+    warm, result = _time(lambda: sorted(versions, key=version_key))
+    print(f"{'version_key, warm cache':<28} {warm * 1e3:10.1f} ms   ({naive / warm:.1f}x)")
+    if result != expected:
+        raise AssertionError('The sorted versions differ')
+
+
+if __name__ == '__main__':
+    main()
@@ -77,22 +77,15 @@ TMPDIR
 
 """
 
+from importlib import import_module as _import_module
+
 # exception
 from . import exception
 from .exception import *
 
-# utils
-from . import utils
-from .utils import *
-
-# core
-from . import core
-from .core import *
-
 # _globals
 from . import _globals
 from ._globals import *
-from ._globals import AUTHOR, VERSION, VERSION_INFO
 
 
 __all__ = []
@@ -109,10 +102,56 @@ __all__.extend(['exception', 'utils', 'core'])
 #__all__.extend(utils.__all__)
 
 
-__author__       = AUTHOR
-__version__      = VERSION
-__version_info__ = VERSION_INFO
+# The `utils` and `core` subpackages are loaded lazily (PEP 562), so that
+# importing this package (e.g., ``python -m jmbuilder -V``) does not pay
+# the import cost of `bs4` and `lxml` until a POM file is actually parsed.
+_LAZY_SUBMODULES = ('utils', 'core')
+_LAZY_ATTRS = {
+    'logger': 'utils',
+    'init_logger': 'utils',
+    'json_parser': 'utils',
+    'remove_comments': 'utils',
+    'remove_blanks': 'utils',
+    'JMProperties': 'utils',
+    'PomParser': 'core',
+    'JMRepairer': 'core'
+}
+
+
+def __getattr__(name: str):
+    """
+    Lazily import the submodules and their members on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of attribute to be retrieved.
+
+    Returns
+    -------
+    Any :
+        The requested submodule or member.
+
+    Raises
+    ------
+    AttributeError :
+        If the given name is neither a lazy submodule nor a lazy member.
+
+    """
+    if name in _LAZY_SUBMODULES:
+        # Importing the submodule also binds it as an attribute of this package
+        return _import_module(f'.{name}', __name__)
+
+    if name in _LAZY_ATTRS:
+        value = getattr(_import_module(f'.{_LAZY_ATTRS[name]}', __name__), name)
+        globals()[name] = value  # Cache it, the next lookup will not reach here
+        return value
+
+    # The setup metadata (e.g., `__version__`) are loaded on first access as well
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
 
+def __dir__():
+    """Return the list of module attributes, including the lazy ones."""
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_ATTRS))
 
-# Delete no longer used imported objects
-del AUTHOR, VERSION, VERSION_INFO
@@ -0,0 +1,790 @@
+"""Command-Line Interface Module for `JMBuilder`
+
+This module provides the argument grammar and the job runner used by
+the main module (``python -m jmbuilder``). A single invocation can declare
+any number of manifest, properties and text jobs, for example::
+
+    $ python -m jmbuilder --fix-mf pom.xml MANIFEST.MF out/MANIFEST.MF \\
+    >                     --fix-prop pom.xml setup.properties \\
+    >                     --fix-prop other/pom.xml other.properties \\
+    >                     --render pom.xml BuildInfo.java.in src/BuildInfo.java
+
+The whole argument vector is parsed in a single pass, and each distinct
+POM file is parsed only once per invocation regardless how many jobs
+are sharing it.
+
+With ``--dry-run`` or ``--diff``, the outputs are rendered in memory and
+compared against the current output files without writing them, and the
+exit code tells whether any output is stale (see `EXIT_CHANGED`), e.g.
+to check the generated files in CI.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+Job
+    A named tuple representing a single job declared in the command-line.
+
+ParsedArgs
+    A named tuple representing the parsed command-line arguments.
+
+Available Functions
+-------------------
+main
+    Run the command-line interface with the given arguments.
+
+parse_args
+    Parse the command-line arguments in a single pass.
+
+print_changes
+    Print the changes of the outputs rendered in a dry run.
+
+print_help
+    Print the help message to the standard output.
+
+print_version
+    Print the version info to specific opened file.
+
+resolve_jobs
+    Return the given jobs with all of their paths made absolute.
+
+run_jobs
+    Run the given jobs, parsing each distinct POM file only once.
+
+write_metrics
+    Write the metrics collected by the given repairers as JSON.
+
+"""
+
+import os as _os
+import sys as _sys
+import json as _json
+import difflib as _difflib
+from typing import (
+    Any, Callable, ContextManager, Dict, List, NamedTuple, Optional, Sequence, Set, TextIO, Tuple,
+    Union
+)
+
+from . import exception as _jmexc
+from . import _globals
+
+
+__all__ = [
+    'Job', 'ParsedArgs', 'main', 'parse_args', 'print_changes',
+    'print_help', 'print_version', 'resolve_jobs', 'run_jobs', 'write_metrics'
+]
+
+# The exit code of a dry run (``--dry-run`` or ``--diff``) if any output would be
+# changed, distinct from the exit code of the errors (1)
+EXIT_CHANGED: int = 2
+
+
+# Maps the command-line options to their canonical names
+OPTIONS: Dict[str, str] = {
+    '-h': 'help',
+    '--help': 'help',
+    '-V': 'version',
+    '--version': 'version',
+    '-version': 'version_stderr',
+    '-VV': 'only_version',
+    '--only-ver': 'only_version',
+    '--only-version': 'only_version',
+    '--fix-mf': 'manifest',
+    '--fix-manifest': 'manifest',
+    '--fix-prop': 'properties',
+    '--fix-properties': 'properties',
+    '--render': 'text',
+    '--render-file': 'text',
+    '--watch': 'watch',
+    '--daemon': 'daemon',
+    '--socket': 'socket',
+    '--idle-timeout': 'idle_timeout',
+    '--profile': 'profile',
+    '--metrics-json': 'metrics_json',
+    '--trace': 'trace',
+    '--memprofile': 'memprofile',
+    '-P': 'profiles',
+    '--activate-profiles': 'profiles',
+    '-D': 'define',
+    '--define': 'define',
+    '--dry-run': 'dry_run',
+    '--diff': 'diff'
+}
+
+# Canonical names of options that require a value, either
+# as the next argument or separated by equals sign (`=`)
+VALUE_OPTIONS: Set[str] = {'socket', 'idle_timeout'}
+
+# Canonical names of options that can be repeated, their value may also be
+# attached to the short option (e.g., `-Pprofile` or `-Dkey=value`)
+REPEATED_OPTIONS: Set[str] = {'profiles', 'define'}
+
+# Canonical names of options that accept an optional value, only if
+# separated by equals sign (`=`), otherwise the value is an empty string
+OPTIONAL_VALUE_OPTIONS: Set[str] = {'profile', 'metrics_json', 'trace', 'memprofile', 'dry_run'}
+
+# Maps the canonical names of job options to the `JMRepairer` methods
+JOB_METHODS: Dict[str, str] = {
+    'manifest': 'fix_manifest',
+    'properties': 'fix_properties',
+    'text': 'render_file'
+}
+
+
+class Job(NamedTuple):
+    """
+    A single job declared in the command-line.
+
+    Attributes
+    ----------
+    kind : str
+        The kind of job, either ``'manifest'``, ``'properties'`` or ``'text'``.
+
+    pom : str
+        The path to the POM file.
+
+    infile : str
+        The path to the input file.
+
+    outfile : str
+        The path to the output file. Equals to `infile` if the output file
+        were not specified (i.e., overwrite the input file).
+
+    """
+    kind: str
+    pom: str
+    infile: str
+    outfile: str
+
+
+class ParsedArgs(NamedTuple):
+    """
+    The parsed command-line arguments.
+
+    Attributes
+    ----------
+    flags : Set[str]
+        The canonical names of specified flag options (e.g., ``'help'``).
+
+    jobs : List[Job]
+        The declared jobs, in the same order as in the command-line.
+
+    options : Dict[str, str]
+        The values of specified value options, keyed by their canonical names.
+
+    profiles : List[str]
+        The IDs of profiles to be activated (or deactivated), from ``-P``.
+
+    properties : Dict[str, str]
+        The user properties, from ``-D``.
+
+    """
+    flags: Set[str]
+    jobs: List[Job]
+    options: Dict[str, str]
+    profiles: List[str]
+    properties: Dict[str, str]
+
+
+def _usage_error(message: str, option: str) -> _jmexc.JMException:
+    """Return a new exception with the given message and the usage of `option`."""
+    return _jmexc.JMException(
+        f'{message}.{_os.linesep * 2}' +
+        f'USAGE: python -m {__package__} {option} <pom> <in> [out]')
+
+
+def parse_args(argv: Sequence[str]) -> ParsedArgs:
+    """
+    Parse the command-line arguments in a single pass.
+
+    Parameters
+    ----------
+    argv : sequence of str
+        The command-line arguments, without the program name.
+
+    Returns
+    -------
+    ParsedArgs :
+        The parsed command-line arguments.
+
+    Raises
+    ------
+    JMException :
+        If an unknown argument is detected, or if a job option is missing
+        its POM file or input file.
+
+    """
+    flags: Set[str] = set()
+    jobs: List[Job] = []
+    options: Dict[str, str] = {}
+    profiles: List[str] = []
+    properties: Dict[str, str] = {}
+
+    idx: int = 0
+    argc: int = len(argv)
+    while idx < argc:
+        arg, eq_sign, value = argv[idx].partition('=')
+        name: Optional[str] = OPTIONS.get(arg if arg.startswith('--') else argv[idx])
+        if name is None and not arg.startswith('--') and \
+                OPTIONS.get(argv[idx][:2]) in REPEATED_OPTIONS:
+            # The value attached to the short option, e.g., `-Dkey=value`
+            arg, eq_sign, value = argv[idx][:2], '=', argv[idx][2:]
+            name = OPTIONS[arg]
+        idx += 1
+
+        if name is None:
+            raise _jmexc.JMException(
+                f"Unknown argument detected: '{argv[idx - 1]}'{_os.linesep * 2}" +
+                'For more details, type argument `-h` or `--help`.')
+
+        if name in VALUE_OPTIONS:
+            if not eq_sign:
+                if idx >= argc:
+                    raise _jmexc.JMException(f'No value were specified for {arg!r}')
+                value = argv[idx]
+                idx += 1
+            options[name] = value
+            continue
+
+        if name in REPEATED_OPTIONS:
+            if not eq_sign:
+                if idx >= argc:
+                    raise _jmexc.JMException(f'No value were specified for {arg!r}')
+                value = argv[idx]
+                idx += 1
+            if name == 'profiles':
+                profiles.append(value)
+            else:
+                key, eq_sign, value = value.partition('=')
+                if not key:
+                    raise _jmexc.JMException(f'No property name were specified for {arg!r}')
+                properties[key] = value if eq_sign else 'true'  # As in Maven
+            continue
+
+        if name in OPTIONAL_VALUE_OPTIONS:
+            options[name] = value
+            continue
+
+        if eq_sign:
+            raise _jmexc.JMException(f'Option {arg!r} does not accept a value')
+
+        if name not in JOB_METHODS:
+            flags.add(name)
+            continue
+
+        # Collect the operands of job option, stop at the next option
+        operands: List[str] = []
+        while idx < argc and len(operands) < 3 and \
+                not (argv[idx].startswith('-') and len(argv[idx]) > 1):
+            operands.append(argv[idx])
+            idx += 1
+
+        if len(operands) < 1:
+            raise _usage_error('No POM file were specified', arg)
+        if len(operands) < 2:
+            raise _usage_error('No input file were specified', arg)
+
+        # Overwrite the input file if the output file were not specified
+        jobs.append(Job(name, operands[0], operands[1], operands[-1]))
+
+    return ParsedArgs(flags, jobs, options, profiles, properties)
+
+
+def resolve_jobs(jobs: Sequence[Job], cwd: Optional[str] = None) -> List[Job]:
+    """
+    Return the given jobs with all of their paths made absolute and normalized.
+
+    Parameters
+    ----------
+    jobs : sequence of Job
+        The jobs to be resolved.
+
+    cwd : str, optional
+        The directory to resolve the relative paths against.
+        Defaults to the current working directory.
+
+    Returns
+    -------
+    List[Job] :
+        A new list of jobs with absolute paths.
+
+    """
+    cwd = cwd or _os.getcwd()
+    return [
+        Job(job.kind, *(_os.path.normpath(_os.path.join(cwd, path))
+                        for path in (job.pom, job.infile, job.outfile)))
+        for job in jobs
+    ]
+
+
+def run_jobs(jobs: Sequence[Job], *, cwd: Optional[str] = None,
+             parse_pom: Optional[Callable[[str], Union['PomParser', 'PomModel']]] = None,
+             profiles: Sequence[str] = (), properties: Optional[Dict[str, str]] = None,
+             dry_run: bool = False,
+             on_output: Optional[Callable[[Job, 'OutputChange'], None]] = None
+             ) -> Dict[str, 'JMRepairer']:
+    """
+    Run the given jobs, parsing each distinct POM file only once.
+
+    The plug-in placeholders (e.g., ``${git.commit}``) are evaluated only
+    once for the whole run, see `jmbuilder.placeholders`.
+
+    Parameters
+    ----------
+    jobs : sequence of Job
+        The jobs to be run, in order.
+
+    cwd : str, optional
+        The directory to resolve the relative paths against.
+        Defaults to the current working directory.
+
+    parse_pom : callable, optional
+        A function that takes an absolute path to the POM file and returns
+        an instance of `PomParser` or `PomModel`. Defaults to ``PomParser.parse``.
+
+    profiles : sequence of str, optional
+        The IDs of profiles to be activated (or deactivated if prefixed
+        with ``!``), as given by ``-P``. See `jmbuilder.profiles`.
+
+    properties : Dict[str, str], optional
+        The user properties overriding the POM properties, as given by ``-D``.
+
+    dry_run : bool, optional
+        Whether to only render the outputs and compare them against the
+        current output files, without writing. Defaults to False.
+
+    on_output : callable, optional
+        A function called with each job (with absolute paths) and the
+        change of its output file, see ``JMRepairer.fix_manifest``.
+
+    Returns
+    -------
+    Dict[str, JMRepairer] :
+        The repairers used to run the jobs, keyed by the absolute path
+        to their POM file. See ``JMRepairer.stats``.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .core import JMRepairer, OutputChange
+    from .placeholders import Placeholders
+
+    placeholders: Placeholders = Placeholders()
+    repairers: Dict[str, JMRepairer] = {}
+    for job in resolve_jobs(jobs, cwd):
+        if job.pom not in repairers:
+            # Let the repairer parse the POM by itself if possible,
+            # so that the parse time is included in its metrics
+            repairers[job.pom] = JMRepairer(
+                parse_pom(job.pom) if parse_pom else job.pom, profiles=profiles,
+                properties=properties, basedir=_os.path.dirname(job.pom),
+                placeholders=placeholders)
+
+        change: OutputChange = getattr(repairers[job.pom], JOB_METHODS[job.kind])(
+            job.infile, outfile=job.outfile, dry_run=dry_run)
+        if on_output is not None:
+            on_output(job, change)
+
+    return repairers
+
+
+def write_metrics(repairers: Dict[str, 'JMRepairer'], path: Optional[str] = None) -> None:
+    """
+    Write the metrics collected by the given repairers as JSON.
+
+    Parameters
+    ----------
+    repairers : Dict[str, JMRepairer]
+        The repairers keyed by the path to their POM file, as returned by `run_jobs`.
+
+    path : str, optional
+        The path to the JSON file. If not specified,
+        the metrics will be printed to the standard output.
+
+    """
+    metrics: str = _json.dumps({
+        'modules': {pom: repairer.stats() for pom, repairer in repairers.items()}
+    }, indent=2)
+
+    if not path:
+        print(metrics)
+        return
+
+    parentdir: str = _os.path.dirname(path)
+    if parentdir:
+        _os.makedirs(parentdir, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(metrics + '\n')
+
+
+def _diff(change: 'OutputChange', name: str) -> List[str]:
+    """Return the unified diff of the current output file and the rendered contents."""
+    old: bytes = b''
+    if change.status == 'modified':
+        with open(change.path, 'rb') as file:
+            old = file.read()
+    lines: List[str] = list(_difflib.unified_diff(
+        old.decode('UTF-8', 'replace').splitlines(keepends=True),
+        change.data.decode('UTF-8', 'replace').splitlines(keepends=True),
+        '/dev/null' if change.status == 'added' else f'a/{name}', f'b/{name}'))
+    return [line if line.endswith('\n') else line + '\n\\ No newline at end of file\n'
+            for line in lines]
+
+
+def print_changes(changes: Sequence[Tuple[Job, 'OutputChange']], *, fmt: str = '',
+                  diff: bool = False, cwd: Optional[str] = None,
+                  file: Optional[TextIO] = None) -> None:
+    """
+    Print the changes of the outputs rendered in a dry run.
+
+    Parameters
+    ----------
+    changes : sequence of (Job, OutputChange)
+        The jobs and the changes of their outputs, as given to the
+        ``on_output`` callback of `run_jobs`. The unchanged outputs
+        are only counted.
+
+    fmt : str, optional
+        The format of the change list, either ``''`` for a line per changed
+        output (``A`` for added or ``M`` for modified, a tab, then the path),
+        ``'json'``, or ``'none'`` to print the diff only.
+
+    diff : bool, optional
+        Whether to print the unified diff of each changed output, after
+        the change list. Defaults to False.
+
+    cwd : str, optional
+        The directory the printed paths are relative to.
+        Defaults to the current working directory.
+
+    file : TextIO, optional
+        The file to print the changes. Defaults to `sys.stdout`.
+
+    Raises
+    ------
+    JMException :
+        If the format is unknown.
+
+    """
+    file = _sys.stdout if file is None else file
+    cwd = cwd or _os.getcwd()
+    changed: List[Tuple[Job, 'OutputChange', str]] = [
+        (job, change, _os.path.relpath(change.path, cwd).replace(_os.sep, '/'))
+        for job, change in changes if change.changed
+    ]
+
+    if fmt == 'json':
+        file.write(_json.dumps({
+            'changed': [{'path': name, 'status': change.status, 'kind': job.kind,
+                         'pom': job.pom, 'infile': job.infile}
+                        for job, change, name in changed],
+            'unchanged': len(changes) - len(changed)
+        }, indent=2) + '\n')
+    elif not fmt:
+        file.writelines(f"{'A' if change.status == 'added' else 'M'}\t{name}\n"
+                        for _, change, name in changed)
+    elif fmt != 'none':
+        raise _jmexc.JMException(f'Unknown format of the changes: {fmt!r}')
+
+    if diff:
+        for _, change, name in changed:
+            file.writelines(_diff(change, name))
+
+
+def print_version(*, only_ver: bool = False, file: Optional[TextIO] = None) -> None:
+    """
+    Print the version info to specific opened file.
+
+    Parameters
+    ----------
+    only_ver: bool, optional
+        Whether to print the version only. By activating this option,
+        other information like program name, license, and copyright
+        will not be printed. Defaults to False.
+
+    file : TextIO, optional
+        The file to print the version info.
+        Defaults to current console standard output (`sys.stdout`).
+
+    """
+
+    file = _sys.stdout if file is None else file
+    if not file:
+        raise ValueError(f"File must be a file object, got {type(file).__name__!r}")
+
+    setup: _globals.JMSetupConfRetriever = _globals.__jmsetup__  # Loaded on first use
+    program_name: str = setup.progname
+    version:      str = f"v{'.'.join(map(str, setup.version))}"
+    author:       str = setup.author
+
+    # Check if only_ver is False (or not specified)
+    if not only_ver:
+        print(
+            program_name, version, f'- {setup.license}',  # Program name and version
+            _os.linesep + \
+            f'Copyright (C) 2023-2024 by {author}.',          # Copyright notice
+            file=file
+        )
+    else:
+        print(version, file=file)
+
+
+def print_help() -> None:
+    """Print the help message to the standard output."""
+
+    setup: _globals.JMSetupConfRetriever = _globals.__jmsetup__  # Loaded on first use
+    program_name: str = setup.progname
+    version:      str = f"v{'.'.join(map(str, setup.version))}"
+    author:       str = setup.author
+
+    header: str = f'{program_name} {version}'
+
+    print(f"""\
+{header}
+{''.join(['-' for _ in range(len(header))])}
+
+USAGE:
+   python -m {__package__} [OPTIONS]
+
+OPTIONS:
+   --fix-mf <pom> <in> [out],
+   --fix-manifest <pom> <in> [out]
+        Run the builder to correct the specified manifest file containing
+        Maven's variables. Utilizes information from the provided POM file.
+        The output will be written to the given output file, if provided;
+        otherwise, it will overwrite the input file.
+
+   --fix-prop <pom> <in> [out],
+   --fix-properties <pom> <in> [out]
+        Run the builder to rectify the specified properties file with
+        Maven's variables. Incorporates information from the provided POM file.
+        The output will be written to the given output file, if provided;
+        otherwise, it will overwrite the input file.
+
+   --render <pom> <in> [out],
+   --render-file <pom> <in> [out]
+        Render any text file (e.g., source code, documentation or scripts),
+        replacing every Maven's variable with its value from the provided
+        POM file, and keeping the unknown ones. Use '\\${{' for a literal '${{'.
+        The file is streamed, so its size does not matter. The output will be
+        written to the given output file, if provided; otherwise, it will
+        overwrite the input file.
+
+        These options can be specified multiple times to run several jobs
+        at once, each distinct POM file is parsed only once.
+
+        Besides the POM's variables, the placeholders '${{git.commit}}',
+        '${{git.commit.short}}', '${{git.branch}}', '${{git.tag}}', '${{git.describe}}',
+        '${{git.dirty}}', '${{build.number}}', '${{build.user}}', '${{build.host}}' and
+        '${{java.version}}' (or any other JDK's 'java.*' property) are evaluated
+        when referenced, once per run. The POM and user properties take precedence.
+
+   -V, --version, -version
+        Print the version and copyright information. All details will be printed
+        directly to the standard output, except for '-version', it goes
+        to the standard error.
+
+   -VV, --only-ver, --only-version
+        Print the version number only.
+
+   -h, --help
+        Print this help message.
+
+   -P <ids>, --activate-profiles <ids>
+        Activate the profiles of the POM files with the given comma-separated
+        IDs, an ID prefixed with '!' or '-' deactivates the profile instead.
+        The profiles are also activated by their declared conditions (JDK,
+        OS, properties and files), as in Maven. Can be specified multiple times.
+
+   -D <key>[=<value>], --define <key>[=<value>]
+        Define a user property, overriding the properties of the POM files
+        and their active profiles. The value defaults to 'true'.
+        Can be specified multiple times.
+
+   --dry-run[=json]
+        Render the declared jobs in memory and compare them against the
+        current output files, without writing anything. Print a line per
+        output that would change ('A' for added or 'M' for modified, a tab,
+        then the path), or a JSON report if 'json' is given. Exit with the
+        code {EXIT_CHANGED} if any output would change, 0 if all are up to date.
+
+   --diff
+        Like '--dry-run', but print the unified diff of each output that
+        would change (after the change list, if '--dry-run' is also given).
+
+   --watch
+        Run the declared jobs, then keep watching their POM and input files.
+        Whenever a file changed, only the outputs affected by that file are
+        rendered again. Press Ctrl+C to stop watching.
+
+   --profile[=<path>]
+        Profile the declared jobs, write the `cProfile` statistics to the given
+        pstats file (defaults to a new file inside the logs directory), and
+        print the time spent in each phase (parse, index, read template,
+        resolve, render, write) to the standard error.
+
+   --trace[=<path>]
+        Record the phases of the declared jobs as spans, tagged with the file
+        path and the worker, and write them as Chrome trace events (viewable
+        in `chrome://tracing` or Perfetto) to the given file, which defaults
+        to a new file inside the logs directory.
+
+   --memprofile[=<path>]
+        Trace the memory allocations of the declared jobs, and report the peak
+        and retained memory of each phase with the top allocating source lines,
+        as text and JSON to the given path (with the extensions `.txt` and
+        `.json`), which defaults to a new path inside the logs directory.
+        The peak of each phase requires Python 3.9+, otherwise it is `null`.
+
+   --metrics-json[=<path>]
+        Write the metrics of the declared jobs (placeholders seen, resolved
+        and unresolved, distinct keys, bytes read and written, files written
+        and skipped as unchanged, and the time spent in each phase) as JSON
+        to the given file, or to the standard output if not specified (the
+        file is then required with `--dry-run` and `--diff`).
+
+   --daemon [--socket <path>] [--idle-timeout <seconds>]
+        Run as a warm daemon listening on a local Unix socket, keeping the
+        parsed POM files and imported modules in memory. Use the client
+        (`python -m {__package__}.client <OPTIONS>`) to forward the requests.
+        The daemon shuts down after being idle for the given timeout.
+
+ISSUES:
+   Report some issues and help us improve this builder.
+   <https://github.com/mitsuki31/JMBuilder/issues/new>
+
+AUTHOR:
+   {author}\
+""")
+
+
+def _instrument(options: Dict[str, str], cwd: str) -> ContextManager:
+    """Return a context manager enabling the profilers and tracer, if requested."""
+    # pylint: disable=import-outside-toplevel
+    from contextlib import ExitStack
+
+    stack: ExitStack = ExitStack()
+    if {'profile', 'trace', 'memprofile'} & set(options):
+        from .profiler import MemoryProfiler, Profiler, TraceRecorder
+
+        for name, instrument in (('profile', Profiler), ('trace', TraceRecorder),
+                                 ('memprofile', MemoryProfiler)):
+            if name in options:
+                stack.enter_context(instrument(
+                    options[name] and _os.path.join(cwd, options[name])))
+    return stack
+
+
+def main(argv: Sequence[str], *, cwd: Optional[str] = None,
+         parse_pom: Optional[Callable[[str], Union['PomParser', 'PomModel']]] = None) -> int:
+    """
+    Run the command-line interface with the given arguments.
+
+    Parameters
+    ----------
+    argv : sequence of str
+        The command-line arguments, without the program name.
+
+    cwd : str, optional
+        The directory to resolve the relative paths against.
+        Defaults to the current working directory.
+
+    parse_pom : callable, optional
+        A function used to parse the POM files. See `run_jobs`.
+
+    Returns
+    -------
+    int :
+        The exit code, `EXIT_CHANGED` if any output would be changed
+        in a dry run.
+
+    """
+    if len(argv) == 0:
+        print(
+            f'Nothing to run.{_os.linesep * 2}' +
+            f'USAGE: python -m {__package__} [-h | -V | -VV]{_os.linesep}' +
+            '\t\t[--fix-mf <pom> <in> [out] ...] [--fix-prop <pom> <in> [out] ...]' +
+            f'{_os.linesep}\t\t[--render <pom> <in> [out] ...]'
+        )
+        return 0
+
+    # Parse the whole arguments at once, raise an error on unknown arguments
+    args: ParsedArgs = parse_args(argv)
+
+    # Check for `-V` or `--version` in the arguments
+    # If found, print the version info then exit with exit code zero (success)
+    #
+    if 'version' in args.flags:
+        print_version()
+
+    # For `-version` argument, the output will be redirected
+    # to the standard error (`sys.stderr`)
+    #   `-V`, `--version` -> sys.stdout
+    #   `-version`        -> sys.stderr
+    #
+    elif 'version_stderr' in args.flags:
+        print_version(file=_sys.stderr)
+
+    # To print the version only, user can use several arguments. See `OPTIONS`
+    elif 'only_version' in args.flags:
+        print_version(only_ver=True)
+
+    # Print the help message
+    elif 'help' in args.flags:
+        print_help()
+
+    # Run as a warm daemon, serving the requests from the client
+    elif 'daemon' in args.flags:
+        from . import _daemon  # pylint: disable=import-outside-toplevel
+        _daemon.serve(args.options.get('socket'),
+                      idle_timeout=float(args.options.get('idle_timeout',
+                                                          _daemon.IDLE_TIMEOUT)))
+
+    elif args.jobs:
+        cwd = cwd or _os.getcwd()
+        with _instrument(args.options, cwd):
+            dry_run: bool = 'dry_run' in args.options or 'diff' in args.flags
+            if args.options.get('dry_run', '') not in ('', 'json'):
+                raise _jmexc.JMException(
+                    f"Unknown format of '--dry-run': {args.options['dry_run']!r}")
+            if dry_run and args.options.get('metrics_json', None) == '':
+                # Both would be printed to the standard output, e.g., two JSON documents
+                raise _jmexc.JMException(
+                    "Option '--metrics-json' requires a file path with '--dry-run' or '--diff'")
+            # Run all declared jobs, then re-run them whenever their inputs changed
+            if 'watch' in args.flags:
+                if dry_run:
+                    raise _jmexc.JMException(
+                        "Options '--dry-run' and '--diff' cannot be used with '--watch'")
+                from . import _watch  # pylint: disable=import-outside-toplevel
+                _watch.watch(args.jobs, cwd=cwd, parse_pom=parse_pom,
+                             profiles=args.profiles, properties=args.properties)
+
+            # Run all declared jobs, each distinct POM file is parsed only once
+            else:
+                changes: 'List[Tuple[Job, OutputChange]]' = []
+                repairers = run_jobs(args.jobs, cwd=cwd, parse_pom=parse_pom,
+                                     profiles=args.profiles, properties=args.properties,
+                                     dry_run=dry_run,
+                                     on_output=lambda *change: changes.append(change))
+                if 'metrics_json' in args.options:
+                    path: str = args.options['metrics_json']
+                    write_metrics(repairers, path and _os.path.join(cwd, path))
+
+                if dry_run:
+                    print_changes(changes, fmt=args.options.get('dry_run', 'none'),
+                                  diff='diff' in args.flags, cwd=cwd)
+                    if any(change.changed for _, change in changes):
+                        return EXIT_CHANGED
+
+    return 0
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Callable, ContextManager, Dict, List, NamedTuple, Optional, Sequence, Set, TextIO, Tuple
+del Union
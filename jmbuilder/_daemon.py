@@ -0,0 +1,261 @@
+"""Daemon Module for `JMBuilder`
+
+This module provides a warm daemon that serves the requests forwarded by
+the client (see `jmbuilder.client`) through a local Unix socket. The daemon
+keeps the imported modules and the parsed POM files in memory, so that each
+request only pays the cost of the actual repair work instead of the Python
+startup, the imports and the POM parsing.
+
+The daemon is started by ``python -m jmbuilder --daemon``, and shuts down
+by itself after being idle for ``--idle-timeout`` seconds.
+
+Each request is run with the environment variables of its client, so the
+values read from the environment (e.g., ``build.number``, ``env.*``, the JDK
+or the local repository) are the same as in a direct run. The templates are
+not cached, as they are read and rendered in a single pass.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+PomCache
+    A cache of parsed POM files, invalidated by the file modification time.
+    Only the models of the POM files (see `PomParser.to_model`) are cached,
+    their parsed documents are released.
+
+Available Functions
+-------------------
+serve
+    Listen on the Unix socket and serve the requests until idle.
+
+"""
+
+import io as _io
+import os as _os
+import sys as _sys
+import json as _json
+import signal as _signal
+import socket as _socket
+import threading as _threading
+import traceback as _tb
+from contextlib import contextmanager as _contextmanager, \
+    redirect_stdout as _redirect_stdout, redirect_stderr as _redirect_stderr
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from . import _cli
+from . import client as _client
+from . import exception as _jmexc
+from . import placeholders as _placeholders
+from . import profiles as _profiles
+from .core import PomModel, PomParser, _import_bs4
+from . import _globals
+
+
+__all__ = ['PomCache', 'serve']
+
+# The default idle timeout, in seconds
+IDLE_TIMEOUT: float = 300.0
+
+# The maximum time to wait for a connected client to send its request
+_REQUEST_TIMEOUT: float = 10.0
+
+
+class PomCache:
+    """
+    A cache of parsed POM files, invalidated by the file modification time.
+
+    Instances of this class are callable and can be passed as the `parse_pom`
+    argument of `jmbuilder._cli.run_jobs`. A POM file is parsed again only
+    if its modification time or size has been changed since it was cached.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize self."""
+        self.__entries: Dict[str, Tuple[Tuple[int, int], PomModel]] = {}
+
+    def __call__(self, path: str) -> PomModel:
+        """
+        Return the parsed POM file, parse it if not cached or outdated.
+
+        Parameters
+        ----------
+        path : str
+            The absolute path to the POM file.
+
+        Returns
+        -------
+        PomModel :
+            An instance of `PomModel` representing the parsed POM file.
+
+        """
+        stat: _os.stat_result = _os.stat(path)
+        key: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self.__entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        pom: PomModel = PomParser.parse(path).to_model()
+        self.__entries[path] = (key, pom)
+        return pom
+
+    def __len__(self) -> int:
+        """Return the number of cached POM files."""
+        return len(self.__entries)
+
+
+@_contextmanager
+def _environ(env: Optional[Dict[str, str]]) -> Iterator[None]:
+    """Apply the environment variables of the client for the duration of a request."""
+    if env is None or env == _os.environ:
+        yield  # Not sent (i.e., an older client), or the same as the daemon's
+        return
+
+    saved: Dict[str, str] = dict(_os.environ)
+    # Drop the values detected from another environment, before and after
+    _profiles.clear_cache()
+    _placeholders.clear_cache()
+    _os.environ.clear()
+    _os.environ.update(env)
+    try:
+        yield
+    finally:
+        _os.environ.clear()
+        _os.environ.update(saved)
+        _profiles.clear_cache()
+        _placeholders.clear_cache()
+
+
+def _handle(conn: _socket.socket, cache: PomCache) -> None:
+    """Read a single request from the connection and send the response."""
+    conn.settimeout(_REQUEST_TIMEOUT)
+    chunks: list = []
+    while True:
+        chunk: bytes = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    if not chunks:
+        return  # Nothing requested, e.g., a liveness probe
+
+    stdout: _io.StringIO = _io.StringIO()
+    stderr: _io.StringIO = _io.StringIO()
+    code: int = 0
+
+    with _redirect_stdout(stdout), _redirect_stderr(stderr):
+        try:
+            payload: dict = _json.loads(b''.join(chunks).decode('utf-8'))
+            flags: set = _cli.parse_args(payload['argv']).flags
+            if 'daemon' in flags:
+                raise _jmexc.JMException('The daemon is already running')
+            if 'watch' in flags:
+                raise _jmexc.JMException('Watch mode cannot be run by the daemon')
+
+            with _environ(payload.get('env')):
+                code = _cli.main(payload['argv'], cwd=payload['cwd'], parse_pom=cache)
+        except SystemExit as sys_exit:
+            code = sys_exit.code if isinstance(sys_exit.code, int) else 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            _tb.print_exc()
+            code = 1
+
+    conn.sendall(_json.dumps({
+        'code': code,
+        'stdout': stdout.getvalue(),
+        'stderr': stderr.getvalue()
+    }).encode('utf-8'))
+
+
+def _is_alive(path: str) -> bool:
+    """Return True if a daemon is listening on the given socket path."""
+    with _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: Optional[str] = None, *,
+          idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """
+    Listen on the Unix socket and serve the requests until idle.
+
+    Parameters
+    ----------
+    socket_path : str, optional
+        The path to the Unix socket to listen on.
+        Defaults to ``jmbuilder.client.default_socket_path()``.
+
+    idle_timeout : float, optional
+        The number of seconds without any request after which
+        the daemon shuts down. Defaults to 300 seconds.
+
+    Raises
+    ------
+    JMException :
+        If another daemon is already listening on the same socket.
+
+    PermissionError :
+        If the directory of the default socket path is not private to the
+        current user.
+
+    """
+    path: str = socket_path or _client.default_socket_path()
+    if not socket_path and not _os.environ.get(_client.SOCKET_ENV):
+        # The default directory must be private, as it may be in a shared one
+        runtime_dir: str = _client._runtime_dir()  # pylint: disable=protected-access
+        _os.makedirs(runtime_dir, mode=0o700, exist_ok=True)
+        _client._check_owner(runtime_dir, private=True)  # pylint: disable=protected-access
+    if _os.path.exists(path):
+        if _is_alive(path):
+            raise _jmexc.JMException(f'Another daemon is already listening on {path!r}')
+        _os.unlink(path)  # Remove the stale socket
+
+    # Import the heavy modules upfront, so the first request is warm too
+    _import_bs4().BeautifulSoup('<project/>', 'xml')
+
+    # Make sure the socket is removed when terminated by a signal
+    if _threading.current_thread() is _threading.main_thread():
+        _signal.signal(_signal.SIGTERM, lambda *_: _sys.exit(0))
+
+    cache: PomCache = PomCache()
+    with _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM) as server:
+        # Only accessible by the current user, right from its creation
+        umask: int = _os.umask(0o077)
+        try:
+            server.bind(path)
+        finally:
+            _os.umask(umask)
+        server.listen()
+        server.settimeout(idle_timeout)
+        print(f'{__package__}: listening on {path}', file=_sys.stderr)
+
+        try:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except _socket.timeout:
+                    break  # Idle for too long, shut down
+
+                with conn:
+                    try:
+                        _handle(conn, cache)
+                    except OSError:
+                        _tb.print_exc()
+        finally:
+            _os.unlink(path)
+
+    print(f'{__package__}: idle for {idle_timeout:g}s, shut down', file=_sys.stderr)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Dict, Iterator, Optional, Tuple
@@ -51,24 +51,27 @@ TMPDIR : str or pathlib.Path
 VERSION : str
     A string representing the JMBuilder's version information.
 
+Notes
+-----
+The setup metadata (`AUTHOR`, `VERSION`, `VERSION_INFO` and the
+`JMSetupConfRetriever` instance) are loaded lazily on first access from
+the generated ``_setupconf`` module, see `jmbuilder._setupgen`.
+
 """
 
 import os as _os
 import sys as _sys
-import json as _json
 import collections as _collections
+from importlib import import_module as _import_module
 from pathlib import Path as _Path
 from typing import (
+    Any,
+    Dict,
     TextIO,
     Type,
     Union
 )
 
-if '_global_imported' in globals():
-    raise RuntimeError(
-        "Cannot import the '_globals' module more than once.")
-_global_imported: bool = True
-
 class _JMCustomPath:
     """
     Custom class to manage read-only path variables for `JMBuilder` module.
@@ -212,6 +215,30 @@ class _JMCustomPath:
         return self.__type
 
 
+def _import_sibling(name: str) -> Any:
+    """
+    Import a module that lives next to this module.
+
+    This works whether this module was imported as ``jmbuilder._globals``
+    or as a top-level ``_globals`` module (i.e., when the package directory
+    itself is on the Python search path).
+    """
+    return _import_module(f'{__package__}.{name}' if __package__ else name)
+
+
+def _load_setup() -> Dict[str, Any]:
+    """
+    Load the setup metadata from the generated ``_setupconf`` module.
+
+    Falls back to reading the setup configuration file if the generated
+    module is not available (e.g., it has not been generated yet).
+    """
+    try:
+        return dict(_import_sibling('_setupconf').SETUP)
+    except ImportError:
+        return _import_sibling('_setupgen').load_setupjson()
+
+
 class JMSetupConfRetriever:
     """
     A class that retrieves and provides all setup configuration.
@@ -221,16 +248,15 @@ class JMSetupConfRetriever:
     This class only retrieves the setup configuration without any modification
     methods to their values.
 
+    The setup configuration is loaded from the ``_setupconf`` module, which
+    is generated from ``.config/setup.json`` by ``python -m jmbuilder._setupgen``.
+
     """
 
     def __init__(self):
         """Initialize self."""
 
-        setupfile: str = _os.path.join(_JMCustomPath(str).confdir, 'setup.json')
-        # Get the properties
-        configs: dict = {}
-        with open(setupfile, 'r', encoding='utf-8') as setup_file:
-            configs = _json.load(setup_file)
+        self.__jmsetup_data: Dict[str, Any] = _load_setup()
 
         # Create an empty named tuple
         frozen_ver = _collections.namedtuple(
@@ -240,12 +266,9 @@ class JMSetupConfRetriever:
         )
 
         # Change the named tuple's documentation
-        frozen_ver.__doc__ = f'{configs.get("Program-Name")}\'s ' + \
+        frozen_ver.__doc__ = f'{self.__jmsetup_data["progname"]}\'s ' + \
             'version information as a frozen named tuple.'
 
-        key_names: list = ['progname', 'version', 'author', 'license']
-        self.__jmsetup_data: dict = dict(zip(key_names, configs.values()))
-
         # Convert the version info to FrozenJMVersion (a named tuple)
         self.__jmsetup_data['version'] = frozen_ver(*self.__jmsetup_data['version'])
 
@@ -303,7 +326,6 @@ class JMSetupConfRetriever:
 
 
 # Aliases
-__jmsetup__ = JMSetupConfRetriever()
 __jmpath__  = _JMCustomPath()
 
 BASEDIR: Union[str, _Path] = __jmpath__.basedir
@@ -314,13 +336,68 @@ CONFDIR: Union[str, _Path] = __jmpath__.confdir
 STDOUT: TextIO = _sys.stdout
 STDERR: TextIO = _sys.stderr
 
-AUTHOR:       str = __jmsetup__.author
-VERSION:      str = '.'.join(map(str, __jmsetup__.version))
-VERSION_INFO: str = __jmsetup__.version
 
-__author__        = AUTHOR
-__version__       = VERSION
-__version_info__  = VERSION_INFO
+# The setup metadata are loaded lazily on first access (PEP 562),
+# which means importing this module does not perform any file I/O
+_LAZY_SETUP_ATTRS = {
+    '__jmsetup__': lambda setup: setup,
+    'AUTHOR': lambda setup: setup.author,
+    'VERSION': lambda setup: '.'.join(map(str, setup.version)),
+    'VERSION_INFO': lambda setup: setup.version,
+    '__author__': lambda setup: setup.author,
+    '__version__': lambda setup: '.'.join(map(str, setup.version)),
+    '__version_info__': lambda setup: setup.version
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily retrieve the setup metadata on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of attribute to be retrieved.
+
+    Returns
+    -------
+    Any :
+        The value of requested attribute.
+
+    Raises
+    ------
+    AttributeError :
+        If the given name is not a lazy attribute of this module.
+
+    """
+    if name not in _LAZY_SETUP_ATTRS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # Only a single instance of the retriever is created, and
+    # every resolved attribute is cached in the module globals
+    setup: JMSetupConfRetriever = globals().get('__jmsetup__') or JMSetupConfRetriever()
+    globals()['__jmsetup__'] = setup
+
+    value: Any = _LAZY_SETUP_ATTRS[name](setup)
+    globals()[name] = value
+    return value
+
+
+def _module_metadata(name: str, module: str) -> Any:
+    """
+    Return the lazy setup metadata (``__author__``, ``__version__`` or
+    ``__version_info__``) for the ``__getattr__`` of the other modules, so
+    that importing them does not load the setup metadata either.
+
+    Raises
+    ------
+    AttributeError :
+        If the given name is not a setup metadata, naming the given module.
+
+    """
+    if name not in ('__author__', '__version__', '__version_info__'):
+        raise AttributeError(f'module {module!r} has no attribute {name!r}')
+    return __getattr__(name)
 
 
 __all__ = [
@@ -332,4 +409,4 @@ __all__ = [
 
 
 # Remove unnecessary variables
-del Type, TextIO, Union
+del Any, Dict, Type, TextIO, Union
@@ -0,0 +1,8 @@
+"""Generated Setup Metadata for `JMBuilder`
+
+This module is generated by ``python -m jmbuilder._setupgen`` from
+``.config/setup.json``, do not edit it manually.
+"""
+
+# pylint: disable=all
+SETUP = {'progname': 'JMBuilder', 'version': (1, 0, 0), 'author': 'Ryuu Mitsuki', 'license': 'MIT License'}
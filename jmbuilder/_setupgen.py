@@ -0,0 +1,117 @@
+"""Setup Metadata Generator for `JMBuilder`
+
+This module compiles the setup configuration file (``.config/setup.json``)
+into a plain Python module (``_setupconf.py``), so that the setup metadata
+can be imported without opening and parsing the JSON file on every start.
+The JSON file remains the source of truth, regenerate the Python module
+each time the JSON file is changed::
+
+    $ python -m jmbuilder._setupgen
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Functions
+-------------------
+load_setupjson
+    Read the setup configuration file and return the setup metadata
+    mapped by their field names.
+
+generate
+    Compile the setup configuration file into a Python module.
+
+"""
+
+import os as _os
+import sys as _sys
+import json as _json
+from typing import Any, Dict, Optional
+
+
+__all__ = ['load_setupjson', 'generate']
+
+# Maps the keys of setup configuration file to their field names
+FIELDS: Dict[str, str] = {
+    'Program-Name': 'progname',
+    'Version': 'version',
+    'Author': 'author',
+    'License': 'license'
+}
+
+SETUPJSON: str = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)),
+                               '.config', 'setup.json')
+SETUPCONF: str = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)),
+                               '_setupconf.py')
+
+_TEMPLATE: str = '''\
+"""Generated Setup Metadata for `JMBuilder`
+
+This module is generated by ``python -m jmbuilder._setupgen`` from
+``.config/setup.json``, do not edit it manually.
+"""
+
+# pylint: disable=all
+SETUP = {setup!r}
+'''
+
+
+def load_setupjson(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read the setup configuration file and return the setup metadata.
+
+    Parameters
+    ----------
+    path : str, optional
+        The path to setup configuration file. Defaults to ``.config/setup.json``
+        inside the `JMBuilder` package.
+
+    Returns
+    -------
+    Dict[str, Any] :
+        A dictionary containing the setup metadata, keyed by field names
+        (see ``FIELDS``), with the version as a tuple of integers.
+
+    Raises
+    ------
+    KeyError :
+        If the setup configuration file is missing one of the required keys.
+
+    """
+    with open(path or SETUPJSON, 'r', encoding='utf-8') as setup_file:
+        configs: dict = _json.load(setup_file)
+
+    # Look up the values by their keys, do not depend on the order of values
+    setup: Dict[str, Any] = {field: configs[key] for key, field in FIELDS.items()}
+    setup['version'] = tuple(setup['version'])
+
+    return setup
+
+
+def generate(source: Optional[str] = None, target: Optional[str] = None) -> str:
+    """
+    Compile the setup configuration file into a Python module.
+
+    Parameters
+    ----------
+    source : str, optional
+        The path to setup configuration file. Defaults to ``.config/setup.json``.
+
+    target : str, optional
+        The path to the generated Python module. Defaults to ``_setupconf.py``
+        inside the `JMBuilder` package.
+
+    Returns
+    -------
+    str :
+        The path to the generated Python module.
+
+    """
+    target = target or SETUPCONF
+    with open(target, 'w', encoding='utf-8') as out:
+        out.write(_TEMPLATE.format(setup=load_setupjson(source)))
+
+    return target
+
+
+if __name__ == '__main__':
+    print(f'Generated: {generate(*_sys.argv[1:3])}')
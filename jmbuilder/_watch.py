@@ -0,0 +1,287 @@
+"""Watch Module for `JMBuilder`
+
+This module provides the watch mode (``python -m jmbuilder --watch``), which
+runs the declared jobs once and then keeps watching their POM and input
+(template) files. Whenever a file changed, only the outputs affected by that
+file are rendered again, and the already parsed POM is reused unless the POM
+itself has been changed.
+
+File changes are detected using inotify on Linux (through `ctypes`, no
+third-party modules required), otherwise by polling the file status.
+If the inotify event queue overflows, the status of every watched file is
+compared instead, so no change is missed.
+A burst of changes (e.g., an editor saving several files at once) is
+debounced into a single re-render.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Functions
+-------------------
+watch
+    Run the given jobs and re-run the affected ones whenever their inputs changed.
+
+"""
+
+import os as _os
+import sys as _sys
+import time as _time
+import select as _select
+import struct as _struct
+import traceback as _tb
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from . import _cli
+from . import _globals
+
+
+__all__ = ['watch']
+
+# The default interval for polling the file status, in seconds
+POLL_INTERVAL: float = 0.5
+
+# The quiet period to wait for before re-rendering, in seconds
+DEBOUNCE: float = 0.2
+
+# See <sys/inotify.h>
+_IN_MODIFY: int      = 0x00000002
+_IN_ATTRIB: int      = 0x00000004
+_IN_CLOSE_WRITE: int = 0x00000008
+_IN_MOVED_FROM: int  = 0x00000040
+_IN_MOVED_TO: int    = 0x00000080
+_IN_CREATE: int      = 0x00000100
+_IN_DELETE: int      = 0x00000200
+_IN_Q_OVERFLOW: int  = 0x00004000
+_IN_NONBLOCK: int    = 0o4000
+_IN_CLOEXEC: int     = 0o2000000
+_IN_EVENT_HEADER: _struct.Struct = _struct.Struct('iIII')
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """Return the modification time and size of the file, or None if not exist."""
+    try:
+        stat: _os.stat_result = _os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _PollWatcher:
+    """Detect the changed files by polling their status."""
+
+    def __init__(self, paths: Iterable[str], interval: float = POLL_INTERVAL) -> None:
+        self.interval: float = interval
+        self.__snapshot: Dict[str, Optional[Tuple[int, int]]] = {
+            path: _stat_key(path) for path in paths
+        }
+
+    def wait(self, timeout: float) -> Set[str]:
+        """Wait up to `timeout` seconds and return the changed files."""
+        deadline: float = _time.monotonic() + timeout
+        while True:
+            changed: Set[str] = set()
+            for path, key in self.__snapshot.items():
+                new_key = _stat_key(path)
+                if new_key != key:
+                    self.__snapshot[path] = new_key
+                    changed.add(path)
+
+            remaining: float = deadline - _time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            _time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release the resources, nothing to release for polling."""
+
+
+class _InotifyWatcher:
+    """Detect the changed files using inotify, watching their parent directories."""
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        # pylint: disable=import-outside-toplevel
+        import ctypes
+        import ctypes.util
+
+        self.__libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.__fd: int = self.__libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1() failed')
+
+        # Watch the parent directories, so that the files replaced by
+        # renaming (e.g., atomic saves by editors) are still detected
+        self.__paths: Set[str] = set(paths)
+        self.__dirs: Dict[int, str] = {}
+        mask: int = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | \
+            _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+        for dirname in {_os.path.dirname(path) for path in self.__paths}:
+            wd: int = self.__libc.inotify_add_watch(
+                self.__fd, _os.fsencode(dirname), mask)
+            if wd < 0:
+                self.close()
+                raise OSError(ctypes.get_errno(), f'Cannot watch {dirname!r}')
+            self.__dirs[wd] = dirname
+
+    def wait(self, timeout: float) -> Set[str]:
+        """
+        Wait up to `timeout` seconds and return the changed files, or all the
+        watched files if the event queue overflowed (i.e., events were lost).
+        """
+        if not _select.select([self.__fd], [], [], timeout)[0]:
+            return set()
+
+        changed: Set[str] = set()
+        try:
+            data: bytes = _os.read(self.__fd, 65536)
+        except BlockingIOError:
+            return changed
+
+        offset: int = 0
+        while offset + _IN_EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _IN_EVENT_HEADER.unpack_from(data, offset)
+            offset += _IN_EVENT_HEADER.size
+            if mask & _IN_Q_OVERFLOW:
+                # Check them all, as the polling does, the caller compares their status
+                return set(self.__paths)
+            name: str = _os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            path: str = _os.path.join(self.__dirs.get(wd, ''), name)
+            if path in self.__paths:
+                changed.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self.__fd >= 0:
+            _os.close(self.__fd)
+            self.__fd = -1
+
+
+def _new_watcher(paths: Set[str], interval: float) -> '_PollWatcher | _InotifyWatcher':
+    """Return an inotify watcher if supported, otherwise a polling watcher."""
+    if _sys.platform.startswith('linux'):
+        try:
+            return _InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass  # Fall back to polling
+    return _PollWatcher(paths, interval)
+
+
+def watch(jobs: Sequence['_cli.Job'], *, cwd: Optional[str] = None,
+          parse_pom: Optional[Callable[[str], Union['PomParser', 'PomModel']]] = None,
+          profiles: Sequence[str] = (), properties: Optional[Dict[str, str]] = None,
+          interval: float = POLL_INTERVAL, debounce: float = DEBOUNCE,
+          stop: Optional[Callable[[], bool]] = None) -> None:
+    """
+    Run the given jobs and re-run the affected ones whenever their inputs changed.
+
+    Parameters
+    ----------
+    jobs : sequence of Job
+        The jobs to be run and watched.
+
+    cwd : str, optional
+        The directory to resolve the relative paths against.
+        Defaults to the current working directory.
+
+    parse_pom : callable, optional
+        A function used to parse the POM files, see `jmbuilder._cli.run_jobs`.
+        Defaults to parse them with ``PomParser.parse``, keeping only their models.
+
+    profiles : sequence of str, optional
+        The IDs of profiles to be activated, see `jmbuilder._cli.run_jobs`.
+
+    properties : Dict[str, str], optional
+        The user properties, see `jmbuilder._cli.run_jobs`.
+
+    interval : float, optional
+        The interval for polling the file status, in seconds. Only used
+        if inotify is not available. Defaults to 0.5 seconds.
+
+    debounce : float, optional
+        The quiet period to wait for after a change before re-rendering,
+        in seconds. Defaults to 0.2 seconds.
+
+    stop : callable, optional
+        A function that returns True when watching should be stopped.
+        If not specified, watch until interrupted (i.e., Ctrl+C).
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from .core import PomParser
+
+    parse_pom = parse_pom or (lambda path: PomParser.parse(path).to_model())
+    jobs = _cli.resolve_jobs(jobs, cwd)
+
+    # Maps each watched file to the indexes of jobs that depend on it
+    dependents: Dict[str, Set[int]] = {}
+    for idx, job in enumerate(jobs):
+        dependents.setdefault(job.pom, set()).add(idx)
+        dependents.setdefault(job.infile, set()).add(idx)
+
+    parsed: Dict[str, Union['PomParser', 'PomModel']] = {}
+    snapshot: Dict[str, Optional[Tuple[int, int]]] = {}
+
+    def render(indexes: Iterable[int], changed_poms: Set[str]) -> None:
+        """Render the given jobs, re-parse only the changed POM files."""
+        selected: List['_cli.Job'] = [jobs[idx] for idx in sorted(indexes)]
+        try:
+            for pom in {job.pom for job in selected}:
+                if pom in changed_poms or pom not in parsed:
+                    parsed[pom] = parse_pom(pom)
+            _cli.run_jobs(selected, parse_pom=parsed.__getitem__, profiles=profiles,
+                          properties=properties)
+        except Exception:  # pylint: disable=broad-exception-caught
+            _tb.print_exc()  # Keep watching, the file may be fixed later
+        else:
+            for job in selected:
+                print(f'{__package__}: rendered {job.outfile}', file=_sys.stderr)
+        finally:
+            # Ignore the changes caused by our own outputs (e.g., in-place jobs)
+            for path in snapshot:
+                snapshot[path] = _stat_key(path)
+
+    render(range(len(jobs)), set())
+
+    watcher = _new_watcher(set(dependents), interval)
+    print(f'{__package__}: watching {len(dependents)} file(s) using ' +
+          ('inotify' if isinstance(watcher, _InotifyWatcher) else 'polling'),
+          file=_sys.stderr)
+    for path in dependents:
+        snapshot[path] = _stat_key(path)
+
+    try:
+        while not (stop and stop()):
+            candidates: Set[str] = watcher.wait(interval)
+            if not candidates:
+                continue
+
+            # Debounce, wait until no more changes for a while
+            while True:
+                more: Set[str] = watcher.wait(debounce)
+                if not more:
+                    break
+                candidates |= more
+
+            changed: Set[str] = {
+                path for path in candidates if _stat_key(path) != snapshot[path]
+            }
+            if not changed:
+                continue
+
+            indexes: Set[int] = set()
+            for path in changed:
+                indexes |= dependents[path]
+            render(indexes, {job.pom for job in jobs} & changed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
@@ -0,0 +1,212 @@
+"""Daemon Client Module for `JMBuilder`
+
+This module provides a tiny client that forwards the command-line arguments
+and the current working directory to a warm `JMBuilder` daemon (started by
+``python -m jmbuilder --daemon``) through a local Unix socket, and then
+reproduces the daemon's output and exit code. If no daemon is listening,
+the request is run in this process instead (i.e., as a cold run).
+
+The client only depends on the Python standard library and does not
+import the `jmbuilder` package when a daemon is available. For the lowest
+startup latency, run this file directly as a script::
+
+    $ python -S path/to/jmbuilder/client.py --fix-mf pom.xml MANIFEST.MF
+
+Or as a module (which also imports the `jmbuilder` package)::
+
+    $ python -m jmbuilder.client --fix-mf pom.xml MANIFEST.MF
+
+The socket path defaults to ``jmbuilder.sock`` inside ``$XDG_RUNTIME_DIR``,
+or else inside a private ``jmbuilder-<uid>`` directory (mode 0700) of the
+system temporary directory, and can be overridden by the ``JMBUILDER_SOCKET``
+environment variable. The client only connects to a socket owned by the
+current user, and sends its environment variables along with the request,
+so the daemon renders the same values as a direct run would.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Functions
+-------------------
+default_socket_path
+    Return the path to the daemon socket.
+
+request
+    Send a request to the daemon and return its response.
+
+main
+    Forward the command-line arguments to the daemon.
+
+"""
+
+import os as _os
+import sys as _sys
+import json as _json
+import stat as _stat
+import socket as _socket
+import tempfile as _tempfile
+from typing import Dict, Optional, Sequence, Tuple
+
+
+__all__ = ['default_socket_path', 'request', 'main']
+
+SOCKET_ENV: str = 'JMBUILDER_SOCKET'
+
+
+def default_socket_path() -> str:
+    """
+    Return the path to the daemon socket.
+
+    Returns
+    -------
+    str :
+        The value of ``JMBUILDER_SOCKET`` environment variable if defined,
+        otherwise ``jmbuilder.sock`` inside the runtime directory of the
+        user (``$XDG_RUNTIME_DIR``), or inside the private ``jmbuilder-<uid>``
+        directory of the temporary directory if not defined.
+
+    """
+    return _os.environ.get(SOCKET_ENV) or _os.path.join(_runtime_dir(), 'jmbuilder.sock')
+
+
+def _runtime_dir() -> str:
+    """Return the directory of the default socket path, see `default_socket_path`."""
+    uid: int = _os.getuid() if hasattr(_os, 'getuid') else 0
+    return _os.environ.get('XDG_RUNTIME_DIR') or \
+        _os.path.join(_tempfile.gettempdir(), f'jmbuilder-{uid}')
+
+
+def _check_owner(path: str, *, private: bool = False) -> None:
+    """
+    Raise PermissionError if the file (not following the symbolic links) is
+    not owned by the current user, or accessible by the others if `private`.
+    """
+    if not hasattr(_os, 'getuid'):
+        return
+    stat: _os.stat_result = _os.lstat(path)
+    if stat.st_uid != _os.getuid() or _stat.S_ISLNK(stat.st_mode) or \
+            (private and stat.st_mode & 0o077):
+        raise PermissionError(f'Not a private file of the current user: {path!r}')
+
+
+def request(argv: Sequence[str], cwd: Optional[str] = None,
+            socket_path: Optional[str] = None) -> Tuple[int, str, str]:
+    """
+    Send a request to the daemon and return its response.
+
+    Parameters
+    ----------
+    argv : sequence of str
+        The command-line arguments to be forwarded.
+
+    cwd : str, optional
+        The working directory to resolve relative paths against.
+        Defaults to the current working directory.
+
+    socket_path : str, optional
+        The path to the daemon socket. See `default_socket_path`.
+
+    Returns
+    -------
+    Tuple[int, str, str] :
+        The exit code, standard output and standard error of the request.
+
+    Raises
+    ------
+    OSError :
+        If no daemon is listening on the socket, if the socket is not owned
+        by the current user, or if the connection failed while exchanging
+        the request.
+
+    """
+    with _connect(socket_path) as sock:
+        return _exchange(sock, argv, cwd)
+
+
+def _connect(socket_path: Optional[str] = None) -> _socket.socket:
+    """
+    Return a socket connected to the daemon, raise OSError if none is listening
+    or if the socket is not owned by the current user (e.g., created by another
+    user in a shared directory).
+    """
+    socket_path = socket_path or default_socket_path()
+    _check_owner(socket_path)
+    sock: _socket.socket = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _exchange(sock: _socket.socket, argv: Sequence[str],
+              cwd: Optional[str] = None) -> Tuple[int, str, str]:
+    """Send the request through the connected socket, and return the response."""
+    payload: bytes = _json.dumps({
+        'argv': list(argv),
+        'cwd': cwd or _os.getcwd(),
+        'env': dict(_os.environ)  # Applied by the daemon for this request only
+    }).encode('utf-8')
+
+    sock.sendall(payload)
+    sock.shutdown(_socket.SHUT_WR)
+
+    chunks: list = []
+    while True:
+        chunk: bytes = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    response: Dict = _json.loads(b''.join(chunks).decode('utf-8'))
+    return response['code'], response['stdout'], response['stderr']
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Forward the command-line arguments to the daemon.
+
+    Parameters
+    ----------
+    argv : sequence of str, optional
+        The command-line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int :
+        The exit code of the request, 1 if the daemon failed to respond.
+
+    Notes
+    -----
+    The request is run in this process only if the daemon cannot be
+    connected. Once sent, the daemon may already have run the jobs, so
+    a failure to get the response is reported rather than run again.
+
+    """
+    argv = _sys.argv[1:] if argv is None else list(argv)
+
+    try:
+        sock: _socket.socket = _connect()
+    except (AttributeError, OSError):
+        # No daemon is available (or no Unix socket support), run it cold
+        if __package__ is None or __package__ == '':
+            _sys.path.insert(0, _os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+
+        from jmbuilder import _cli  # pylint: disable=import-outside-toplevel
+        return _cli.main(argv)
+
+    try:
+        with sock:
+            code, stdout, stderr = _exchange(sock, argv)
+    except (OSError, ValueError, KeyError) as exc:
+        _sys.stderr.write(f'jmbuilder: The daemon failed to respond: {exc}{_os.linesep}')
+        return 1
+
+    _sys.stdout.write(stdout)
+    _sys.stderr.write(stderr)
+    return code
+
+
+if __name__ == '__main__':
+    _sys.exit(main())
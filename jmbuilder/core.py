@@ -3,19 +3,32 @@
 Copyright (c) 2023-2024 Ryuu Mitsuki.
 """
 
+import io as _io
 import os as _os
+import types as _types
+import functools as _functools
+import itertools as _itertools
 import sys as _sys
 import re as _re
+import time as _time
+import shutil as _shutil
+import tempfile as _tempfile
 from datetime import datetime as _dt, timezone as _tz
-from typing import Dict, List, Optional, Union, TextIO
+from typing import (
+    Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set,
+    Tuple, Union, TextIO
+)
 from warnings import warn as __warn
-import bs4 as _bs4
 
-from . import utils as _jmutils
+from .utils import utils as _jmutils
 from . import exception as _jmexc
+from . import profiles as _profiles
+from . import placeholders as _placeholders
+from .profiler import PhaseTimer as _PhaseTimer, phase as _phase
+from .profiles import Activation, Profile
 
 try:
-    from ._globals import AUTHOR, VERSION, VERSION_INFO
+    from . import _globals
 except (ImportError, ModuleNotFoundError, ValueError):
     from pathlib import Path
 
@@ -23,12 +36,395 @@ except (ImportError, ModuleNotFoundError, ValueError):
     _sys.path.insert(0, str(Path(_sys.path[0]).parent))
     del Path
 
-    from jmbuilder._globals import AUTHOR, VERSION, VERSION_INFO
+    from jmbuilder import _globals
 
 CORE_ERR: _jmexc.JMException = _jmexc.JMException(
     _os.linesep + '  CORE ERROR: An error occurred in core module.')
 
-__all__ = ['PomParser', 'JMRepairer']
+__all__ = [
+    'Activation', 'Dependency', 'Developer', 'License', 'Parent', 'Plugin', 'PomModel', 'Profile',
+    'Query', 'compile_query', 'PomParser', 'JMRepairer', 'OutputChange'
+]
+
+# The group ID of plugins declared without one, as in Maven
+DEFAULT_PLUGIN_GROUP: str = 'org.apache.maven.plugins'
+
+# The size of the chunks read from an existing output file, while comparing
+# it against the rendered contents
+COMPARE_CHUNK_SIZE: int = 64 * 1024
+
+# The number of characters read at once by `JMRepairer.render_file`, and the maximum
+# length of a placeholder split across two chunks (a longer one is kept as is)
+RENDER_CHUNK_SIZE: int = 64 * 1024
+MAX_PLACEHOLDER: int = 1024
+
+# The placeholders of the text files, and the escaped ones (``\${`` for a literal ``${``)
+_TEXT_RE: _re.Pattern = _re.compile(r'\\(\$\{)|\$\{([\w.-\[\]]+)\}')
+_KEY_RE: _re.Pattern = _re.compile(r'\$\{([\w.-\[\]]+)\}')
+
+
+def _split_pending(text: str) -> int:
+    """
+    Return the index where the text may end with an incomplete placeholder
+    (or escape), to be completed by the next chunk. The length of the text
+    if none.
+    """
+    idx: int = text.rfind('$', max(0, len(text) - MAX_PLACEHOLDER))
+    if idx < 0 or '}' in text[idx:]:
+        idx = len(text)
+    # A backslash right before may escape the placeholder
+    return idx - 1 if idx > 0 and text[idx - 1] == '\\' else idx
+
+
+_PROPERTY_RE: _re.Pattern = _re.compile(r'\$\{([^}]+)\}')
+
+
+def _interpolate(value: Optional[str], props: Mapping[str, Optional[str]]) -> Optional[str]:
+    """Replace the ``${...}`` properties within the value, keeping the undefined ones."""
+    for _ in range(10):  # Properties may refer to other properties
+        if not value or '${' not in value:
+            break
+        resolved: str = _PROPERTY_RE.sub(
+            lambda match: match.group(0) if props.get(match.group(1)) is None
+            else props[match.group(1)], value)
+        if resolved == value:
+            break
+        value = resolved
+    return value
+
+# A step of the query: an element name (or '*', or quoted if containing dots)
+# followed by the predicates, then a dot or the end of query
+_STEP_RE: _re.Pattern = _re.compile(
+    r'(?:(?P<name>\*|[^.\[\]"]+)|"(?P<quoted>[^"]*)")(?P<preds>(?:\[[^\]]*\])*)(?P<dot>\.?)')
+_PREDICATE_RE: _re.Pattern = _re.compile(
+    r'\[\s*(?:(?P<index>-?\d+)|(?P<all>\*)|@(?P<attr>[\w:.-]+)'
+    r'(?:\s*=\s*(?P<quote>[\'"]?)(?P<value>.*?)(?P=quote))?)\s*\]')
+
+
+def _import_bs4():
+    """
+    Import and return the `bs4` module.
+
+    The `bs4` (and `lxml` as its XML backend) are heavy to import, therefore
+    they are imported only when a POM is actually being parsed instead of
+    at module load. Subsequent calls are cheap lookups into ``sys.modules``.
+
+    Returns
+    -------
+    module :
+        The `bs4` module.
+
+    """
+    import bs4  # pylint: disable=import-outside-toplevel
+    return bs4
+
+
+class Dependency(NamedTuple):
+    """
+    A dependency declared in the POM, with its version and scope filled
+    in from the ``<dependencyManagement>`` and its properties resolved.
+
+    """
+    group_id: Optional[str]
+    artifact_id: Optional[str]
+    version: Optional[str]
+    scope: Optional[str]
+    type: str = 'jar'
+    classifier: Optional[str] = None
+    optional: bool = False
+    exclusions: Tuple[Tuple[str, str], ...] = ()  # The (groupId, artifactId), may be '*'
+
+    @property
+    def key(self) -> str:
+        """Return the ``groupId:artifactId`` coordinates of this dependency."""
+        return f'{self.group_id}:{self.artifact_id}'
+
+
+class Plugin(NamedTuple):
+    """
+    A build plugin declared in the POM, with its version filled in from
+    the ``<pluginManagement>`` and its properties resolved.
+
+    """
+    group_id: str
+    artifact_id: Optional[str]
+    version: Optional[str]
+
+    @property
+    def key(self) -> str:
+        """Return the ``groupId:artifactId`` coordinates of this plugin."""
+        return f'{self.group_id}:{self.artifact_id}'
+
+
+class Developer(NamedTuple):
+    """A developer of the project."""
+    id: Optional[str] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    url: Optional[str] = None
+
+
+class License(NamedTuple):
+    """A license of the project."""
+    name: Optional[str] = None
+    url: Optional[str] = None
+    distribution: Optional[str] = None
+
+
+class Parent(NamedTuple):
+    """The parent declared in the POM."""
+    group_id: Optional[str]
+    artifact_id: Optional[str]
+    version: Optional[str]
+    relative_path: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Return the ``groupId:artifactId`` coordinates of the parent."""
+        return f'{self.group_id}:{self.artifact_id}'
+
+
+class PomModel(NamedTuple):
+    """
+    An immutable model of the values extracted from a POM, see `PomParser.to_model`.
+
+    Unlike `PomParser`, the model holds no reference to the parsed document,
+    which can be released right after the extraction. The model is accepted
+    by `JMRepairer` in place of a `PomParser`.
+
+    """
+    name: Optional[str]
+    version: Optional[str]
+    url: Optional[str]
+    group_id: Optional[str]
+    artifact_id: Optional[str]
+    inception_year: Optional[str]
+    parent: Optional[Parent]
+    developers: Tuple[Developer, ...]
+    licenses: Tuple[License, ...]
+    properties: Mapping[str, str]
+    modules: Tuple[str, ...]
+    dependencies: Tuple['Dependency', ...]
+    managed_dependencies: Tuple['Dependency', ...]
+    plugins: Tuple['Plugin', ...]
+    managed_plugins: Tuple['Plugin', ...]
+    profiles: Tuple[Profile, ...] = ()
+
+    def get_property(self, key: str) -> Optional[str]:
+        """Return the value of the specified property key, or None if not exist."""
+        return self.properties.get(key[11:] if key.startswith('properties.') else key)
+
+
+def _fields(tag: 'bs4.element.Tag') -> Dict[str, str]:
+    """Return the stripped texts of the direct child elements without elements, by their names."""
+    fields: Dict[str, str] = {}
+    for child in tag.contents:
+        if child.name is None:  # Skip the strings between the elements
+            continue
+        contents: list = child.contents
+        if len(contents) == 1 and contents[0].name is None:
+            text: str = contents[0]  # Faster than `get_text` for the usual elements
+        elif any(node.name is not None for node in contents):
+            continue  # Not a value, e.g., <exclusions>
+        else:
+            text = child.get_text()
+        fields[child.name] = text.strip()  # A plain string, not referencing the document
+    return fields
+
+
+def _dependency_fields(tag: 'bs4.element.Tag') -> Dict[str, Any]:
+    """Return the fields of the dependency, see `_fields`, along with its exclusions."""
+    fields: Dict[str, Any] = _fields(tag)
+    exclusions: Optional['bs4.element.Tag'] = tag.find('exclusions', recursive=False)
+    if exclusions:
+        fields['exclusions'] = tuple(
+            (excluded.get('groupId', '*'), excluded.get('artifactId', '*'))
+            for excluded in map(_fields, exclusions.find_all('exclusion', recursive=False)))
+    return fields
+
+
+class _Step(NamedTuple):
+    """A compiled step of `Query`."""
+    name: Optional[str]                           # None matches any element
+    attrs: Tuple[Tuple[str, Optional[str]], ...]  # None value matches any value
+    index: Optional[int]                          # None selects all matches
+
+    def matches(self, node: Any) -> bool:
+        """Return whether the node is an element matching the name and attributes."""
+        if node.name is None or (self.name is not None and node.name != self.name):
+            return False  # A string, or another element
+        return all(node.get(attr) is not None if value is None else node.get(attr) == value
+                   for attr, value in self.attrs)
+
+    def select(self, nodes: Iterable[Any]) -> Iterator['bs4.element.Tag']:
+        """Yield the matching elements among the nodes, or only the one at the index."""
+        name: Optional[str] = self.name
+        # Compare the names only (the strings are nameless) for the usual steps
+        matches: Iterator['bs4.element.Tag'] = filter(
+            self.matches if self.attrs or name is None else lambda node: node.name == name,
+            nodes)
+        if self.index is None:
+            return matches
+        if self.index >= 0:
+            return _itertools.islice(matches, self.index, self.index + 1)
+        found: List['bs4.element.Tag'] = list(matches)
+        return iter(found[self.index:][:1])
+
+
+class Query:
+    """
+    A compiled query, selecting the elements of a POM by their path.
+
+    A query is a dot-separated path of element names, where each name
+    may be followed by predicates::
+
+        project.developers.developer[*].email   # All developers' emails
+        licenses.license[1].name                # The second license's name
+        repositories.repository[-1].url         # The last repository's URL
+        build.plugins.plugin[@id].artifactId    # Plugins with an 'id' attribute
+        profiles.profile[@id='release'].*       # Elements with the given attribute
+        properties."package.mainClass"          # A name containing dots
+
+    An index selects one of the matching elements under each parent
+    (zero-based, or counted from the end if negative), ``[*]`` or no index
+    selects all of them, and ``*`` matches any element name.
+    A query starting with the root element (``project``) is a path from it,
+    otherwise the first step matches the elements anywhere in the document.
+    Each of the next steps only matches the direct children of the elements
+    matched by the previous step, so no level can be skipped: use
+    ``build.plugins.plugin``, not ``build.plugin``. Thus, ``project.name``
+    is the name of the project, never the name of a developer.
+
+    Use `compile_query` to create the queries, caching them by their string.
+
+    Parameters
+    ----------
+    query : str or tuple of str
+        The query string, or a tuple of literal element names.
+
+    Raises
+    ------
+    ValueError :
+        If the query string is invalid.
+
+    """
+
+    __slots__ = ('query', 'steps')
+
+    def __init__(self, query: Union[str, Tuple[str, ...]]) -> None:
+        """Create a new instance of ``Query`` class."""
+        self.query: Union[str, Tuple[str, ...]] = query
+        self.steps: Tuple[_Step, ...] = tuple(_Step(name, (), None) for name in query) \
+            if isinstance(query, tuple) else self.__compile(query)
+        if not self.steps:
+            raise ValueError('Query cannot be empty') from CORE_ERR
+
+    @staticmethod
+    def __compile(query: str) -> Tuple[_Step, ...]:
+        """Compile the query string into its steps."""
+        steps: List[_Step] = []
+        pos: int = 0
+        while pos < len(query):
+            step: Optional[_re.Match] = _STEP_RE.match(query, pos)
+            preds: List[_re.Match] = list(_PREDICATE_RE.finditer(step['preds'])) if step else []
+            if not step or sum(len(pred[0]) for pred in preds) != len(step['preds']) or \
+                    (step['dot'] and step.end() == len(query)):
+                raise ValueError(f'Invalid query at position {pos}: {query!r}') from CORE_ERR
+
+            index: Optional[int] = None
+            attrs: List[Tuple[str, Optional[str]]] = []
+            for pred in preds:
+                if pred['attr']:
+                    attrs.append((pred['attr'], pred['value']))
+                elif pred['index']:
+                    index = int(pred['index'])
+                else:
+                    index = None
+            name: Optional[str] = step['quoted'] if step['name'] is None else step['name'].strip()
+            steps.append(_Step(None if name == '*' else name, tuple(attrs), index))
+            pos = step.end()
+        return tuple(steps)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.query!r})'
+
+    def select(self, root: Any) -> Iterator['bs4.element.Tag']:
+        """
+        Lazily select the elements matching this query, in a single walk.
+
+        Parameters
+        ----------
+        root : BeautifulSoup or Tag
+            The document, or the element to be queried.
+
+        Returns
+        -------
+        iterator of Tag :
+            The matching elements, in document order.
+
+        """
+        first: _Step = self.steps[0]
+        top: Optional['bs4.element.Tag'] = next(
+            (node for node in root.contents if node.name is not None), None) \
+            if root.name == '[document]' else None
+        nodes: Iterator['bs4.element.Tag'] = first.select(
+            (top,) if top is not None and first.matches(top) else root.descendants)
+        for step in self.steps[1:]:
+            # Bind the step now, the chained generators are consumed later
+            nodes = _itertools.chain.from_iterable(
+                map(step.select, (node.contents for node in nodes)))
+        return nodes
+
+
+@_functools.lru_cache(maxsize=512)
+def compile_query(query: Union[str, Tuple[str, ...]]) -> Query:
+    """
+    Compile the query, or return the cached one compiled from the same query.
+
+    Parameters
+    ----------
+    query : str or tuple of str
+        The query string, or a tuple of literal element names.
+        See `Query` for the syntax.
+
+    Returns
+    -------
+    Query :
+        The compiled query.
+
+    Raises
+    ------
+    ValueError :
+        If the query string is invalid.
+
+    """
+    return Query(query)
+
+
+@_functools.lru_cache(maxsize=256)
+def _cached_pom(path: str, mtime: int, size: int) -> Tuple['PomModel', Dict[str, tuple]]:
+    """
+    Parse the POM file and return its model, along with the fields of its
+    managed dependencies and plugins as declared (i.e., not interpolated),
+    cached per file version.
+    """
+    # pylint: disable=unused-argument
+    pom: PomParser = PomParser.parse(path)
+    return pom.to_model(), {
+        'managed_dependencies': tuple(_dependency_fields(tag) for tag in pom.select(
+            'project.dependencyManagement.dependencies.dependency')),
+        'managed_plugins': tuple(_fields(tag) for tag in pom.select(
+            'project.build.pluginManagement.plugins.plugin'))
+    }
+
+
+def _load_pom(path: str) -> Optional[Tuple['PomModel', Dict[str, tuple]]]:
+    """Return the model and managed fields of the POM file, or None if not exist."""
+    if not _os.path.isfile(path):
+        return None
+    stat: _os.stat_result = _os.stat(path)
+    return _cached_pom(_os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+
 
 class PomParser:
     """
@@ -40,20 +436,36 @@ class PomParser:
     soup : BeautifulSoup
         A `bs4.BeautifulSoup` object representing the parsed POM file.
 
+    path : str, optional
+        The path to the POM file, used to find the parent by its relative path.
+
+    repository : LocalRepository, optional
+        The local repository to resolve the parents and imported BOMs from,
+        see `jmbuilder.repository.LocalRepository`. If specified, the properties,
+        managed dependencies and managed plugins are inherited from the parents
+        (and the imported BOMs) when filling in the dependencies and plugins.
+
     """
 
-    def __init__(self, soup: _bs4.BeautifulSoup) -> 'PomParser':
+    def __init__(self, soup: 'bs4.BeautifulSoup', *, path: Optional[str] = None,
+                 repository: Optional['LocalRepository'] = None) -> 'PomParser':
         """Create a new instance of ``PomParser`` class."""
+        _bs4 = _import_bs4()
         if not isinstance(soup, _bs4.BeautifulSoup):
             # Raise an error
             raise TypeError(f'Invalid instance class: {soup.__class__}') \
                 from CORE_ERR
 
-        self.soup: _bs4.BeautifulSoup = soup
-        self.project_tag: _bs4.element.Tag = soup.find('project')
+        self.soup: 'bs4.BeautifulSoup' = soup
+        self.project_tag: 'bs4.element.Tag' = soup.find('project')
+        self.path: Optional[str] = path
+        self.repository: Optional['LocalRepository'] = repository
+        self.__sections: Optional[Dict[str, tuple]] = None
+        self.__parents: Optional[Tuple[Tuple[PomModel, Dict[str, tuple]], ...]] = None
 
     @staticmethod
-    def parse(pom_file: str, encoding: str = 'UTF-8') -> 'PomParser':
+    def parse(pom_file: str, encoding: str = 'UTF-8', *,
+              repository: Optional['LocalRepository'] = None) -> 'PomParser':
         """
         Parse the POM file (``pom.xml``) and return an instance of
         this class. Remove comments and blank lines to keep the POM clean.
@@ -66,6 +478,9 @@ class PomParser:
         encoding : str, optional
             The encoding used while parsing the pom.xml file. Defaults to UTF-8.
 
+        repository : LocalRepository, optional
+            The local repository to resolve the parents and imported BOMs from.
+
         Returns
         -------
         PomParser :
@@ -73,19 +488,21 @@ class PomParser:
 
         """
 
+        _bs4 = _import_bs4()
         try:
-            # Read and convert the pom.xml file to BeautifulSoup object
-            soup: _bs4.BeautifulSoup = _bs4.BeautifulSoup(
-                ''.join(_jmutils.readfile(pom_file, encoding=encoding)), 'xml')
-
-            # Find the comments using lambda, then extract them
-            for element in soup(text=lambda t: isinstance(t, _bs4.Comment)):
-                element.extract()
+            with _phase('parse', pom_file):
+                # Read and convert the pom.xml file to BeautifulSoup object
+                soup: 'bs4.BeautifulSoup' = _bs4.BeautifulSoup(
+                    ''.join(_jmutils.readfile(pom_file, encoding=encoding)), 'xml')
+
+                # Find the comments using lambda, then extract them
+                for element in soup(text=lambda t: isinstance(t, _bs4.Comment)):
+                    element.extract()
         except Exception as exc:
             raise exc from CORE_ERR
 
         # Return the instance of this class
-        return PomParser(soup)
+        return PomParser(soup, path=_os.path.abspath(pom_file), repository=repository)
 
     def printsoup(self, *, pretty: bool = True, file: TextIO = _sys.stdout) -> None:
         """
@@ -120,13 +537,18 @@ class PomParser:
         """
         print(self.soup.prettify() if pretty else str(self.soup).strip(), file=file)
 
-    def get(self, key: Union[str, List[str]]) -> Optional[_bs4.element.Tag]:
+    def get(self, key: Union[str, List[str]]) -> Optional['bs4.element.Tag']:
         """
-        Find the element tag based on the provided key, which can be a string
-        (separated by dots) or a list of tag names. The result could be a None,
+        Find the element tag based on the provided key, which can be a query
+        string (see `Query`) or a list of tag names. The result could be a None,
         this means that element are undefined or the users has specified wrong
         element tree path.
 
+        Only the first name of the key is searched through the whole document,
+        each of the next names is a direct child of the previous element (e.g.,
+        ``'developers.developer.name'``), unlike the former lookup, which
+        searched all the descendants of the previous element.
+
         Parameters
         ----------
         key : str or a list of str
@@ -135,39 +557,60 @@ class PomParser:
         Returns
         -------
         Tag or None :
-            A ``bs4.element.Tag`` object representing the desired element tag,
-            or ``None`` if the element tag is undefined or cannot be found.
+            A ``bs4.element.Tag`` object representing the first matching element
+            tag, or ``None`` if the element tag is undefined or cannot be found.
+
+        Raises
+        ------
+        ValueError :
+            If the key is an invalid query string.
 
         """
+        return next(self.select(key), None)
 
-        # Split the key if the key is a string
-        keys: List[str] = key.split('.') if isinstance(key, str) else key
+    def get_all(self, key: Union[str, List[str]]) -> List['bs4.element.Tag']:
+        """
+        Find all element tags matching the provided key, like `get`.
 
-        # Find the element according to the first key
-        result: _bs4.element.Tag = self.soup.find(keys[0])
-        for k in keys[1:]:
-            # Break the loop if the result is None
-            if not result:
-                break
-            result = result.find(k)
+        Parameters
+        ----------
+        key : str or a list of str
+            The key representing the element tree path, such as
+            ``'project.developers.developer[*].email'``.
 
-        return result
+        Returns
+        -------
+        list of Tag :
+            The matching element tags, in document order.
+
+        Raises
+        ------
+        ValueError :
+            If the key is an invalid query string.
+
+        """
+        return list(self.select(key))
+
+    def select(self, key: Union[str, List[str]]) -> Iterator['bs4.element.Tag']:
+        """Lazily select the element tags matching the provided key, see `get_all`."""
+        # The compiled queries are cached, keyed by their strings (or names)
+        return compile_query(key if isinstance(key, str) else tuple(key)).select(self.soup)
 
     def get_name(self) -> Optional[str]:
         """Return the project name."""
         # => project.name
-        name_element: _bs4.element.Tag = self.project_tag.find('name')
+        name_element: 'bs4.element.Tag' = self.project_tag.find('name')
         return name_element.text if name_element else name_element
 
     def get_version(self) -> Optional[str]:
         """Return the project version."""
         # => project.version
-        version_element: _bs4.element.Tag = self.project_tag.find('version')
+        version_element: 'bs4.element.Tag' = self.project_tag.find('version')
         return version_element.text if version_element else version_element
 
     def get_id(self) -> Dict[str, Optional[str]]:
         """Return a dictionary with 'groupId' and 'artifactId'."""
-        id_element: List[Optional[_bs4.element.Tag]] = [
+        id_element: List[Optional['bs4.element.Tag']] = [
             self.project_tag.find('groupId'),    # => project.groupId
             self.project_tag.find('artifactId')  # => project.artifactId
         ]
@@ -180,19 +623,19 @@ class PomParser:
     def get_url(self) -> Optional[str]:
         """Return the project URL."""
         # => project.url
-        url_element: _bs4.element.Tag = self.project_tag.find('url')
+        url_element: 'bs4.element.Tag' = self.project_tag.find('url')
         return url_element.text if url_element else url_element
 
     def get_inception_year(self) -> Optional[str]:
         """Return the project inception year."""
         # => project.inceptionYear
-        inc_year_element: _bs4.element.Tag = self.project_tag.find('inceptionYear')
+        inc_year_element: 'bs4.element.Tag' = self.project_tag.find('inceptionYear')
         return inc_year_element.text if inc_year_element else inc_year_element
 
     def get_author(self) -> Dict[str, Optional[str]]:
         """Return a dictionary with 'id', 'name', and 'url' of the project author."""
         key: str = 'project.developers.developer'
-        author_element: List[Optional[_bs4.element.Tag]] = [
+        author_element: List[Optional['bs4.element.Tag']] = [
             self.get(key + '.id'),    # => project.developers[0].developer.id
             self.get(key + '.name'),  # => project.developers[0].developer.name
             self.get(key + '.url')    # => project.developers[0].developer.url
@@ -207,7 +650,7 @@ class PomParser:
     def get_license(self) -> Dict[str, str]:
         """Return a dictionary with 'name', 'url', and 'distribution' of the project license."""
         key: str = 'project.licenses.license'
-        license_element: List[Optional[_bs4.element.Tag]] = [
+        license_element: List[Optional['bs4.element.Tag']] = [
             self.get(key + '.name'),         # => project.licenses[0].license.name
             self.get(key + '.url'),          # => project.licenses[0].license.url
             self.get(key + '.distribution')  # => project.licenses[0].license.distribution
@@ -257,9 +700,357 @@ class PomParser:
             keys.insert(0, 'properties')  # Append to the first index
 
         # This way, we can prevent an error due to NoneType use
-        result: _bs4.element.Tag = self.get(keys)
+        result: 'bs4.element.Tag' = self.get(keys)
         return result.text if result else result
 
+    def __locate_parent(self, parent: Parent, basedir: Optional[str]
+                        ) -> Optional[Tuple[str, Tuple[PomModel, Dict[str, tuple]]]]:
+        """Find the parent by its relative path, then in the repository."""
+        if basedir is not None and parent.relative_path != '':
+            path: str = _os.path.join(basedir, parent.relative_path or '..')
+            if _os.path.isdir(path):
+                path = _os.path.join(path, 'pom.xml')
+            loaded: Optional[Tuple[PomModel, Dict[str, tuple]]] = _load_pom(path)
+            # The POM at the relative path may be another project, as in Maven
+            if loaded is not None and (loaded[0].group_id, loaded[0].artifact_id) == \
+                    (parent.group_id, parent.artifact_id) and \
+                    parent.version in (None, loaded[0].version):
+                return path, loaded
+
+        found: Optional[str] = self.repository.find(
+            parent.group_id, parent.artifact_id, parent.version) \
+            if self.repository is not None and parent.version else None
+        loaded = _load_pom(found) if found else None
+        return (found, loaded) if loaded is not None else None
+
+    def get_parents(self) -> Tuple[PomModel, ...]:
+        """
+        Return the models of the parents, from the nearest to the farthest.
+
+        Each parent is looked up by its ``<relativePath>`` (``../pom.xml``
+        by default) if this POM was parsed from a file, then in the local
+        repository if any. The lookup stops at the first parent not found.
+
+        Returns
+        -------
+        tuple of PomModel :
+            The models of the parents found, parsed only once per file.
+
+        """
+        return tuple(model for model, _ in self.__get_parents())
+
+    def __get_parents(self) -> Tuple[Tuple[PomModel, Dict[str, tuple]], ...]:
+        """Return the models of the parents along with their managed fields, see `_load_pom`."""
+        if self.__parents is not None:
+            return self.__parents
+
+        tag: Optional['bs4.element.Tag'] = self.get('project.parent')
+        fields: Dict[str, str] = _fields(tag) if tag else {}
+        parent: Optional[Parent] = Parent(
+            fields.get('groupId'), fields.get('artifactId'), fields.get('version'),
+            fields.get('relativePath')) if fields else None
+        basedir: Optional[str] = _os.path.dirname(self.path) if self.path else None
+        parents: List[Tuple[PomModel, Dict[str, tuple]]] = []
+        seen: Set[tuple] = set()
+        while parent is not None and parent[:3] not in seen:
+            seen.add(parent[:3])
+            located: Optional[Tuple[str, Tuple[PomModel, Dict[str, tuple]]]] = \
+                self.__locate_parent(parent, basedir)
+            if located is None:
+                break
+            parents.append(located[1])
+            parent, basedir = located[1][0].parent, _os.path.dirname(located[0])
+
+        self.__parents = tuple(parents)
+        return self.__parents
+
+    def __imports(self, managed: Iterable[Dependency]) -> List[Dependency]:
+        """
+        Replace the imported BOMs (``<scope>import</scope>``) of the managed
+        dependencies with their own managed dependencies, recursively.
+        """
+        result: List[Dependency] = []
+        seen: Set[tuple] = set()
+        pending: List[Dependency] = list(managed)
+        pending.reverse()
+        while pending:
+            dep: Dependency = pending.pop()
+            if dep.scope != 'import' or dep.type != 'pom':
+                result.append(dep)
+                continue
+            if self.repository is None or (dep.group_id, dep.artifact_id) in seen:
+                continue
+            seen.add((dep.group_id, dep.artifact_id))
+            path: Optional[str] = self.repository.find(
+                dep.group_id, dep.artifact_id, dep.version) if dep.version else None
+            loaded: Optional[Tuple[PomModel, Dict[str, tuple]]] = \
+                _load_pom(path) if path else None
+            if loaded is not None:
+                # Keep the order of the declarations, the first one wins
+                pending.extend(reversed(loaded[0].managed_dependencies))
+        return result
+
+    def __index(self) -> Dict[str, tuple]:
+        """
+        Collect the dependencies, managed dependencies and plugins in a single
+        traversal of the POM, then fill in their versions (and scopes) from the
+        managed ones indexed by their coordinates, and resolve their properties.
+        The result is cached, the POM is traversed only on the first call.
+        """
+        if self.__sections is not None:
+            return self.__sections
+
+        # The properties are inherited from the farthest parent first
+        parents: Tuple[Tuple[PomModel, Dict[str, tuple]], ...] = \
+            self.__get_parents() if self.repository is not None else ()
+        props: Dict[str, str] = {}
+        for model, _ in reversed(parents):
+            props.update(model.properties)
+        raw: Dict[str, List[Dict[str, Any]]] = {
+            'dependencies': [], 'managed_dependencies': [], 'plugins': [], 'managed_plugins': []
+        }
+
+        def collect(section: str, tag: 'Optional[bs4.element.Tag]', name: str) -> None:
+            if tag:
+                extract: 'Callable[[Any], Dict[str, Any]]' = \
+                    _dependency_fields if name == 'dependency' else _fields
+                raw[section].extend(extract(item) for item in tag.contents if item.name == name)
+
+        for child in (self.project_tag.contents if self.project_tag else ()):
+            if child.name == 'properties':
+                props.update(_fields(child))
+            elif child.name in ('groupId', 'artifactId', 'version'):
+                props[f'project.{child.name}'] = child.text.strip()
+            elif child.name == 'parent':
+                props.update((f'project.parent.{name}', value)
+                             for name, value in _fields(child).items())
+            elif child.name == 'dependencies':
+                collect('dependencies', child, 'dependency')
+            elif child.name == 'dependencyManagement':
+                collect('managed_dependencies',
+                        child.find('dependencies', recursive=False), 'dependency')
+            elif child.name == 'build':
+                for section in child.find_all(('plugins', 'pluginManagement'), recursive=False):
+                    if section.name == 'plugins':
+                        collect('plugins', section, 'plugin')
+                    else:
+                        collect('managed_plugins',
+                                section.find('plugins', recursive=False), 'plugin')
+
+        # Inherit the coordinates from the parent, as in Maven
+        for name in ('groupId', 'version'):
+            if f'project.{name}' not in props and f'project.parent.{name}' in props:
+                props[f'project.{name}'] = props[f'project.parent.{name}']
+
+        def resolve(value: 'Optional[str]') -> 'Optional[str]':
+            return _interpolate(value, props)
+
+        def dependency(fields: 'Dict[str, Any]',
+                       managed: 'Dict[tuple, Dependency]') -> Dependency:
+            dep_type: str = resolve(fields.get('type')) or 'jar'
+            classifier: Optional[str] = resolve(fields.get('classifier')) or None
+            group_id: Optional[str] = resolve(fields.get('groupId'))
+            artifact_id: Optional[str] = resolve(fields.get('artifactId'))
+            base: Optional[Dependency] = managed.get((group_id, artifact_id, dep_type, classifier))
+            return Dependency(
+                group_id=group_id,
+                artifact_id=artifact_id,
+                version=resolve(fields.get('version')) or (base.version if base else None),
+                scope=resolve(fields.get('scope')) or (base.scope if base else None),
+                type=dep_type,
+                classifier=classifier,
+                optional=(resolve(fields.get('optional')) or '').lower() == 'true',
+                exclusions=tuple((resolve(group), resolve(artifact))
+                                 for group, artifact in fields.get('exclusions', ())) +
+                (base.exclusions if base else ())
+            )
+
+        def plugin(fields: 'Dict[str, str]', managed: 'Dict[tuple, Plugin]') -> Plugin:
+            group_id: str = resolve(fields.get('groupId')) or DEFAULT_PLUGIN_GROUP
+            artifact_id: Optional[str] = resolve(fields.get('artifactId'))
+            base: Optional[Plugin] = managed.get((group_id, artifact_id))
+            return Plugin(group_id, artifact_id,
+                          resolve(fields.get('version')) or (base.version if base else None))
+
+        managed_deps: Tuple[Dependency, ...] = tuple(
+            dependency(fields, {}) for fields in raw['managed_dependencies'])
+        managed_plugins: Tuple[Plugin, ...] = tuple(
+            plugin(fields, {}) for fields in raw['managed_plugins'])
+        # The declarations of the POM win over the inherited ones, which are
+        # interpolated with the properties of the POM as well, as in Maven
+        deps_index: Dict[tuple, Dependency] = {
+            (dep.group_id, dep.artifact_id, dep.type, dep.classifier): dep
+            for dep in reversed(self.__imports(managed_deps + tuple(
+                dependency(fields, {}) for _, inherited in parents
+                for fields in inherited['managed_dependencies'])))
+        }  # The first declaration wins
+        plugins_index: Dict[tuple, Plugin] = {
+            (item.group_id, item.artifact_id): item
+            for item in reversed(managed_plugins + tuple(
+                plugin(fields, {}) for _, inherited in parents
+                for fields in inherited['managed_plugins']))
+        }
+
+        self.__sections = {
+            'dependencies': tuple(dependency(fields, deps_index)
+                                  for fields in raw['dependencies']),
+            'managed_dependencies': managed_deps,
+            'plugins': tuple(plugin(fields, plugins_index) for fields in raw['plugins']),
+            'managed_plugins': managed_plugins
+        }
+        return self.__sections
+
+    def to_model(self, *, full: bool = True) -> PomModel:
+        """
+        Extract the values and collections used by `JMBuilder` into an immutable model.
+
+        The model only holds plain strings and tuples, so the parsed document
+        (and this instance) can be released once the model is created, which
+        greatly reduces the memory retained for each POM.
+
+        Parameters
+        ----------
+        full : bool, optional
+            Whether to extract the modules, dependencies and plugins. If false,
+            they are left empty, only the values needed to render the templates
+            are extracted (see `JMRepairer`). Defaults to True.
+
+        Returns
+        -------
+        PomModel :
+            The model of this POM.
+
+        """
+        # The direct children only, unlike `get_id` and the like, which may find
+        # the elements of the parent or the developers (e.g., their names)
+        project: Dict[str, str] = _fields(self.project_tag) if self.project_tag else {}
+        parent: Optional['bs4.element.Tag'] = self.get('project.parent')
+        properties: Optional['bs4.element.Tag'] = self.get('properties')
+        parent_fields: Dict[str, str] = _fields(parent) if parent else {}
+        records: Dict[str, tuple] = {}
+        for record, query in ((Developer, 'project.developers.developer'),
+                              (License, 'project.licenses.license')):
+            records[record.__name__] = tuple(
+                record(**{key: value for key, value in _fields(tag).items()
+                          if key in record._fields})
+                for tag in self.select(query))
+
+        return PomModel(
+            name=project.get('name'),
+            # Inherit the group ID and version from the parent, as in Maven
+            version=project.get('version', parent_fields.get('version')),
+            url=project.get('url'),
+            group_id=project.get('groupId', parent_fields.get('groupId')),
+            artifact_id=project.get('artifactId'),
+            inception_year=project.get('inceptionYear'),
+            parent=Parent(
+                parent_fields.get('groupId'), parent_fields.get('artifactId'),
+                parent_fields.get('version'), parent_fields.get('relativePath')
+            ) if parent else None,
+            developers=records['Developer'],
+            licenses=records['License'],
+            properties=_types.MappingProxyType(_fields(properties) if properties else {}),
+            modules=tuple(tag.text.strip() for tag in self.select('project.modules.module'))
+            if full else (),
+            dependencies=self.get_dependencies() if full else (),
+            managed_dependencies=self.get_managed_dependencies() if full else (),
+            plugins=self.get_plugins() if full else (),
+            managed_plugins=self.get_plugins(managed=True) if full else (),
+            profiles=tuple(self.__profile(tag) for tag in self.select('project.profiles.profile'))
+        )
+
+    @staticmethod
+    def __profile(tag: 'bs4.element.Tag') -> Profile:
+        """Extract the profile from its element."""
+        activation: Dict[str, str] = {}
+        properties: Optional['bs4.element.Tag'] = tag.find('properties', recursive=False)
+        activation_tag: Optional['bs4.element.Tag'] = tag.find('activation', recursive=False)
+        if activation_tag:
+            activation = _fields(activation_tag)
+            for name in ('os', 'property', 'file'):
+                condition: Optional['bs4.element.Tag'] = activation_tag.find(
+                    name, recursive=False)
+                if condition:
+                    activation.update((f'{name}.{key}', value)
+                                      for key, value in _fields(condition).items())
+
+        return Profile(
+            id=_fields(tag).get('id', 'default'),
+            activation=Activation(
+                active_by_default=activation.get('activeByDefault', '').lower() == 'true',
+                jdk=activation.get('jdk'),
+                os_family=activation.get('os.family'),
+                os_name=activation.get('os.name'),
+                os_arch=activation.get('os.arch'),
+                os_version=activation.get('os.version'),
+                property_name=activation.get('property.name'),
+                property_value=activation.get('property.value'),
+                file_exists=activation.get('file.exists'),
+                file_missing=activation.get('file.missing')
+            ),
+            properties=_types.MappingProxyType(_fields(properties) if properties else {})
+        )
+
+    def get_dependencies(self) -> Tuple[Dependency, ...]:
+        """
+        Return the dependencies of the project.
+
+        The versions and scopes not declared are filled in from the
+        ``<dependencyManagement>`` of the POM, and the ``${...}`` properties
+        are resolved from the POM properties and the project coordinates.
+
+        Returns
+        -------
+        tuple of Dependency :
+            The dependencies, in the order of their declaration.
+
+        """
+        return self.__index()['dependencies']
+
+    def get_managed_dependencies(self) -> Tuple[Dependency, ...]:
+        """Return the dependencies declared in the ``<dependencyManagement>``."""
+        return self.__index()['managed_dependencies']
+
+    def get_plugins(self, *, managed: bool = False) -> Tuple[Plugin, ...]:
+        """
+        Return the build plugins of the project.
+
+        Parameters
+        ----------
+        managed : bool, optional
+            If True, return the plugins declared in the ``<pluginManagement>``
+            instead. Defaults to False.
+
+        Returns
+        -------
+        tuple of Plugin :
+            The plugins, in the order of their declaration, with the versions not
+            declared filled in from the ``<pluginManagement>``.
+
+        """
+        return self.__index()['managed_plugins' if managed else 'plugins']
+
+
+class OutputChange(NamedTuple):
+    """
+    The change of an output file rendered by `JMRepairer`.
+
+    The `status` is either ``'added'`` (the file did not exist), ``'modified'``
+    or ``'unchanged'``. The `data` is the rendered contents, written to the
+    file unless rendered in a dry run. The outputs streamed by
+    `JMRepairer.render_file` are not kept in memory, their `data` is empty
+    unless changed in a dry run.
+
+    """
+    path: str
+    status: str
+    data: bytes
+
+    @property
+    def changed(self) -> bool:
+        """Return whether the output file was (or would be) changed."""
+        return self.status != 'unchanged'
+
 
 class JMRepairer:
     """
@@ -268,9 +1059,29 @@ class JMRepairer:
 
     Parameters
     ----------
-    pom : str, PomParser, or _bs4.BeautifulSoup
+    pom : str, PomParser, PomModel, or bs4.BeautifulSoup
         The POM file, either as a path (str), a `PomParser` instance,
-        or a `BeautifulSoup` object.
+        a `PomModel` instance, or a `BeautifulSoup` object.
+
+    profiles : iterable of str, optional
+        The IDs of profiles to be activated, or deactivated if prefixed with
+        ``!`` or ``-`` (i.e., Maven's ``-P``). The other profiles are activated
+        by their ``<activation>``, see `jmbuilder.profiles`.
+
+    properties : mapping, optional
+        The user properties (i.e., Maven's ``-D``), overriding the properties
+        of the POM and its active profiles.
+
+    basedir : str, optional
+        The directory of the POM, to resolve the files of profile activations
+        and the plug-in placeholders (e.g., ``${git.commit}``). Defaults to the
+        directory of the POM file if given by its path, otherwise the current
+        working directory.
+
+    placeholders : Placeholders, optional
+        The plug-in placeholders of the keys not found in the POM, see
+        `jmbuilder.placeholders`. Share an instance to evaluate each of them
+        only once per run. Defaults to new placeholders of this instance.
 
     Raises
     ------
@@ -279,7 +1090,7 @@ class JMRepairer:
 
     TypeError
         If the type of 'pom' argument is unknown, neither of str,
-        a `PomParser` instance, nor a `BeautifulSoup` object.
+        a `PomParser` instance, a `PomModel` instance, nor a `BeautifulSoup` object.
 
     Attributes
     ----------
@@ -287,89 +1098,440 @@ class JMRepairer:
         Regular expression pattern for extracting values from curly
         braces in strings.
 
-    _soup : PomParser
-        Instance of `PomParser` representing the parsed POM file.
+    _model : PomModel
+        Instance of `PomModel` representing the parsed POM file. The parsed
+        document itself is not kept, a POM given by its path is released
+        right after its model is extracted. Unless given as a model, its
+        modules, dependencies and plugins are not extracted (i.e., empty).
 
     _pom_items : Dict[str, str (could possibly None)]
-        Dictionary containing key-value pairs extracted from the POM file.
+        Dictionary containing key-value pairs extracted from the POM file,
+        including the properties merged with the active profiles and the
+        user properties.
+
+    Notes
+    -----
+    Each instance collects the metrics of its own work (see `stats`),
+    the collection is always enabled as it only costs a few additions
+    per file.
 
     """
 
-    def __init__(self, pom: Union[str, PomParser, _bs4.BeautifulSoup]) -> 'JMRepairer':
+    # The names of counters collected by each instance, see `stats`
+    COUNTERS: tuple = (
+        'placeholders_seen', 'placeholders_resolved', 'placeholders_unresolved',
+        'bytes_read', 'bytes_written', 'files_written', 'files_skipped'
+    )
+
+    def __init__(self, pom: Union[str, PomParser, PomModel, 'bs4.BeautifulSoup'], *,
+                 profiles: Iterable[str] = (), properties: Optional[Mapping[str, str]] = None,
+                 basedir: Optional[str] = None,
+                 placeholders: Optional['_placeholders.Placeholders'] = None) -> 'JMRepairer':
         """Create a new instance of this class."""
         if not pom:
             raise ValueError("Argument 'pom' cannot be empty") \
                 from CORE_ERR
 
-        if not isinstance(pom, (str, PomParser, _bs4.BeautifulSoup)):
+        # Check the model first, avoid importing `bs4` if not needed
+        _bs4 = _import_bs4() if not isinstance(pom, PomModel) else None
+        if _bs4 and not isinstance(pom, (str, PomParser, _bs4.BeautifulSoup)):
             raise TypeError(f"Unknown type of 'pom' argument: {type(pom).__name__}") \
                 from CORE_ERR
 
         self._val_pattern: _re.Pattern = _re.compile(r'\$\{([\w.-\[\]]+)\}')
-        self._soup: PomParser = None
+        self.__timer: _PhaseTimer = _PhaseTimer()
+        self.__counters: Dict[str, int] = dict.fromkeys(self.COUNTERS, 0)
+        self.__keys: Set[str] = set()
+        self.__chunk: str = ''  # The chunk being substituted, see `__stream`
+        self.__found: Dict[str, Optional[str]] = {}  # The keys looked up in the placeholders
 
         if isinstance(pom, str):
-            self._soup = PomParser.parse(pom)  # Need to be parsed first
-        elif isinstance(pom, _bs4.BeautifulSoup):
-            self._soup = PomParser(pom)        # Pass directly to the constructor
-        elif isinstance(pom, PomParser):
-            self._soup = pom                   # Already an instance of PomParser
-
-        project_id: Dict[str, Optional[str]] = self._soup.get_id()
-        project_author: Dict[str, Optional[str]] = self._soup.get_author()
-        project_license: Dict[str, Optional[str]] = self._soup.get_license()
-
-        self._pom_items: Dict[str, Optional[str]] = {
-            'project.name': self._soup.get_name(),
-            'project.version': self._soup.get_version(),
-            'project.url': self._soup.get_url(),
-            'project.groupId': project_id['groupId'],
-            'project.artifactId': project_id['artifactId'],
-            'project.inceptionYear': self._soup.get_inception_year(),
-            'project.developers[0].name': project_author['name'],
-            'project.developers[0].url': project_author['url'],
-            'project.licenses[0].name': project_license['name'],
-            'project.licenses[0].url': project_license['url'],
-            'package.licenseFile': self._soup.get_property('package.licenseFile', dot=False),
-            'package.mainClass': self._soup.get_property('package.mainClass', dot=False),
-            'maven.build.timestamp': _dt.now(_tz.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-        }
+            start: float = _time.perf_counter()
+            path: str = pom
+            pom = PomParser.parse(path)  # Need to be parsed first
+            self.__timer('parse', start, _time.perf_counter(), path)
+            basedir = basedir or _os.path.dirname(_os.path.abspath(path))
+        elif _bs4 and isinstance(pom, _bs4.BeautifulSoup):
+            pom = PomParser(pom)         # Pass directly to the constructor
+
+        self.__basedir: str = basedir or _os.getcwd()
+        self.__placeholders: _placeholders.Placeholders = \
+            placeholders if placeholders is not None else _placeholders.Placeholders()
+
+        with _phase('index', recorder=self.__timer):
+            # Only the values rendered, not the dependencies and plugins
+            self._model: PomModel = pom if isinstance(pom, PomModel) \
+                else pom.to_model(full=False)
+            del pom  # Release the parsed document, if not referenced elsewhere
+
+            model: PomModel = self._model
+            author: Developer = model.developers[0] if model.developers else Developer()
+            license_: License = model.licenses[0] if model.licenses else License()
+            # Cached per model, active profiles and user properties
+            merged: Mapping[str, str] = _profiles.resolve_properties(
+                model, profiles, properties, self.__basedir)
+            items: Dict[str, Optional[str]] = {
+                'project.name': model.name,
+                'project.version': model.version,
+                'project.url': model.url,
+                'project.groupId': model.group_id,
+                'project.artifactId': model.artifact_id,
+                'project.inceptionYear': model.inception_year,
+                'project.developers[0].name': author.name,
+                'project.developers[0].url': author.url,
+                'project.licenses[0].name': license_.name,
+                'project.licenses[0].url': license_.url,
+                'maven.build.timestamp': _dt.now(_tz.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            }
+            # The project values take precedence, the properties may refer to them
+            self._pom_items: Dict[str, Optional[str]] = {**merged, **items}
+            for key, value in merged.items():
+                if key not in items and value and '${' in value:
+                    self._pom_items[key] = _interpolate(value, self._pom_items)
+
+    @staticmethod
+    def __read_source(source: Union[str, bytes, BinaryIO, TextIO],
+                      encoding: str) -> _jmutils.JMProperties:
+        """
+        Parse the given in-memory source as properties.
+
+        Parameters
+        ----------
+        source : str, bytes, or a file-like object
+            The source contents, either as a string, bytes, or a file-like
+            object opened in text or binary mode.
+
+        encoding : str
+            The encoding used to decode the bytes.
+
+        Returns
+        -------
+        JMProperties :
+            The parsed properties.
+
+        """
+        if hasattr(source, 'read'):
+            source = source.read()
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = bytes(source).decode(encoding)
+
+        if not isinstance(source, str):
+            raise TypeError(f"Unknown type of 'source' argument: {type(source).__name__}") \
+                from CORE_ERR
+
+        return _jmutils.JMProperties(_io.StringIO(source))
+
+    @staticmethod
+    def __render(lines: List[str]) -> bytes:
+        """Join the given lines, each terminated by the line separator, as UTF-8 bytes."""
+        return ''.join(f'{line}{_os.linesep}' for line in lines).encode('UTF-8')
+
+    def __read_in(self, infile: str) -> bytes:
+        """Read the whole contents of the given input file as bytes."""
+        if not infile:
+            raise ValueError("Argument 'infile' cannot be empty") \
+                from CORE_ERR
+
+        try:
+            with _phase('read template', infile, self.__timer), open(infile, 'rb') as i_file:
+                data: bytes = i_file.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f'Cannot read non-existing file: {infile!r}') \
+                from CORE_ERR
+
+        self.__counters['bytes_read'] += len(data)
+        return data
+
+    @staticmethod
+    def __compare(source: BinaryIO, size: int, out: str) -> str:
+        """
+        Return the status of the output file against the contents of the given
+        binary stream of the given size, either ``'added'``, ``'modified'``
+        or ``'unchanged'``.
 
-    @classmethod
-    def __write_out(cls, contents: List[str], out: str) -> None:
+        The files are read by chunks, stopping at the first difference,
+        and not read at all if their sizes differ.
+        """
+        try:
+            if _os.stat(out).st_size != size:
+                return 'modified'
+            with open(out, 'rb') as o_file:
+                while True:
+                    chunk: bytes = o_file.read(COMPARE_CHUNK_SIZE)
+                    if chunk != source.read(COMPARE_CHUNK_SIZE):
+                        return 'modified'
+                    if not chunk:
+                        return 'unchanged'
+        except FileNotFoundError:
+            return 'added'
+        except OSError:
+            return 'modified'
+
+    def __write_out(self, data: bytes, out: str, dry_run: bool = False) -> OutputChange:
         """
-        Write the given contents to the specified output file.
+        Write the given contents to the specified output file, unless
+        the output file already has exactly the same contents.
 
         Parameters
         ----------
-        contents : a list of str
-            List of strings to be written to the file.
+        data : bytes
+            The rendered contents to be written to the file.
 
         out : str
             Path to the output file.
 
+        dry_run : bool, optional
+            Whether to only compare the contents, without writing.
+
+        Returns
+        -------
+        OutputChange :
+            The change of the output file.
+
         Raises
         ------
         Exception
             If an error occurs while writing to the output file.
-    
+
         """
 
-        parentdir: str = _os.path.dirname(out)
-        if not _os.path.exists(parentdir):
-            _os.mkdir(parentdir)
+        with _phase('write', out, self.__timer):
+            # Keep the modification time of up-to-date outputs, so that
+            # build tools do not consider them (and their dependents) stale
+            change: OutputChange = OutputChange(
+                out, self.__compare(_io.BytesIO(data), len(data), out), data)
+            if not change.changed:
+                self.__counters['files_skipped'] += 1
+                return change
+            if dry_run:
+                return change
+
+            parentdir: str = _os.path.dirname(out)
+            if parentdir and not _os.path.exists(parentdir):
+                _os.makedirs(parentdir)
+
+            try:
+                with open(out, 'wb') as o_file:
+                    o_file.write(data)
+            except Exception as e:
+                raise e from CORE_ERR
+
+        self.__counters['bytes_written'] += len(data)
+        self.__counters['files_written'] += 1
+        return change
+
+    def __count(self, key: str, resolved: bool) -> None:
+        """Count a placeholder seen while resolving, either resolved or not."""
+        self.__keys.add(key)
+        self.__counters['placeholders_seen'] += 1
+        self.__counters['placeholders_resolved' if resolved else 'placeholders_unresolved'] += 1
+
+    def __lookup(self, key: str) -> Tuple[bool, Optional[str]]:
+        """Return whether the key is known and its value, from the POM or the placeholders."""
+        if key in self._pom_items:
+            return True, self._pom_items[key]
+        if key not in self.__found:
+            self.__found[key] = self.__placeholders.get(key, self.__basedir)
+        return self.__found[key] is not None, self.__found[key]
+
+    def __prefetch(self, keys: Iterable[str]) -> None:
+        """Evaluate concurrently the expensive placeholders of the keys not found in the POM."""
+        keys = set(keys)
+        keys.difference_update(self._pom_items)
+        if keys:
+            self.__placeholders.prefetch(keys, self.__basedir)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the metrics collected by this instance since it was created.
 
-        try:
-            with open(out, 'w', encoding='UTF-8') as o_file:
-                for line in contents:
-                    o_file.write(f'{line}{_os.linesep}')
-        except Exception as e:
-            raise e from CORE_ERR
+        Returns
+        -------
+        dict :
+            A dictionary containing the counters (see `COUNTERS`), the number
+            of distinct placeholder keys (``'distinct_keys'``), and the number
+            of calls and elapsed seconds of each phase (``'phases'``).
+
+        """
+        return {
+            **self.__counters,
+            'distinct_keys': len(self.__keys),
+            'phases': {
+                name: {'calls': calls, 'seconds': self.__timer.times[name]}
+                for name, calls in self.__timer.calls.items()
+            }
+        }
+
+    def render_manifest(self, source: Union[str, bytes, BinaryIO, TextIO],
+                        encoding: str = 'UTF-8') -> bytes:
+        """
+        Render the given manifest contents by replacing placeholders with
+        values from the POM file, without touching the disk.
+
+        Parameters
+        ----------
+        source : str, bytes, or a file-like object
+            The manifest contents, either as a string, bytes, or a file-like
+            object opened in text or binary mode.
+
+        encoding : str, optional
+            The encoding used to decode the bytes. Defaults to UTF-8.
+
+        Returns
+        -------
+        bytes :
+            The rendered manifest, encoded in UTF-8.
+
+        """
+        with _phase('read template', recorder=self.__timer):
+            manifest: _jmutils.JMProperties = self.__read_source(source, encoding)
+
+        # Fix the manifest
+        with _phase('resolve', recorder=self.__timer):
+            self.__prefetch(match[1] for match in map(self._val_pattern.match,
+                                                      manifest.values()) if match)
+            for key, val in manifest.items():
+                new_val = self._val_pattern.match(val)
+                if not new_val:
+                    continue
+
+                new_val = new_val[1]
+                if key == 'ID':
+                    manifest[key] = f"{self._pom_items['project.groupId']}:" + \
+                        f"{self._pom_items['project.artifactId']}"
+                    self.__count(new_val, True)
+                    continue
+
+                found, value = self.__lookup(new_val)
+                if found:
+                    manifest[key] = value
+                self.__count(new_val, found)
+
+        with _phase('render', recorder=self.__timer):
+            return self.__render([f'{key}: {val}' for key, val in manifest.items()] + [''])
+
+    def render_properties(self, source: Union[str, bytes, BinaryIO, TextIO],
+                          encoding: str = 'UTF-8') -> bytes:
+        """
+        Render the given properties contents by replacing placeholders with
+        values from the POM file, without touching the disk.
+
+        Parameters
+        ----------
+        source : str, bytes, or a file-like object
+            The properties contents, either as a string, bytes, or a file-like
+            object opened in text or binary mode.
+
+        encoding : str, optional
+            The encoding used to decode the bytes. Defaults to UTF-8.
+
+        Returns
+        -------
+        bytes :
+            The rendered properties, encoded in UTF-8.
 
-    def fix_manifest(self, infile: str, outfile: str = None) -> None:
+        """
+        with _phase('read template', recorder=self.__timer):
+            properties: _jmutils.JMProperties = self.__read_source(source, encoding)
+
+        # Fix the properties
+        with _phase('resolve', recorder=self.__timer):
+            self.__prefetch(match[1] for match in map(self._val_pattern.match,
+                                                      properties.values()) if match)
+            for key, val in properties.items():
+                new_val = self._val_pattern.match(val)
+                if not new_val:
+                    continue
+
+                found, value = self.__lookup(new_val[1])
+                if found:
+                    properties[key] = value
+                self.__count(new_val[1], found)
+
+        with _phase('render', recorder=self.__timer):
+            return self.__render([f'{key} = {val}' for key, val in properties.items()])
+
+    def __substitute(self, match: 're.Match') -> str:
+        """Return the replacement of a placeholder of a text file, or of its escape."""
+        if match[1]:
+            return match[1]  # An escaped placeholder, i.e. `\${` is kept as `${`
+        key: str = match[2]
+        value: Optional[str] = self._pom_items.get(key)
+        if value is None and key not in self._pom_items:
+            if key not in self.__found:
+                if self.__chunk and self.__placeholders.pending(key, self.__basedir):
+                    # Evaluate the expensive placeholders of the chunk at once, on the first one
+                    self.__prefetch(_KEY_RE.findall(self.__chunk))
+                    self.__chunk = ''
+                self.__found[key] = self.__placeholders.get(key, self.__basedir)
+            value = self.__found[key]
+        self.__count(key, value is not None)
+        return value if value is not None else match[0]
+
+    def __stream(self, reader: TextIO, writer: TextIO) -> None:
+        """
+        Substitute the placeholders of the text read from `reader` into `writer`,
+        chunk by chunk. A placeholder split across two chunks is held back until
+        the next chunk, so the memory is bounded by the chunk size. The expensive
+        placeholders of a chunk are evaluated concurrently, on the first one met.
+        """
+        pending: str = ''
+        while True:
+            chunk: str = reader.read(RENDER_CHUNK_SIZE)
+            text: str = pending + chunk
+            split: int = _split_pending(text) if chunk else len(text)
+            self.__chunk = text[:split]
+            writer.write(_TEXT_RE.sub(self.__substitute, self.__chunk))
+            self.__chunk = ''
+            pending = text[split:]
+            if not chunk:
+                break
+
+    def render_text(self, source: Union[str, bytes, BinaryIO, TextIO],
+                    encoding: str = 'UTF-8') -> bytes:
+        """
+        Render the given text contents by replacing every placeholder with
+        its value from the POM file, without touching the disk.
+
+        Any text is accepted (e.g., source code, documentation or scripts),
+        the unknown placeholders are kept as is, and ``\\${`` escapes a
+        literal ``${``. See `render_file` to render large files.
+
+        Parameters
+        ----------
+        source : str, bytes, or a file-like object
+            The text contents, either as a string, bytes, or a file-like
+            object opened in text or binary mode.
+
+        encoding : str, optional
+            The encoding of the text, used for both the bytes given and
+            the rendered text. Defaults to UTF-8.
+
+        Returns
+        -------
+        bytes :
+            The rendered text, with its line separators kept as is.
+
+        """
+        if hasattr(source, 'read'):
+            source = source.read()
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = bytes(source).decode(encoding)
+        if not isinstance(source, str):
+            raise TypeError(f"Unknown type of 'source' argument: {type(source).__name__}") \
+                from CORE_ERR
+
+        writer: _io.StringIO = _io.StringIO(newline='')
+        with _phase('render', recorder=self.__timer):
+            self.__stream(_io.StringIO(source, newline=''), writer)
+        return writer.getvalue().encode(encoding)
+
+    def fix_manifest(self, infile: str, outfile: str = None, *,
+                     dry_run: bool = False) -> OutputChange:
         """
         Fix the given manifest file by replacing placeholders with values
-        from the POM file.
+        from the POM file. See `render_manifest`.
 
         Parameters
         ----------
@@ -380,6 +1542,15 @@ class JMRepairer:
             Path to the output manifest file. If not specified,
             the input file will be overwritten.
 
+        dry_run : bool, optional
+            Whether to only render the file and compare it against the
+            current output file, without writing. Defaults to False.
+
+        Returns
+        -------
+        OutputChange :
+            The change of the output file, and the rendered contents.
+
         Raises
         ------
         ValueError
@@ -389,53 +1560,84 @@ class JMRepairer:
             If the specified input file does not exist.
 
         """
+        # When outfile argument not specified, then use infile
+        # for the name of output file, which means will overwrite the infile
+        return self.__write_out(self.render_manifest(self.__read_in(infile)),
+                                out=outfile or infile, dry_run=dry_run)
 
-        if not infile:
-            raise ValueError("Argument 'infile' cannot be empty") \
-                from CORE_ERR
+    def fix_properties(self, infile: str, outfile: str = None, *,
+                       dry_run: bool = False) -> OutputChange:
+        """
+        Fix the given properties file by replacing placeholders with values
+        from the POM file. See `render_properties`.
 
-        if not _os.path.exists(infile):
-            raise FileNotFoundError(f'Cannot read non-existing file: {infile!r}') \
-                from CORE_ERR
+        Parameters
+        ----------
+        infile : str
+            Path to the input properties file.
 
-        # When outfile argument not specified, then use infile
-        # for the name of output file, which means will overwrite the infile
-        outfile = infile if not outfile else outfile
+        outfile : str, optional
+            Path to the output properties file. If not specified,
+            the input file will be overwritten.
 
-        manifest: _jmutils.JMProperties = _jmutils.JMProperties(infile)
+        dry_run : bool, optional
+            Whether to only render the file and compare it against the
+            current output file, without writing. Defaults to False.
 
-        # Fix the manifest
-        for key, val in manifest.items():
-            new_val = self._val_pattern.match(val)
-            if not new_val:
-                continue
+        Returns
+        -------
+        OutputChange :
+            The change of the output file, and the rendered contents.
+
+        Raises
+        ------
+        ValueError
+            If the 'infile' argument is empty.
 
-            new_val = new_val[1]
-            if key == 'ID':
-                manifest[key] = f"{self._pom_items['project.groupId']}:" + \
-                    f"{self._pom_items['project.artifactId']}"
-            elif new_val in self._pom_items:
-                manifest[key] = self._pom_items[new_val]
+        FileNotFoundError
+            If the specified input file does not exist.
 
-        self.__write_out(
-            [f'{key}: {val}' for key, val in manifest.items()] + [''],
-            out=outfile
-        )
+        """
+        # If the outfile argument were not specified, then use infile
+        # for the name of output file, which means will overwrite the infile
+        return self.__write_out(self.render_properties(self.__read_in(infile)),
+                                out=outfile or infile, dry_run=dry_run)
 
-    def fix_properties(self, infile: str, outfile: str = None) -> None:
+    def render_file(self, infile: str, outfile: str = None, *, dry_run: bool = False,
+                    encoding: str = 'UTF-8') -> OutputChange:
         """
-        Fix the given properties file by replacing placeholders with values
-        from the POM file.
+        Render the given text file by replacing every placeholder with its
+        value from the POM file. See `render_text`.
+
+        The file is streamed by chunks (see `RENDER_CHUNK_SIZE`) into a
+        temporary file, then compared against the output file, so the
+        memory used does not depend on the size of the file. A changed
+        output file is replaced atomically, keeping its permissions (or
+        taking the permissions of the input file if new, e.g. for the
+        executable scripts).
 
         Parameters
         ----------
         infile : str
-            Path to the input properties file.
+            Path to the input text file.
 
         outfile : str, optional
-            Path to the output properties file. If not specified,
+            Path to the output text file. If not specified,
             the input file will be overwritten.
 
+        dry_run : bool, optional
+            Whether to only render the file and compare it against the
+            current output file, without writing. Defaults to False.
+
+        encoding : str, optional
+            The encoding of the input and output files. Defaults to UTF-8.
+
+        Returns
+        -------
+        OutputChange :
+            The change of the output file. Its `data` is empty, unless
+            the output file would be changed in a dry run.
+
         Raises
         ------
         ValueError
@@ -445,45 +1647,74 @@ class JMRepairer:
             If the specified input file does not exist.
 
         """
-
         if not infile:
             raise ValueError("Argument 'infile' cannot be empty") \
                 from CORE_ERR
+        out: str = outfile or infile
+        parentdir: str = _os.path.dirname(out)
 
-        if not _os.path.exists(infile):
+        try:
+            i_file: BinaryIO = open(infile, 'rb')  # pylint: disable=consider-using-with
+        except FileNotFoundError:
             raise FileNotFoundError(f'Cannot read non-existing file: {infile!r}') \
                 from CORE_ERR
 
-        # If the outfile argument were not specified, then use infile
-        # for the name of output file, which means will overwrite the infile
-        outfile = infile if not outfile else outfile
-
-        # Parse the properties file
-        properties: _jmutils.JMProperties = _jmutils.JMProperties(infile)
-
-        # Fix the properties file
-        for key, val in properties.items():
-            new_val = self._val_pattern.match(val)
-            if not new_val:
-                continue
-
-            new_val = new_val[1]
-            if new_val in self._pom_items:
-                properties[key] = self._pom_items[new_val]
-
-        self.__write_out(
-            [f'{key} = {val}' for key, val in properties.items()],
-            out=outfile
-        )
-
+        tmpfile: Optional[str] = None
+        with i_file:
+            self.__counters['bytes_read'] += _os.fstat(i_file.fileno()).st_size
+            if dry_run:
+                # Leave the output directory untouched
+                t_file: BinaryIO = _tempfile.TemporaryFile()
+            else:
+                if parentdir and not _os.path.exists(parentdir):
+                    _os.makedirs(parentdir)
+                fd, tmpfile = _tempfile.mkstemp(
+                    prefix=f'.{_os.path.basename(out)}.', suffix='.tmp', dir=parentdir or None)
+                t_file = open(fd, 'w+b')  # pylint: disable=consider-using-with
+
+            try:
+                with t_file:
+                    with _phase('render', infile, self.__timer):
+                        reader: TextIO = _io.TextIOWrapper(i_file, encoding, newline='')
+                        writer: TextIO = _io.TextIOWrapper(t_file, encoding, newline='',
+                                                           write_through=True)
+                        self.__stream(reader, writer)
+                        writer.flush()
+                        writer.detach()
+                        reader.detach()
+
+                    with _phase('write', out, self.__timer):
+                        size: int = t_file.tell()
+                        t_file.seek(0)
+                        status: str = self.__compare(t_file, size, out)
+                        if status == 'unchanged':
+                            self.__counters['files_skipped'] += 1
+                            return OutputChange(out, status, b'')
+                        if dry_run:
+                            t_file.seek(0)
+                            return OutputChange(out, status, t_file.read())
+
+                # Keep the permissions of the output file, or take those of the input file
+                _shutil.copymode(out if status == 'modified' else infile, tmpfile)
+                _os.replace(tmpfile, out)
+                tmpfile = None
+            finally:
+                if tmpfile is not None:
+                    _os.remove(tmpfile)
+
+        self.__counters['bytes_written'] += size
+        self.__counters['files_written'] += 1
+        return OutputChange(out, status, b'')
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
 
-__author__       = AUTHOR
-__version__      = VERSION
-__version_info__ = VERSION_INFO
 
 # Delete unused variables
-del AUTHOR, VERSION, VERSION_INFO
-del Dict, List, Union, Optional, TextIO
+del Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Set, Tuple
+del Optional, TextIO, Union
 
 if __name__ == '__main__':
     __warn(
@@ -18,16 +18,12 @@ JMUnknownTypeError
 
 from . import exception
 from .exception import *
-from .._globals import AUTHOR, VERSION, VERSION_INFO
+from .. import _globals
 
 __all__ = ['exception']
 __all__.extend(exception.__all__)
 
 
-
-__author__       = AUTHOR
-__version__      = VERSION
-__version_info__ = VERSION_INFO
-
-# Delete imported objects that are no longer being used
-del AUTHOR, VERSION, VERSION_INFO
+def __getattr__(name: str):
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
@@ -23,9 +23,9 @@ import os as _os
 import sys as _sys
 import traceback as _tb
 
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple
 
-from .._globals import AUTHOR, VERSION, VERSION_INFO
+from .. import _globals
 
 
 __all__    = ['JMException', 'JMUnknownTypeError', 'JMParserError']
@@ -80,7 +80,11 @@ class JMException(Exception):
 
     traces : traceback.StackSummary
         The stack traces of this exception. If no traceback is provided during
-        the exception creation, it will be overrided by `traceback.extract_stack()`.
+        the exception creation, it will be overrided by the stack at the
+        exception creation, as returned by `traceback.extract_stack()`.
+        Only the file names, line numbers and function names are captured when
+        the exception is created, the stack traces (including the source lines)
+        are built on first access to this property.
 
         To manually override the stack traces of this exception, consider use keyword
         `tb`, `trace` or `traces`, with the value separated by equals sign (`=`).
@@ -127,6 +131,7 @@ class JMException(Exception):
 
         self.__message              = None
         self.__traces               = None
+        self.__frames               = None
         self.__use_custom_traceback = False
 
         if len(args) > 1:
@@ -146,7 +151,9 @@ class JMException(Exception):
             tb_key = 'trace' if 'trace' in kwargs else 'traces'
             self.__use_custom_traceback = True
         else:
-            self.__traces = _tb.extract_stack()
+            # Defer building the stack traces (and reading the source lines),
+            # most exceptions are caught without accessing their traces
+            self.__frames = self.__capture_stack()
 
         # Check the instance of 'tb_key', otherwise pass if None
         if tb_key:
@@ -163,6 +170,20 @@ class JMException(Exception):
 
         super().__init__(self.__message, **kwargs)
 
+    @staticmethod
+    def __capture_stack() -> List[Tuple[str, int, str]]:
+        """
+        Return the file name, line number and function name of each frame
+        in the current stack (up to the exception's `__init__`), oldest first.
+        """
+        frames: List[Tuple[str, int, str]] = []
+        frame = _sys._getframe(1)  # pylint: disable=protected-access
+        while frame is not None:
+            frames.append((frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name))
+            frame = frame.f_back
+
+        frames.reverse()
+        return frames
 
     def __repr__(self) -> str:
         """
@@ -248,9 +269,14 @@ class JMException(Exception):
         -------
         traceback.StackSummary
             The stack traces of this exception. If not specified, returns
-            the stack traces from ``traceback.extract_stack()``.
+            the stack traces captured at the exception creation.
 
         """
+        if self.__frames is not None:
+            self.__traces = _tb.StackSummary.from_list(
+                [(filename, lineno, name, None) for filename, lineno, name in self.__frames])
+            self.__frames = None
+
         if self.__traces and isinstance(self.__traces, _tb.StackSummary):
             return self.__traces
 
@@ -284,7 +310,6 @@ class JMUnknownTypeError(JMException, TypeError):
 
         super().__init__(*args, **kwargs)
         self.__message = super().message
-        self.__traces = super().traces
 
     @property
     def message(self) -> Optional[str]:
@@ -308,13 +333,10 @@ class JMUnknownTypeError(JMException, TypeError):
         -------
         traceback.StackSummary :
             The stack traces of this exception. If not specified, returns
-            the stack traces from `traceback.extract_stack()`.
+            the stack traces captured at the exception creation.
 
         """
-        if self.__traces and isinstance(self.__traces, _tb.StackSummary):
-            return self.__traces
-
-        return _tb.extract_stack()
+        return super().traces
 
 
 
@@ -341,7 +363,6 @@ class JMParserError(JMException):
 
         super().__init__(*args, **kwargs)
         self.__message = super().message
-        self.__traces = super().traces
 
     @property
     def message(self) -> Optional[str]:
@@ -365,17 +386,17 @@ class JMParserError(JMException):
         -------
         traceback.StackSummary :
             The stack traces of this exception. If not specified, returns
-            the stack traces from `traceback.extract_stack()`.
+            the stack traces captured at the exception creation.
 
         """
-        return self.__traces
+        return super().traces
 
 
 
-__author__       = AUTHOR
-__version__      = VERSION
-__version_info__ = VERSION_INFO
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
 
 
 # Delete imported objects that are no longer being used
-del AUTHOR, VERSION, VERSION_INFO, Any, Optional
+del List, Optional, Tuple
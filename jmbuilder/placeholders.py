@@ -0,0 +1,476 @@
+"""Placeholders Module for `JMBuilder`
+
+This module provides the placeholders that are not declared in the POM
+files, such as ``${git.commit}``, ``${build.number}`` or ``${java.version}``,
+evaluated by plug-in resolvers registered by their namespace (the prefix of
+the key before its last dots), for example::
+
+    >>> from jmbuilder import placeholders
+    >>> placeholders.register('user', lambda name, basedir: {'name': 'Ryuu'}.get(name))
+    >>> placeholders.Placeholders().get('user.name')
+    'Ryuu'
+
+A resolver is a callable taking the rest of the key (e.g., ``'commit'`` for
+``${git.commit}``) and the directory of the POM, and returning the value,
+or None if unknown. The resolvers are also discovered from the entry points
+of the ``jmbuilder.placeholders`` group, named by their namespace.
+
+The evaluation is lazy, a resolver runs only when a template references a key
+of its namespace, and each value is memoized by `Placeholders` for the whole
+run (i.e., a single invocation of the command-line), shared by the modules of
+the same scope (e.g., the ``git.*`` values by the modules of a repository).
+The keys of the expensive resolvers (those running a subprocess) referenced
+by a template are evaluated concurrently, see `Placeholders.prefetch`.
+
+The POM properties and the user properties take precedence over the
+placeholders, e.g. ``-Dbuild.number=42`` overrides the build number.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+Placeholders
+    The placeholders of a run, evaluated lazily and memoized.
+
+Available Functions
+-------------------
+clear_cache
+    Clear the system properties of the JDK, detected once per process.
+
+lookup
+    Return the resolver of the given key, and the rest of the key.
+
+register
+    Register the resolver of the given namespace.
+
+unregister
+    Remove the resolver of the given namespace.
+
+Built-in Namespaces
+-------------------
+git
+    ``commit``, ``commit.short``, ``branch``, ``tag`` (the latest one),
+    ``describe`` and ``dirty`` (``true`` or ``false``) of the Git repository
+    containing the POM.
+
+build
+    ``number`` (from the environment variables of the common CI services),
+    ``user`` and ``host``.
+
+java
+    ``version`` of the installed JDK, and its other system properties
+    (e.g., ``java.vendor`` or ``java.home``).
+
+"""
+
+import os as _os
+import re as _re
+import socket as _socket
+import getpass as _getpass
+import threading as _threading
+import functools as _functools
+import subprocess as _subprocess
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from . import _globals
+
+
+__all__ = ['Placeholders', 'clear_cache', 'lookup', 'register', 'unregister']
+
+# The entry points group of the resolvers provided by other distributions
+ENTRY_POINT_GROUP: str = 'jmbuilder.placeholders'
+
+# The maximum number of threads evaluating the expensive placeholders at once
+MAX_WORKERS: int = 8
+
+# The maximum seconds for a subprocess of the built-in resolvers
+SUBPROCESS_TIMEOUT: float = 10.0
+
+# Takes the name (the key without its namespace) and the directory of the POM
+Resolver = Callable[[str, str], Optional[str]]
+
+# Maps the directory of the POM to the directory the values depend on
+Scope = Callable[[str], str]
+
+
+class _Entry(NamedTuple):
+    """A registered resolver."""
+    resolver: Resolver
+    expensive: bool
+    scope: Optional[Scope]
+
+
+_REGISTRY: Dict[str, _Entry] = {}
+
+
+def register(namespace: str, resolver: Resolver, *, expensive: bool = False,
+             scope: Optional[Scope] = None) -> None:
+    """
+    Register the resolver of the given namespace, replacing the previous one.
+
+    Parameters
+    ----------
+    namespace : str
+        The prefix of the keys before their last dots (e.g., ``'git'``
+        for ``${git.commit}``), the longest registered one is used.
+
+    resolver : callable
+        A function taking the name (the rest of the key) and the directory
+        of the POM, and returning the value, or None if unknown. It may be
+        called from several threads.
+
+    expensive : bool, optional
+        Whether the resolver is slow (e.g., runs a subprocess), so that its
+        keys referenced by a template are evaluated concurrently. Defaults to False.
+
+    scope : callable, optional
+        A function mapping the directory of the POM to the directory the
+        values depend on (e.g., the root of the Git repository), so that the
+        modules sharing it share the memoized values. Return the same string
+        for any directory if the values do not depend on it. Defaults to the
+        directory of the POM.
+
+    Raises
+    ------
+    ValueError
+        If the namespace is empty, or is not a valid prefix of a key.
+
+    """
+    if not namespace or namespace.startswith('.') or namespace.endswith('.'):
+        raise ValueError(f'Invalid namespace: {namespace!r}')
+    _REGISTRY[namespace] = _Entry(resolver, expensive, scope)
+
+
+def unregister(namespace: str) -> None:
+    """Remove the resolver of the given namespace, if registered."""
+    _REGISTRY.pop(namespace, None)
+
+
+@_functools.lru_cache(maxsize=None)
+def _entry_points() -> Dict[str, Any]:
+    """Return the entry points of the resolvers by their namespace, listed once."""
+    try:
+        from importlib import metadata  # pylint: disable=import-outside-toplevel
+    except ImportError:  # Python 3.7
+        return {}
+    found: Any = metadata.entry_points()
+    group: Iterable[Any] = found.select(group=ENTRY_POINT_GROUP) \
+        if hasattr(found, 'select') else found.get(ENTRY_POINT_GROUP, ())
+    return {entry.name: entry for entry in group}
+
+
+def _find(key: str) -> Optional[Tuple[_Entry, str]]:
+    """Return the registered resolver of the longest namespace of the key, and the name."""
+    parts: List[str] = key.split('.')
+    for idx in range(len(parts) - 1, 0, -1):
+        namespace: str = '.'.join(parts[:idx])
+        entry: Optional[_Entry] = _REGISTRY.get(namespace)
+        if entry is None and namespace in _entry_points():
+            # Loaded on the first reference only, and then kept as registered
+            entry = _REGISTRY.setdefault(
+                namespace, _Entry(_entry_points()[namespace].load(), True, None))
+        if entry is not None:
+            return entry, '.'.join(parts[idx:])
+    return None
+
+
+def lookup(key: str) -> Optional[Tuple[Resolver, str, bool]]:
+    """
+    Return the resolver of the given key, and the rest of the key.
+
+    Parameters
+    ----------
+    key : str
+        The key of the placeholder, e.g. ``'git.commit'``.
+
+    Returns
+    -------
+    tuple or None :
+        The resolver, the name to be resolved and whether the resolver
+        is expensive, or None if no namespace of the key is registered.
+
+    """
+    found: Optional[Tuple[_Entry, str]] = _find(key)
+    return (found[0].resolver, found[1], found[0].expensive) if found else None
+
+
+class Placeholders:
+    """
+    The placeholders of a run, evaluated lazily and memoized.
+
+    Each key is evaluated at most once per scope of its resolver (the
+    directory of the POM by default, see `register`), the concurrent calls
+    for the same key wait for the first one. The keys of no registered
+    namespace are remembered as well, so the unknown placeholders of a
+    template are looked up only once.
+
+    Parameters
+    ----------
+    workers : int, optional
+        The maximum number of threads evaluating the expensive placeholders
+        at once. Defaults to `MAX_WORKERS`.
+
+    """
+
+    def __init__(self, *, workers: Optional[int] = None) -> None:
+        """Create new placeholders, with none evaluated yet."""
+        self.workers: int = workers or MAX_WORKERS
+        self.__lock: _threading.Lock = _threading.Lock()
+        # By key and scope, and the same values by key and directory of the POM
+        self.__values: Dict[Tuple[str, str], '_Future[Optional[str]]'] = {}
+        self.__dirs: Dict[Tuple[str, str], '_Future[Optional[str]]'] = {}
+        self.__scopes: Dict[Tuple[Scope, str], str] = {}
+        self.__unknown: Set[str] = set()
+
+    def __len__(self) -> int:
+        """Return the number of keys evaluated (or being evaluated), per scope."""
+        return len(self.__values)
+
+    def __find(self, key: str, basedir: str) -> Optional[Tuple[_Entry, str, Tuple[str, str]]]:
+        """Return the resolver of the key, the name and the memoized key, if registered."""
+        if key in self.__unknown:
+            return None
+        found: Optional[Tuple[_Entry, str]] = _find(key)
+        if found is None:
+            with self.__lock:  # Also called by the threads of `prefetch`
+                self.__unknown.add(key)
+            return None
+
+        scope: Optional[Scope] = found[0].scope
+        if scope is None:
+            return (*found, (key, basedir))
+        scoped: Optional[str] = self.__scopes.get((scope, basedir))
+        if scoped is None:
+            scoped = scope(basedir)
+            with self.__lock:
+                scoped = self.__scopes.setdefault((scope, basedir), scoped)
+        return (*found, (key, scoped))
+
+    def get(self, key: str, basedir: Optional[str] = None) -> Optional[str]:
+        """
+        Return the value of the given key, evaluating it on the first call.
+
+        Parameters
+        ----------
+        key : str
+            The key of the placeholder, e.g. ``'git.commit'``.
+
+        basedir : str, optional
+            The directory of the POM. Defaults to the current working directory.
+
+        Returns
+        -------
+        str or None :
+            The value, or None if unknown or if no namespace of the key is registered.
+
+        """
+        basedir = basedir or _os.getcwd()
+        future: Optional[_Future] = self.__dirs.get((key, basedir))
+        if future is not None:
+            return future.result()  # Already evaluated, or being evaluated
+
+        found: Optional[Tuple[_Entry, str, Tuple[str, str]]] = self.__find(key, basedir)
+        if found is None:
+            return None
+        with self.__lock:
+            future = self.__values.get(found[2])
+            owner: bool = future is None
+            if owner:
+                future = self.__values[found[2]] = _Future()
+            self.__dirs[(key, basedir)] = future
+
+        if owner:
+            try:
+                future.set_result(found[0].resolver(found[1], basedir))
+            except BaseException as exc:  # Let the waiting calls raise it as well
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+    def pending(self, key: str, basedir: Optional[str] = None) -> bool:
+        """
+        Return whether the given key is of an expensive resolver, and not evaluated yet.
+
+        Parameters
+        ----------
+        key : str
+            The key of the placeholder, e.g. ``'git.commit'``.
+
+        basedir : str, optional
+            The directory of the POM. Defaults to the current working directory.
+
+        """
+        basedir = basedir or _os.getcwd()
+        if (key, basedir) in self.__dirs:
+            return False
+        found: Optional[Tuple[_Entry, str, Tuple[str, str]]] = self.__find(key, basedir)
+        return found is not None and found[0].expensive and found[2] not in self.__values
+
+    def prefetch(self, keys: Iterable[str], basedir: Optional[str] = None) -> None:
+        """
+        Evaluate the given keys of the expensive resolvers concurrently.
+
+        The keys already evaluated, and those of the other resolvers, are
+        skipped (the latter are evaluated on their first `get`). Nothing
+        is done unless at least two keys are left.
+
+        Parameters
+        ----------
+        keys : iterable of str
+            The keys referenced by a template.
+
+        basedir : str, optional
+            The directory of the POM. Defaults to the current working directory.
+
+        """
+        basedir = basedir or _os.getcwd()
+        pending: List[str] = [key for key in dict.fromkeys(keys) if self.pending(key, basedir)]
+        if len(pending) < 2:
+            return
+
+        with _ThreadPoolExecutor(min(self.workers, len(pending))) as pool:
+            for _ in pool.map(lambda key: self.get(key, basedir), pending):
+                pass
+
+
+def _run(args: List[str], cwd: str, *, stderr: bool = False) -> Optional[str]:
+    """Return the stripped output (or error output) of the command, or None if failed."""
+    try:
+        process: _subprocess.CompletedProcess = _subprocess.run(
+            args, cwd=cwd, stdout=_subprocess.PIPE, stderr=_subprocess.PIPE,
+            timeout=SUBPROCESS_TIMEOUT, check=False)
+    except (OSError, _subprocess.SubprocessError):
+        return None
+    output: bytes = process.stderr if stderr else process.stdout
+    return output.decode('UTF-8', 'replace').strip() if process.returncode == 0 else None
+
+
+_GIT_COMMANDS: Dict[str, List[str]] = {
+    'commit': ['rev-parse', 'HEAD'],
+    'commit.short': ['rev-parse', '--short', 'HEAD'],
+    'branch': ['rev-parse', '--abbrev-ref', 'HEAD'],
+    'tag': ['describe', '--tags', '--abbrev=0'],
+    'describe': ['describe', '--tags', '--always', '--dirty'],
+    'dirty': ['status', '--porcelain']
+}
+
+
+def _git_root(basedir: str) -> str:
+    """Return the root of the Git repository containing the directory, or the directory."""
+    path: str = _os.path.abspath(basedir)
+    while not _os.path.exists(_os.path.join(path, '.git')):
+        parent: str = _os.path.dirname(path)
+        if parent == path:
+            return basedir
+        path = parent
+    return path
+
+
+def _everywhere(basedir: str) -> str:  # pylint: disable=unused-argument
+    """Return the same scope for any directory, i.e. the values of the whole run."""
+    return ''
+
+
+def _resolve_git(name: str, basedir: str) -> Optional[str]:
+    """Resolve the ``git.*`` placeholders, from the repository containing the POM."""
+    if name not in _GIT_COMMANDS:
+        return None
+    output: Optional[str] = _run(['git', *_GIT_COMMANDS[name]], basedir)
+    if name == 'dirty' and output is not None:
+        return 'true' if output else 'false'
+    return output or None
+
+
+# The environment variables of the build number, checked in order
+# (Jenkins, GitHub Actions, GitLab CI, Azure Pipelines, CircleCI, Travis CI)
+_BUILD_NUMBER_VARS: Tuple[str, ...] = (
+    'BUILD_NUMBER', 'GITHUB_RUN_NUMBER', 'CI_PIPELINE_IID', 'BUILD_BUILDNUMBER',
+    'CIRCLE_BUILD_NUM', 'TRAVIS_BUILD_NUMBER'
+)
+
+
+def _resolve_build(name: str, basedir: str) -> Optional[str]:  # pylint: disable=unused-argument
+    """Resolve the ``build.*`` placeholders, from the environment."""
+    if name == 'number':
+        return next((_os.environ[var] for var in _BUILD_NUMBER_VARS if var in _os.environ),
+                    None)
+    if name == 'user':
+        try:
+            return _getpass.getuser()
+        except (ImportError, KeyError, OSError):
+            return None
+    return _socket.gethostname() if name == 'host' else None
+
+
+_JAVA_LOCK: _threading.Lock = _threading.Lock()
+_JAVA_PROPERTIES: Dict[str, Dict[str, str]] = {}
+
+
+def _parse_java_properties(output: str) -> Dict[str, str]:
+    """
+    Parse the system properties printed by ``java -XshowSettings:properties``.
+    The values of the multi-valued properties (e.g., ``java.library.path``),
+    printed on the further indented lines, are joined with `os.pathsep`.
+    """
+    properties: Dict[str, str] = {}
+    key: Optional[str] = None
+    indent: int = 0
+    for line in output.splitlines():
+        match: Optional[_re.Match] = _re.match(r'^(\s*)([\w.-]+) = (.*)$', line)
+        if match:
+            key, indent = match[2], len(match[1])
+            properties[key] = match[3].strip()
+        elif key and line.strip() and len(line) - len(line.lstrip()) > indent:
+            properties[key] += _os.pathsep + line.strip()
+        else:
+            key = None
+    return properties
+
+
+def _java_properties(java: str) -> Dict[str, str]:
+    """
+    Return the system properties of the given JDK executable, running it only
+    once. The concurrent calls wait for the first one. A failed run is not
+    cached, so it is tried again by the next call.
+    """
+    with _JAVA_LOCK:
+        if java not in _JAVA_PROPERTIES:
+            # The JDK prints its settings to the standard error
+            output: Optional[str] = _run([java, '-XshowSettings:properties', '-version'],
+                                         _os.getcwd(), stderr=True)
+            if not output:
+                return {}
+            _JAVA_PROPERTIES[java] = _parse_java_properties(output)
+        return _JAVA_PROPERTIES[java]
+
+
+def clear_cache() -> None:
+    """
+    Clear the system properties of the JDK, detected once per process, e.g.,
+    when the environment variables (``JAVA_HOME`` or ``PATH``) have been changed.
+    """
+    with _JAVA_LOCK:
+        _JAVA_PROPERTIES.clear()
+
+
+def _resolve_java(name: str, basedir: str) -> Optional[str]:  # pylint: disable=unused-argument
+    """Resolve the ``java.*`` placeholders, from the system properties of the JDK."""
+    java: str = _os.path.join(_os.environ['JAVA_HOME'], 'bin', 'java') \
+        if 'JAVA_HOME' in _os.environ else 'java'
+    return _java_properties(java).get(f'java.{name}')
+
+
+register('git', _resolve_git, expensive=True, scope=_git_root)
+register('build', _resolve_build, scope=_everywhere)
+register('java', _resolve_java, expensive=True, scope=_everywhere)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
@@ -0,0 +1,528 @@
+"""Profiler Module for `JMBuilder`
+
+This module provides the phase hooks used by the core module to mark its
+phases of work, and a profiler that records them along with the `cProfile`
+statistics, for example::
+
+    >>> from jmbuilder.profiler import Profiler
+    >>> with Profiler() as prof:
+    ...     repairer.fix_manifest('MANIFEST.MF', 'out/MANIFEST.MF')
+    >>> prof.path  # The pstats file, inside `LOGSDIR` by default
+    '.../logs/profile-20240101-120000-1234.pstats'
+
+The same is available from the command-line through the ``--profile[=path]``
+option. The phases can also be exported as Chrome trace events (viewable in
+``chrome://tracing`` or Perfetto) using `TraceRecorder`, or ``--trace[=path]``,
+and the memory allocated in each phase can be reported using `MemoryProfiler`,
+or ``--memprofile[=path]``.
+While no recorder is active, `phase` returns a shared no-op context manager,
+so the phase hooks cost nothing more than a function call.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+MemoryProfiler
+    A context manager reporting the memory allocated in each phase, using `tracemalloc`.
+
+PhaseTimer
+    A phase recorder accumulating the number of calls and elapsed time of each phase.
+
+Profiler
+    A context manager recording the `cProfile` statistics and the phase timings.
+
+TraceRecorder
+    A phase recorder buffering the phases as spans, written as Chrome trace events.
+
+Available Functions
+-------------------
+add_recorder
+    Register a function to be called whenever a phase ends.
+
+phase
+    Return a context manager marking a phase of work.
+
+remove_recorder
+    Unregister a function previously registered by `add_recorder`.
+
+Available Constants
+-------------------
+PHASES : tuple of str
+    The phases of work marked by the core module, in order.
+
+"""
+
+import os as _os
+import sys as _sys
+import json as _json
+import time as _time
+import atexit as _atexit
+import threading as _threading
+from contextlib import nullcontext as _nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional, TextIO, Tuple
+
+from . import _globals
+from ._globals import LOGSDIR
+
+
+__all__ = [
+    'PHASES', 'MemoryProfiler', 'PhaseTimer', 'Profiler', 'TraceRecorder',
+    'add_recorder', 'phase', 'remove_recorder'
+]
+
+# The phases of work marked by the core module, in order:
+#   parse          - reading and parsing the POM file (`PomParser.parse`)
+#   index          - looking up the POM values used as placeholders (`JMRepairer`)
+#   read template  - reading and parsing the manifest or properties file
+#   resolve        - replacing the placeholders with the POM values
+#   render         - serializing the result into bytes
+#   write          - writing the result to the output file
+PHASES: tuple = ('parse', 'index', 'read template', 'resolve', 'render', 'write')
+
+# The functions called with (name, start, end, path) whenever a phase ends
+_RECORDERS: List[Callable[[str, float, float, Optional[str]], None]] = []
+
+# The recorders and their functions called with (name, path) whenever a phase starts
+_STARTERS: List[Tuple[Callable[[str, float, float, Optional[str]], None],
+                      Callable[[str, Optional[str]], None]]] = []
+
+_NULL_PHASE: ContextManager = _nullcontext()
+
+
+class _Phase:
+    """A context manager timing a single phase, notifying the recorders on exit."""
+
+    __slots__ = ('name', 'path', 'recorder', 'start')
+
+    def __init__(self, name: str, path: Optional[str],
+                 recorder: Optional[Callable[[str, float, float, Optional[str]], None]]) -> None:
+        self.name: str = name
+        self.path: Optional[str] = path
+        self.recorder: Optional[Callable[[str, float, float, Optional[str]], None]] = recorder
+        self.start: float = 0.0
+
+    def __enter__(self) -> '_Phase':
+        for _, on_start in tuple(_STARTERS):
+            on_start(self.name, self.path)
+        self.start = _time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end: float = _time.perf_counter()
+        if self.recorder is not None:
+            self.recorder(self.name, self.start, end, self.path)
+        for recorder in tuple(_RECORDERS):
+            recorder(self.name, self.start, end, self.path)
+
+
+def _default_path(prefix: str, ext: Optional[str] = None) -> str:
+    """Return a new file path inside `LOGSDIR`, named after the current time and process ID."""
+    return _os.path.join(
+        LOGSDIR, f"{prefix}-{_time.strftime('%Y%m%d-%H%M%S')}-{_os.getpid()}" +
+        (f'.{ext}' if ext else ''))
+
+
+def _makedirs_for(path: str) -> None:
+    """Create the parent directory of the given file path if not exist."""
+    parentdir: str = _os.path.dirname(path)
+    if parentdir:
+        _os.makedirs(parentdir, exist_ok=True)
+
+
+def phase(name: str, path: Optional[str] = None,
+          recorder: Optional[Callable[[str, float, float, Optional[str]], None]] = None
+          ) -> ContextManager:
+    """
+    Return a context manager marking a phase of work.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase, see `PHASES`.
+
+    path : str, optional
+        The path to the file being processed in this phase, if any.
+
+    recorder : callable, optional
+        A recorder to be notified for this phase only, in addition to
+        the registered ones (e.g., a `PhaseTimer` owned by the caller).
+
+    Returns
+    -------
+    ContextManager :
+        A context manager timing the phase, or a shared no-op
+        context manager if no recorder is registered nor given.
+
+    """
+    if recorder is None and not _RECORDERS:
+        return _NULL_PHASE
+    return _Phase(name, path, recorder)
+
+
+def add_recorder(recorder: Callable[[str, float, float, Optional[str]], None], *,
+                 on_start: Optional[Callable[[str, Optional[str]], None]] = None) -> None:
+    """
+    Register a function to be called whenever a phase ends.
+
+    Parameters
+    ----------
+    recorder : callable
+        A function called with the name of the phase, its start and end
+        time (from `time.perf_counter`), and the path to the processed file
+        (or None).
+
+    on_start : callable, optional
+        A function called with the name of the phase and the path to the
+        processed file (or None) whenever a phase starts, before its start
+        time is taken.
+
+    """
+    if on_start is not None:
+        _STARTERS.append((recorder, on_start))
+    _RECORDERS.append(recorder)
+
+
+def remove_recorder(recorder: Callable[[str, float, float, Optional[str]], None]) -> None:
+    """Unregister a function previously registered by `add_recorder`."""
+    _RECORDERS.remove(recorder)
+    _STARTERS[:] = [starter for starter in _STARTERS if starter[0] is not recorder]
+
+
+class PhaseTimer:
+    """
+    A phase recorder accumulating the number of calls and elapsed time of each phase.
+
+    Instances of this class are callable and can be registered
+    using `add_recorder`.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize self."""
+        self.__lock: _threading.Lock = _threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self.times: Dict[str, float] = {}
+
+    def __call__(self, name: str, start: float, end: float,
+                 path: Optional[str] = None) -> None:
+        """Record a single call of the given phase."""
+        with self.__lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.times[name] = self.times.get(name, 0.0) + (end - start)
+
+    def table(self) -> str:
+        """Return the recorded phases formatted as a table, ordered as `PHASES`."""
+        names: List[str] = [name for name in PHASES if name in self.calls] + \
+            sorted(name for name in self.calls if name not in PHASES)
+        total: float = sum(self.times.values()) or 1.0
+
+        lines: List[str] = [f"{'phase':<16}{'calls':>8}{'total ms':>12}{'mean ms':>12}{'%':>8}"]
+        for name in names:
+            lines.append(
+                f'{name:<16}{self.calls[name]:>8}{self.times[name] * 1e3:>12.3f}' +
+                f'{self.times[name] * 1e3 / self.calls[name]:>12.3f}' +
+                f'{self.times[name] * 100 / total:>8.1f}')
+        return _os.linesep.join(lines)
+
+
+class Profiler:
+    """
+    A context manager recording the `cProfile` statistics and the phase timings.
+
+    On exit, the statistics are written as a pstats file (readable using the
+    `pstats` module, or tools like ``snakeviz``), and the phase timings
+    are printed as a table.
+
+    Parameters
+    ----------
+    path : str, optional
+        The path to the pstats file. Defaults to a new file
+        inside `LOGSDIR`, named after the current time and process ID.
+
+    file : TextIO, optional
+        The file to print the phase timings table to. Defaults to
+        the console standard error (`sys.stderr`). If False, the table
+        will not be printed.
+
+    Attributes
+    ----------
+    path : str
+        The path to the pstats file.
+
+    phases : PhaseTimer
+        The recorded phase timings.
+
+    """
+
+    def __init__(self, path: Optional[str] = None, *,
+                 file: Optional[TextIO] = None) -> None:
+        """Initialize self."""
+        self.path: str = path or _default_path('profile', 'pstats')
+        self.phases: PhaseTimer = PhaseTimer()
+        self.__file: Optional[TextIO] = file
+        self.__profile: 'cProfile.Profile' = None
+
+    def __enter__(self) -> 'Profiler':
+        """Start recording."""
+        import cProfile  # pylint: disable=import-outside-toplevel
+
+        self.__profile = cProfile.Profile()
+        add_recorder(self.phases)
+        self.__profile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop recording, write the statistics and print the phase timings."""
+        self.__profile.disable()
+        remove_recorder(self.phases)
+
+        _makedirs_for(self.path)
+        self.__profile.dump_stats(self.path)
+
+        if self.__file is not False:
+            print(self.phases.table(), f'{__package__}: profile written to {self.path}',
+                  sep=_os.linesep, file=self.__file or _sys.stderr)
+
+
+class TraceRecorder:
+    """
+    A phase recorder buffering the phases as spans, written as Chrome trace events.
+
+    Each span is tagged with the path to the processed file and the worker
+    (thread) that ran it. Recording only appends a tuple to an in-memory
+    buffer, the events are formatted and written to the file on `stop`,
+    which is also called at the interpreter exit if not called before.
+    This class can be used as a context manager.
+
+    Parameters
+    ----------
+    path : str, optional
+        The path to the trace file. Defaults to a new file inside `LOGSDIR`,
+        named after the current time and process ID.
+
+    Attributes
+    ----------
+    path : str
+        The path to the trace file.
+
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize self."""
+        self.path: str = path or _default_path('trace', 'json')
+        self.__spans: List[tuple] = []
+        self.__origin: float = _time.perf_counter()
+        self.__started: bool = False
+
+    def __call__(self, name: str, start: float, end: float,
+                 path: Optional[str] = None) -> None:
+        """Buffer a single span of the given phase."""
+        thread: _threading.Thread = _threading.current_thread()
+        self.__spans.append((name, start, end, path, thread.ident, thread.name))
+
+    def __enter__(self) -> 'TraceRecorder':
+        """Start recording."""
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop recording and write the trace file."""
+        self.stop()
+
+    def start(self) -> 'TraceRecorder':
+        """Start recording the phases, and make sure they are written at exit."""
+        if not self.__started:
+            self.__started = True
+            add_recorder(self)
+            _atexit.register(self.stop)
+        return self
+
+    def stop(self) -> None:
+        """Stop recording the phases, then write the recorded spans to the trace file."""
+        if not self.__started:
+            return
+        self.__started = False
+        remove_recorder(self)
+        _atexit.unregister(self.stop)
+        self.flush()
+
+    def events(self) -> List[dict]:
+        """Return the recorded spans as Chrome trace events."""
+        pid: int = _os.getpid()
+        threads: Dict[int, str] = {}
+        events: List[dict] = []
+        for name, start, end, path, tid, thread_name in self.__spans:
+            threads[tid] = thread_name
+            events.append({
+                'name': name, 'cat': 'jmbuilder', 'ph': 'X', 'pid': pid, 'tid': tid,
+                'ts': (start - self.__origin) * 1e6, 'dur': (end - start) * 1e6,
+                'args': {'path': path, 'worker': thread_name}
+            })
+
+        # Name the tracks after the workers
+        events.extend({
+            'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}
+        } for tid, name in threads.items())
+        return events
+
+    def flush(self) -> None:
+        """Write all recorded spans to the trace file."""
+        _makedirs_for(self.path)
+        with open(self.path, 'w', encoding='utf-8') as file:
+            _json.dump({'traceEvents': self.events(), 'displayTimeUnit': 'ms'}, file)
+        print(f'{__package__}: trace written to {self.path}', file=_sys.stderr)
+
+
+class MemoryProfiler:
+    """
+    A context manager reporting the memory allocated in each phase, using `tracemalloc`.
+
+    For each phase, the report contains the number of calls, the highest
+    peak of memory allocated during a call (``peak``), the memory still
+    allocated after the calls (``retained``), and the source lines which
+    allocated the most memory that is still allocated after the calls.
+    On exit, the report is written both as text and JSON, to the given path
+    with the extensions ``.txt`` and ``.json``.
+
+    The peak of each phase requires ``tracemalloc.reset_peak`` (Python 3.9+).
+    On older Python versions, it is reported as ``null`` (``n/a`` in the text
+    report) rather than the peak of the whole process; the overall peak and
+    the retained memory are reported on all versions.
+
+    Taking the snapshots around each phase is costly, so this is intended
+    for diagnosing the memory usage only, within a single thread.
+
+    Parameters
+    ----------
+    path : str, optional
+        The path to the report files, without extension. Defaults to
+        a new path inside `LOGSDIR`, named after the current time and process ID.
+
+    top : int, optional
+        The number of top allocating source lines reported for each phase.
+        Defaults to 10.
+
+    Attributes
+    ----------
+    path : str
+        The path to the report files, without extension.
+
+    phases : Dict[str, dict]
+        The report of each recorded phase.
+
+    """
+
+    def __init__(self, path: Optional[str] = None, *, top: int = 10) -> None:
+        """Initialize self."""
+        self.path: str = path[:-5] if path and path.endswith('.json') else \
+            (path or _default_path('memprofile'))
+        self.phases: Dict[str, dict] = {}
+        self.__top: int = top
+        self.__lines: Dict[str, Dict[str, int]] = {}
+        self.__stack: List[list] = []
+        self.__started_tracing: bool = False
+        self.__tracemalloc = None
+        self.__reset_peak: bool = False
+
+    def __filter(self, snapshot: 'tracemalloc.Snapshot') -> 'tracemalloc.Snapshot':
+        """Exclude the allocations made by the profiling itself."""
+        return snapshot.filter_traces((
+            self.__tracemalloc.Filter(False, self.__tracemalloc.__file__),
+            self.__tracemalloc.Filter(False, __file__)
+        ))
+
+    def phase_started(self, name: str, path: Optional[str] = None) -> None:
+        """Take a snapshot and reset the peak before the given phase starts."""
+        peak: int = self.__tracemalloc.get_traced_memory()[1]
+        for outer in self.__stack:  # Keep the peaks of outer phases before resetting
+            outer[3] = max(outer[3], peak)
+
+        # Measure after taking the snapshot, which is traced memory too
+        snapshot: 'tracemalloc.Snapshot' = self.__filter(self.__tracemalloc.take_snapshot())
+        current: int = self.__tracemalloc.get_traced_memory()[0]
+        if self.__reset_peak:
+            self.__tracemalloc.reset_peak()
+        self.__stack.append([name, snapshot, current, current])
+
+    def __call__(self, name: str, start: float, end: float,
+                 path: Optional[str] = None) -> None:
+        """Take a snapshot after the given phase ended, and compare it."""
+        if not self.__stack or self.__stack[-1][0] != name:
+            return
+        _, snapshot, before, peak = self.__stack.pop()
+        current, new_peak = self.__tracemalloc.get_traced_memory()
+
+        report: dict = self.phases.setdefault(name, {
+            'calls': 0, 'peak_bytes': 0, 'retained_bytes': 0, 'top': []
+        })
+        report['calls'] += 1
+        # Without resetting, the peak may come from before the phase started
+        report['peak_bytes'] = max(report['peak_bytes'], max(peak, new_peak) - before) \
+            if self.__reset_peak else None
+        report['retained_bytes'] += current - before
+
+        lines: Dict[str, int] = self.__lines.setdefault(name, {})
+        for stat in self.__filter(self.__tracemalloc.take_snapshot()).compare_to(
+                snapshot, 'lineno'):
+            if stat.size_diff > 0:
+                frame = stat.traceback[0]
+                key: str = f'{frame.filename}:{frame.lineno}'
+                lines[key] = lines.get(key, 0) + stat.size_diff
+
+        report['top'] = [
+            {'line': line, 'size_bytes': size}
+            for line, size in sorted(lines.items(), key=lambda item: -item[1])[:self.__top]
+        ]
+
+    def __enter__(self) -> 'MemoryProfiler':
+        """Start tracing the memory allocations, if not started yet."""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        self.__tracemalloc = tracemalloc
+        self.__reset_peak = hasattr(tracemalloc, 'reset_peak')  # Python 3.9+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+        add_recorder(self, on_start=self.phase_started)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop recording, then write the report as text and JSON."""
+        remove_recorder(self)
+        current, peak = self.__tracemalloc.get_traced_memory()
+        if self.__started_tracing:
+            self.__tracemalloc.stop()
+
+        _makedirs_for(self.path)
+        with open(self.path + '.json', 'w', encoding='utf-8') as file:
+            _json.dump({'phases': self.phases, 'current_bytes': current,
+                        'peak_bytes': peak}, file, indent=2)
+        with open(self.path + '.txt', 'w', encoding='utf-8') as file:
+            file.write(self.table() + _os.linesep)
+        print(f'{__package__}: memory profile written to {self.path}.{{txt,json}}',
+              file=_sys.stderr)
+
+    def table(self) -> str:
+        """Return the report formatted as text, ordered as `PHASES`."""
+        names: List[str] = [name for name in PHASES if name in self.phases] + \
+            sorted(name for name in self.phases if name not in PHASES)
+
+        lines: List[str] = [f"{'phase':<16}{'calls':>8}{'peak KiB':>14}{'retained KiB':>14}"]
+        for name in names:
+            report: dict = self.phases[name]
+            peak: str = 'n/a' if report['peak_bytes'] is None else \
+                f"{report['peak_bytes'] / 1024:.1f}"
+            lines.append(f"{name:<16}{report['calls']:>8}{peak:>14}" +
+                         f"{report['retained_bytes'] / 1024:>14.1f}")
+            lines.extend(f"{'':<8}{top['size_bytes'] / 1024:>10.1f} KiB  {top['line']}"
+                         for top in report['top'])
+        return _os.linesep.join(lines)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Callable, ContextManager, Dict, List, Optional, TextIO, Tuple
@@ -0,0 +1,384 @@
+"""Profiles Module for `JMBuilder`
+
+This module evaluates the Maven profiles declared in the POM files (see
+`jmbuilder.core.PomModel.profiles`), and merges the properties of the active
+profiles with the user properties given in the command-line, for example::
+
+    $ python -m jmbuilder -P release -Dbuild.qualifier=rc1 \\
+    >                     --fix-prop pom.xml setup.properties
+
+As in Maven, a profile is active if either:
+
+- it is activated explicitly (``-P <id>``), and not deactivated
+  (``-P !<id>`` or ``-P -<id>``);
+- all conditions of its ``<activation>`` are met, checking the user
+  properties (and ``env.*`` environment variables), the JDK version,
+  the operating system and the existence of files;
+- it is active by default, and no other profile of the POM is active.
+
+The merged properties are cached per POM model, profile IDs, user properties
+and base directory, so that repeated renders with the same profiles share the
+map. The cache is cleared by `clear_cache`, e.g., when the environment changed.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+Activation
+    The conditions to activate a profile.
+
+Profile
+    A profile declared in the POM.
+
+Available Functions
+-------------------
+active_profiles
+    Return the active profiles, in the order of their declaration.
+
+clear_cache
+    Clear the cached merged properties and the detected JDK version.
+
+is_active
+    Return whether the activation conditions of the profile are met.
+
+java_version
+    Return the version of the installed JDK, if any.
+
+resolve_properties
+    Return the POM properties merged with the active profiles and user properties.
+
+"""
+
+import os as _os
+import re as _re
+import sys as _sys
+import platform as _platform
+import threading as _threading
+import functools as _functools
+import subprocess as _subprocess
+from collections import OrderedDict as _OrderedDict
+from types import MappingProxyType as _MappingProxyType
+from typing import Any, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from . import versions as _versions
+from . import _globals
+
+
+__all__ = ['Activation', 'Profile', 'active_profiles', 'clear_cache', 'is_active',
+           'java_version', 'resolve_properties']
+
+# The maximum number of merged property maps to be cached
+CACHE_SIZE: int = 128
+
+_CACHE: '_OrderedDict[tuple, Tuple[Any, Mapping[str, str]]]' = _OrderedDict()
+_CACHE_LOCK: _threading.Lock = _threading.Lock()
+
+# The `os.arch` reported by Java for the machine names reported by Python
+_JAVA_ARCH: Mapping[str, str] = {'x86_64': 'amd64', 'i686': 'x86', 'i386': 'x86'}
+
+
+class Activation(NamedTuple):
+    """The conditions to activate a profile, all of them must be met."""
+    active_by_default: bool = False
+    jdk: Optional[str] = None
+    os_family: Optional[str] = None
+    os_name: Optional[str] = None
+    os_arch: Optional[str] = None
+    os_version: Optional[str] = None
+    property_name: Optional[str] = None
+    property_value: Optional[str] = None
+    file_exists: Optional[str] = None
+    file_missing: Optional[str] = None
+
+    @property
+    def has_conditions(self) -> bool:
+        """Return whether any condition is declared, besides the default activation."""
+        return any(value is not None for value in self[1:])
+
+
+class Profile(NamedTuple):
+    """A profile declared in the POM."""
+    id: str
+    activation: Activation
+    properties: Mapping[str, str]
+
+
+@_functools.lru_cache(maxsize=None)
+def java_version() -> Optional[str]:
+    """
+    Return the version of the installed JDK (``java -version``), if any.
+
+    The version is detected once, on the first call.
+
+    Returns
+    -------
+    str or None :
+        The JDK version (e.g., ``'17.0.2'``), or None if not installed.
+
+    """
+    java: str = _os.path.join(_os.environ['JAVA_HOME'], 'bin', 'java') \
+        if 'JAVA_HOME' in _os.environ else 'java'
+    try:
+        output: str = _subprocess.run(
+            [java, '-version'], stdout=_subprocess.PIPE, stderr=_subprocess.STDOUT,
+            timeout=10, check=False).stdout.decode('UTF-8', 'replace')
+    except (OSError, _subprocess.SubprocessError):
+        return None
+    match: Optional[_re.Match] = _re.search(r'version "([^"]+)"', output)
+    return match[1] if match else None
+
+
+def clear_cache() -> None:
+    """
+    Clear the cached merged properties and the detected JDK version, e.g.,
+    when the environment variables have been changed.
+    """
+    with _CACHE_LOCK:
+        _CACHE.clear()
+    java_version.cache_clear()
+
+
+def _jdk_prefix(version: str, bound: str) -> str:
+    """
+    Return the leading parts of the JDK version, as many as the bound has, so the
+    bounds are compared with the prefix of the version (``11.0.2`` is within ``[11]``).
+    """
+    parts: List[str] = _re.split(r'([.-])', version)
+    return ''.join(parts[:2 * len(_re.split(r'[.-]', bound)) - 1])
+
+
+def _match_jdk(spec: str, version: Optional[str]) -> bool:
+    """Return whether the JDK version matches the prefix (``1.8``) or ranges (``[11,)``)."""
+    if version is None:
+        return False
+    if spec.startswith('!'):
+        return not _match_jdk(spec[1:], version)
+    if not spec.startswith(('[', '(')):
+        return version.startswith(spec)
+
+    try:
+        restrictions: Tuple[_versions.Restriction, ...] = \
+            _versions.VersionRange.parse(spec).restrictions
+    except ValueError:
+        return False
+    # Ordered as the dependency versions, each bound against the version prefix
+    return any(
+        (item.lower is None or _jdk_prefix(version, item.lower) in _versions.Restriction(
+            item.lower, item.lower_inclusive, None, False)) and
+        (item.upper is None or _jdk_prefix(version, item.upper) in _versions.Restriction(
+            None, False, item.upper, item.upper_inclusive))
+        for item in restrictions)
+
+
+def _match_os_family(family: str) -> bool:
+    """Return whether the operating system belongs to the family, as named by Maven."""
+    if family.startswith('!'):
+        return not _match_os_family(family[1:])
+    family = family.lower()
+    if family == 'windows':
+        return _os.name == 'nt'
+    if family == 'mac':
+        return _sys.platform == 'darwin'
+    if family == 'unix':
+        return _os.pathsep == ':'
+    if family == 'dos':
+        return _os.pathsep == ';' and _os.name != 'nt'
+    return False
+
+
+def _match_value(expected: str, actual: Optional[str]) -> bool:
+    """Return whether the value equals (case-insensitive), or not if prefixed with '!'."""
+    if expected.startswith('!'):
+        return not _match_value(expected[1:], actual)
+    return actual is not None and expected.lower() == actual.lower()
+
+
+def is_active(activation: Activation, properties: Optional[Mapping[str, str]] = None,
+              basedir: Optional[str] = None) -> bool:
+    """
+    Return whether the activation conditions are all met.
+
+    Parameters
+    ----------
+    activation : Activation
+        The conditions to be checked.
+
+    properties : mapping, optional
+        The user properties (e.g., given by ``-D`` in the command-line).
+        The ``env.*`` properties are looked up in the environment variables,
+        and ``java.version`` defaults to the installed JDK version.
+
+    basedir : str, optional
+        The directory to resolve the relative file paths against.
+        Defaults to the current working directory.
+
+    Returns
+    -------
+    bool :
+        True if at least one condition is declared and all of them are met.
+
+    """
+    if not activation.has_conditions:
+        return False
+    properties = properties or {}
+
+    def lookup(name: str) -> 'Optional[str]':
+        if name in properties:
+            return properties[name]
+        if name.startswith('env.'):
+            return _os.environ.get(name[4:])
+        return java_version() if name == 'java.version' else None
+
+    if activation.jdk is not None and \
+            not _match_jdk(activation.jdk.strip(), lookup('java.version')):
+        return False
+
+    for expected, actual in ((activation.os_name, _platform.system()),
+                             (activation.os_arch, _JAVA_ARCH.get(_platform.machine(),
+                                                                 _platform.machine())),
+                             (activation.os_version, _platform.release())):
+        if expected is not None and not _match_value(expected, actual):
+            return False
+    if activation.os_family is not None and not _match_os_family(activation.os_family):
+        return False
+
+    if activation.property_name:
+        name: str = activation.property_name
+        if name.startswith('!'):  # The property must not be defined
+            if lookup(name[1:]) is not None:
+                return False
+        elif activation.property_value is None:
+            if lookup(name) is None:
+                return False
+        elif activation.property_value.startswith('!'):
+            if lookup(name) == activation.property_value[1:]:
+                return False
+        elif lookup(name) != activation.property_value:
+            return False
+
+    basedir = basedir or _os.getcwd()
+    for path, should_exist in ((activation.file_exists, True),
+                               (activation.file_missing, False)):
+        if path is not None:
+            path = path.replace('${project.basedir}', basedir).replace('${basedir}', basedir)
+            if _os.path.exists(_os.path.join(basedir, path)) != should_exist:
+                return False
+
+    return True
+
+
+def active_profiles(profiles: Iterable[Profile], activate: Iterable[str] = (),
+                    properties: Optional[Mapping[str, str]] = None,
+                    basedir: Optional[str] = None) -> Tuple[Profile, ...]:
+    """
+    Return the active profiles, in the order of their declaration.
+
+    Parameters
+    ----------
+    profiles : iterable of Profile
+        The profiles declared in the POM.
+
+    activate : iterable of str, optional
+        The IDs of profiles to be activated explicitly (i.e., ``-P``), or
+        deactivated if prefixed with ``!`` or ``-``. The IDs may also be
+        comma-separated.
+
+    properties : mapping, optional
+        The user properties, see `is_active`.
+
+    basedir : str, optional
+        The directory to resolve the relative file paths against, see `is_active`.
+
+    Returns
+    -------
+    tuple of Profile :
+        The active profiles.
+
+    """
+    enabled: set = set()
+    disabled: set = set()
+    for ids in activate:
+        for profile_id in filter(None, (part.strip() for part in ids.split(','))):
+            if profile_id[0] in '!-':
+                disabled.add(profile_id[1:])
+            else:
+                enabled.add(profile_id)
+
+    profiles = [profile for profile in profiles if profile.id not in disabled]
+    active: Tuple[Profile, ...] = tuple(
+        profile for profile in profiles if profile.id in enabled or
+        is_active(profile.activation, properties, basedir))
+    return active or tuple(profile for profile in profiles
+                           if profile.activation.active_by_default)
+
+
+def resolve_properties(model: Any, activate: Iterable[str] = (),
+                       properties: Optional[Mapping[str, str]] = None,
+                       basedir: Optional[str] = None) -> Mapping[str, str]:
+    """
+    Return the POM properties merged with the active profiles and user properties.
+
+    The properties of active profiles override the POM properties, in the
+    order of their declaration, and the user properties override them all.
+    The merged map is cached per model, profile IDs, user properties and
+    base directory, so the profiles are only activated once for them.
+
+    Parameters
+    ----------
+    model : PomModel
+        The model of the POM, see `jmbuilder.core.PomParser.to_model`.
+
+    activate : iterable of str, optional
+        The IDs of profiles to be activated or deactivated, see `active_profiles`.
+
+    properties : mapping, optional
+        The user properties (e.g., given by ``-D`` in the command-line).
+
+    basedir : str, optional
+        The directory to resolve the relative file paths against, see `is_active`.
+
+    Returns
+    -------
+    mapping :
+        The read-only merged properties.
+
+    Notes
+    -----
+    The activation conditions (e.g., the existence of files) are checked
+    on the first call only, the later calls for the same cached model
+    return the same map.
+
+    """
+    properties = properties or {}
+    activate = tuple(activate)
+    # The model is kept in the entry, so its ID is not reused while cached
+    key: tuple = (id(model), activate, tuple(sorted(properties.items())),
+                  basedir or _os.getcwd())
+    with _CACHE_LOCK:
+        entry: Optional[Tuple[Any, Mapping[str, str]]] = _CACHE.get(key)
+        if entry is not None and entry[0] is model:
+            _CACHE.move_to_end(key)
+            return entry[1]
+
+    active: Tuple[Profile, ...] = active_profiles(model.profiles, activate, properties, basedir)
+    merged: dict = dict(model.properties)
+    for profile in active:
+        merged.update(profile.properties)
+    merged.update(properties)
+
+    result: Mapping[str, str] = _MappingProxyType(merged)
+    with _CACHE_LOCK:
+        _CACHE[key] = (model, result)
+        while len(_CACHE) > CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return result
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Iterable, List, Mapping, NamedTuple, Optional, Tuple
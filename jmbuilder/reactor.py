@@ -0,0 +1,337 @@
+"""Reactor Module for `JMBuilder`
+
+This module discovers the modules of a multi-module Maven project (the
+"reactor") and builds their graph, for example::
+
+    >>> from jmbuilder.reactor import scan
+    >>> reactor = scan('path/to/project')
+    >>> [[module.key for module in level] for level in reactor.levels()]
+    [['com.example:parent'], ['com.example:util'], ['com.example:core', ...]]
+
+The modules are discovered from the root POM by following its ``<modules>``
+(recursively) and the ``<parent>`` of each module. Loose trees, having no
+aggregator POM at their root, are discovered by walking the directories
+using `os.scandir` instead. Each POM file is parsed exactly once.
+
+The graph has an edge from each module to its parent and to the other
+modules of the reactor it depends on, and is sorted topologically into
+levels: the modules of a level only depend on modules of previous levels,
+so the modules within a level can be processed in parallel.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+Module
+    A module of the reactor, with its parsed POM and coordinates.
+
+Reactor
+    The graph of the modules, sorted topologically.
+
+Available Functions
+-------------------
+scan
+    Discover the modules of a project and return their graph.
+
+"""
+
+import os as _os
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from . import exception as _jmexc
+from .core import Parent, PomModel, PomParser
+from . import _globals
+
+
+__all__ = ['Module', 'Reactor', 'scan']
+
+# The directories that never contain modules, skipped while walking a loose tree
+SKIP_DIRS: frozenset = frozenset({'target', 'node_modules', '__pycache__'})
+
+
+class Module(NamedTuple):
+    """
+    A module of the reactor.
+
+    The `parent` and `dependencies` are the coordinates (``groupId:artifactId``)
+    declared by the POM, they may refer to artifacts outside the reactor.
+
+    """
+    path: str
+    model: PomModel
+    group_id: Optional[str]
+    artifact_id: str
+    version: Optional[str]
+    parent: Optional[str]
+    dependencies: Tuple[str, ...]
+    modules: Tuple[str, ...]
+
+    @property
+    def key(self) -> str:
+        """Return the ``groupId:artifactId`` coordinates of this module."""
+        return f'{self.group_id}:{self.artifact_id}'
+
+    @property
+    def basedir(self) -> str:
+        """Return the directory containing the POM file."""
+        return _os.path.dirname(self.path)
+
+    @staticmethod
+    def from_model(path: str, model: PomModel) -> 'Module':
+        """
+        Create the module from the model of its POM.
+
+        Parameters
+        ----------
+        path : str
+            The path of the POM file.
+
+        model : PomModel
+            The model of the POM file.
+
+        Returns
+        -------
+        Module :
+            The module, with the group ID and version inherited from
+            the parent if not declared.
+
+        Raises
+        ------
+        JMParserError :
+            If the POM declares no ``artifactId``.
+
+        """
+        if not model.artifact_id:
+            raise _jmexc.JMParserError('No artifactId declared in POM: %s', path)
+
+        parent: Parent = model.parent or Parent(None, None, None)
+        return Module(
+            path=path,
+            model=model,
+            group_id=model.group_id or parent.group_id,
+            artifact_id=model.artifact_id,
+            version=model.version or parent.version,
+            parent=parent.key if model.parent else None,
+            dependencies=tuple(dict.fromkeys(dep.key for dep in model.dependencies)),
+            modules=model.modules
+        )
+
+
+class Reactor:
+    """
+    The graph of the modules of a project.
+
+    Parameters
+    ----------
+    modules : iterable of Module
+        The modules, in the order of their discovery.
+
+    Raises
+    ------
+    JMException :
+        If more than one module have the same coordinates.
+
+    """
+
+    def __init__(self, modules: Iterable[Module]) -> None:
+        """Create a new instance of ``Reactor`` class."""
+        self.modules: Dict[str, Module] = {}
+        for module in modules:
+            if module.key in self.modules:
+                raise _jmexc.JMException('Duplicate module %s: %s and %s', module.key,
+                                         self.modules[module.key].path, module.path)
+            self.modules[module.key] = module
+
+        self.__upstream: Dict[str, Tuple[str, ...]] = {}
+        self.__downstream: Dict[str, List[str]] = {key: [] for key in self.modules}
+        for key, module in self.modules.items():
+            edges: List[str] = [dep for dep in ((module.parent,) + module.dependencies)
+                                if dep in self.modules and dep != key]
+            self.__upstream[key] = tuple(dict.fromkeys(edges))
+            for dep in self.__upstream[key]:
+                self.__downstream[dep].append(key)
+        self.__levels: Optional[List[List[Module]]] = None
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+    def __iter__(self) -> Iterator[Module]:
+        return iter(self.order())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.modules
+
+    def __getitem__(self, key: str) -> Module:
+        return self.modules[key]
+
+    def upstream(self, key: str) -> Tuple[str, ...]:
+        """Return the keys of the modules that the given module directly depends on."""
+        return self.__upstream[key]
+
+    def downstream(self, key: str) -> Tuple[str, ...]:
+        """Return the keys of the modules that directly depend on the given module."""
+        return tuple(self.__downstream[key])
+
+    def levels(self) -> List[List[Module]]:
+        """
+        Return the modules sorted topologically into levels.
+
+        The modules of each level only depend on the modules of the previous
+        levels, and keep the order of their discovery within a level.
+
+        Returns
+        -------
+        list of list of Module :
+            The levels of modules.
+
+        Raises
+        ------
+        JMException :
+            If the modules depend on each other in a cycle.
+
+        """
+        if self.__levels is not None:
+            return self.__levels
+
+        indegree: Dict[str, int] = {key: len(edges) for key, edges in self.__upstream.items()}
+        current: List[str] = [key for key, count in indegree.items() if count == 0]
+        levels: List[List[Module]] = []
+        while current:
+            levels.append([self.modules[key] for key in current])
+            ready: Set[str] = set()
+            for key in current:
+                for dep in self.__downstream[key]:
+                    indegree[dep] -= 1
+                    if indegree[dep] == 0:
+                        ready.add(dep)
+            current = [key for key in self.modules if key in ready]
+
+        cycle: List[str] = [key for key, count in indegree.items() if count > 0]
+        if cycle:
+            raise _jmexc.JMException('Cyclic dependencies between the modules: %s',
+                                     ', '.join(cycle))
+        self.__levels = levels
+        return levels
+
+    def order(self) -> List[Module]:
+        """Return the modules sorted topologically, flattening the levels."""
+        return [module for level in self.levels() for module in level]
+
+
+def _walk(root: str) -> Iterator[str]:
+    """Yield the paths of POM files within the directory tree, using `os.scandir`."""
+    stack: List[str] = [root]
+    while stack:
+        dirs: List[str] = []
+        try:
+            with _os.scandir(stack.pop()) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith('.') and entry.name not in SKIP_DIRS:
+                            dirs.append(entry.path)
+                    elif entry.name == 'pom.xml':
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(dirs))
+
+
+def scan(root: str, *, walk: Optional[bool] = None, encoding: str = 'UTF-8') -> Reactor:
+    """
+    Discover the modules of a project and return their graph.
+
+    Parameters
+    ----------
+    root : str
+        The path to the root POM file, or to the directory containing it.
+
+    walk : bool, optional
+        Whether to also walk the directory tree of the root, discovering the
+        POM files not linked by ``<modules>``. Defaults to walk only when
+        the root has no POM file or the root POM declares no modules.
+
+    encoding : str, optional
+        The encoding used while parsing the POM files. Defaults to UTF-8.
+
+    Returns
+    -------
+    Reactor :
+        The graph of the discovered modules.
+
+    Raises
+    ------
+    JMException :
+        If the root does not exist.
+
+    """
+    root = _os.path.abspath(root)
+    root_pom: str = root
+    if _os.path.isdir(root):
+        root_pom = _os.path.join(root, 'pom.xml')
+    elif _os.path.isfile(root):
+        root = _os.path.dirname(root)
+    else:
+        raise _jmexc.JMException('No such file or directory: %s', root)
+
+    # By the real path, to parse each POM exactly once; None if not a file
+    parsed: Dict[str, Optional[Module]] = {}
+    # The modules of the reactor by their real path, in the order of discovery
+    found: Dict[str, Module] = {}
+
+    def parse(path: str) -> 'Optional[Module]':
+        real: str = _os.path.realpath(path)
+        if real not in parsed:
+            # Keep only the model, the parsed document is released
+            parsed[real] = Module.from_model(
+                path, PomParser.parse(path, encoding=encoding).to_model()) \
+                if _os.path.isfile(real) else None
+        return parsed[real]
+
+    def visit(path: str) -> 'Optional[Module]':
+        module: Optional[Module] = parse(path)
+        if module is not None:
+            found.setdefault(_os.path.realpath(path), module)
+        return module
+
+    def visit_parents(module: Module) -> None:
+        # Follow the parents found at their relative paths, up to the topmost one
+        while module.parent:
+            relpath: Optional[str] = module.model.parent.relative_path
+            if relpath == '':  # An empty relative path disables the lookup, as in Maven
+                return
+            path: str = _os.path.join(module.basedir, relpath or '..')
+            if not path.endswith('.xml'):
+                path = _os.path.join(path, 'pom.xml')
+            if _os.path.realpath(path) in found:
+                return
+            parent: Optional[Module] = parse(path)
+            if parent is None or parent.key != module.parent:
+                return  # Not the declared parent, only its lookup stops here
+            module = visit(path)
+
+    queue: List[str] = [root_pom]
+    while queue:
+        module: Optional[Module] = visit(queue.pop(0))
+        if module is None:
+            continue
+        for name in module.modules:
+            path: str = _os.path.join(module.basedir, name)
+            queue.append(path if path.endswith('.xml') else _os.path.join(path, 'pom.xml'))
+        visit_parents(module)
+
+    root_module: Optional[Module] = found.get(_os.path.realpath(root_pom))
+    if walk or (walk is None and (root_module is None or not root_module.modules)):
+        for path in _walk(root):
+            visit(path)
+
+    return Reactor(found.values())
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
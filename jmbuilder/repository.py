@@ -0,0 +1,323 @@
+"""Repository Module for `JMBuilder`
+
+This module indexes a local Maven repository (``~/.m2/repository`` by default),
+mapping the coordinates of each artifact (``groupId:artifactId:version``) to
+its POM file, for example::
+
+    >>> from jmbuilder.repository import LocalRepository
+    >>> repo = LocalRepository()
+    >>> repo.find('org.junit', 'junit-bom', '5.10.0')
+    '/home/user/.m2/repository/org/junit/junit-bom/5.10.0/junit-bom-5.10.0.pom'
+
+The index is built by walking the repository with `os.scandir`, spread
+across a pool of threads (the directory reads release the GIL), and is
+persisted in a cache file. The modification time of each directory is
+kept along with its entries, so that the next refresh only reads again
+the directories that changed since (e.g., a new version downloaded), and
+merely checks the status of the others.
+
+The index is used by `jmbuilder.core.PomParser` to resolve the parents and
+the imported BOMs (``<scope>import</scope>``) offline.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+LocalRepository
+    The index of a local Maven repository.
+
+Available Functions
+-------------------
+default_root
+    Return the path to the default local repository.
+
+"""
+
+import os as _os
+import json as _json
+import time as _time
+import hashlib as _hashlib
+import threading as _threading
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .versions import version_key
+from . import _globals
+from ._globals import TMPDIR
+
+
+__all__ = ['LocalRepository', 'default_root']
+
+# The version of the cache file format, the cache files of other versions are ignored
+INDEX_FORMAT: int = 1
+
+# The number of directories read by each task of the walk
+BATCH_SIZE: int = 64
+
+# The directories modified within this period before the walk (in nanoseconds)
+# are read again on the next refresh, since they may change again within the
+# granularity of their modification time
+_RACY_PERIOD: int = 2_000_000_000
+
+# The entry of each directory: its modification time (in nanoseconds), the names
+# of its subdirectories, and whether it contains the POM of an artifact version
+_Entry = Tuple[int, Tuple[str, ...], bool]
+
+
+def default_root() -> str:
+    """
+    Return the path to the default local repository.
+
+    Returns
+    -------
+    str :
+        The value of ``M2_REPO`` environment variable if set, otherwise
+        ``~/.m2/repository``.
+
+    """
+    return _os.environ.get('M2_REPO') or \
+        _os.path.join(_os.path.expanduser('~'), '.m2', 'repository')
+
+
+class LocalRepository:
+    """
+    The index of a local Maven repository.
+
+    The repository is walked on the first lookup (or `refresh`), loading
+    the index persisted by the previous walk if any.
+
+    Parameters
+    ----------
+    root : str, optional
+        The path to the repository. Defaults to `default_root()`.
+
+    index_file : str, optional
+        The path to the cache file of the index. Defaults to a file inside
+        `TMPDIR`, named after the repository path. Use an empty string to
+        disable the persistence.
+
+    workers : int, optional
+        The number of threads walking the repository. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
+
+    """
+
+    def __init__(self, root: Optional[str] = None, *, index_file: Optional[str] = None,
+                 workers: Optional[int] = None) -> None:
+        """Create a new index of the local repository."""
+        self.root: str = _os.path.abspath(root or default_root())
+        self.index_file: str = index_file if index_file is not None else _os.path.join(
+            TMPDIR, 'repository-' +
+            _hashlib.sha1(self.root.encode('UTF-8')).hexdigest()[:12] + '.json')
+        self.workers: Optional[int] = workers
+
+        self.__lock: _threading.Lock = _threading.Lock()
+        self.__dirs: Optional[Dict[str, _Entry]] = None
+        self.__poms: Dict[Tuple[str, str, str], str] = {}
+        self.__versions: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        self.__ensure()
+        return len(self.__poms)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, str]]:
+        self.__ensure()
+        return iter(tuple(self.__poms))
+
+    def __contains__(self, coords: Tuple[str, str, str]) -> bool:
+        return self.find(*coords) is not None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.root!r})'
+
+    def __ensure(self) -> None:
+        if self.__dirs is None:
+            self.refresh()
+
+    def __load(self) -> Dict[str, _Entry]:
+        """Load the persisted entries of the directories, if any."""
+        try:
+            with open(self.index_file, 'r', encoding='UTF-8') as file:
+                data: dict = _json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('format') != INDEX_FORMAT or \
+                data.get('root') != self.root:
+            return {}
+        return {relpath: (mtime, tuple(subdirs), pom)
+                for relpath, (mtime, subdirs, pom) in data['dirs'].items()}
+
+    def __save(self, dirs: Dict[str, _Entry]) -> None:
+        """Persist the entries of the directories, replacing the cache file atomically."""
+        parentdir: str = _os.path.dirname(self.index_file)
+        if parentdir:
+            _os.makedirs(parentdir, exist_ok=True)
+        tmpfile: str = f'{self.index_file}.{_os.getpid()}.tmp'
+        with open(tmpfile, 'w', encoding='UTF-8') as file:
+            _json.dump({'format': INDEX_FORMAT, 'root': self.root, 'dirs': dirs},
+                       file, separators=(',', ':'))
+        _os.replace(tmpfile, self.index_file)
+
+    def __scan(self, relpath: str, cached: Optional[_Entry],
+               since: int) -> Tuple[Optional[_Entry], bool]:
+        """
+        Return the entry of the directory, and whether it was read again.
+        The entry is None if the directory no longer exists.
+        """
+        path: str = self.root + _os.sep + relpath.replace('/', _os.sep) if relpath else self.root
+        try:
+            mtime: int = _os.stat(path).st_mtime_ns
+        except OSError:
+            return None, False
+        if cached is not None and cached[0] == mtime:
+            return cached, False
+
+        # The POM of a version, i.e. `<groupId>/<artifactId>/<version>/<artifactId>-<version>.pom`
+        parts: List[str] = relpath.split('/')
+        pom_name: Optional[str] = f'{parts[-2]}-{parts[-1]}.pom' if len(parts) >= 3 else None
+        subdirs: List[str] = []
+        has_pom: bool = False
+        try:
+            with _os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.name == pom_name:
+                        has_pom = True
+        except OSError:
+            mtime = -1  # Read it again on the next refresh
+
+        return (mtime if mtime < since else -1, tuple(sorted(subdirs)), has_pom), True
+
+    def refresh(self) -> int:
+        """
+        Walk the repository, reading again only the directories changed since
+        the previous walk, and persist the index if anything changed.
+
+        Returns
+        -------
+        int :
+            The number of directories read.
+
+        """
+        with self.__lock:
+            old: Dict[str, _Entry] = self.__dirs if self.__dirs is not None else self.__load()
+            since: int = _time.time_ns() - _RACY_PERIOD
+            dirs: Dict[str, _Entry] = {}
+            scanned: int = 0
+
+            def scan_batch(batch: 'List[str]') -> 'List[Tuple[str, Optional[_Entry], bool]]':
+                return [(relpath, *self.__scan(relpath, old.get(relpath), since))
+                        for relpath in batch]
+
+            frontier: List[str] = ['']
+            with _ThreadPoolExecutor(self.workers) as pool:
+                while frontier:
+                    batches = pool.map(scan_batch, (frontier[idx:idx + BATCH_SIZE]
+                                                    for idx in range(0, len(frontier),
+                                                                     BATCH_SIZE)))
+                    frontier = []
+                    for results in batches:
+                        for relpath, entry, rescanned in results:
+                            if entry is None:
+                                continue
+                            dirs[relpath] = entry
+                            scanned += rescanned
+                            frontier.extend(f'{relpath}/{name}' if relpath else name
+                                            for name in entry[1])
+
+            changed: bool = bool(scanned) or dirs.keys() != old.keys()
+            if changed or self.__dirs is None:
+                self.__dirs = dirs
+                self.__build()
+            if self.index_file and changed:
+                try:
+                    self.__save(dirs)
+                except OSError:
+                    pass  # The index is only a cache, the next walk reads everything again
+            return scanned
+
+    def __build(self) -> None:
+        """Build the lookup tables from the entries of the directories."""
+        poms: Dict[Tuple[str, str, str], str] = {}
+        versions: Dict[Tuple[str, str], List[str]] = {}
+        for relpath, (_, _, has_pom) in self.__dirs.items():
+            if has_pom:
+                *group, artifact_id, version = relpath.split('/')
+                coords: Tuple[str, str, str] = ('.'.join(group), artifact_id, version)
+                poms[coords] = relpath
+                versions.setdefault(coords[:2], []).append(version)
+        self.__poms = poms
+        self.__versions = {key: tuple(sorted(values, key=version_key))
+                           for key, values in versions.items()}
+
+    def __pom_path(self, group_id: str, artifact_id: str, version: str) -> str:
+        return _os.path.join(self.root, *group_id.split('.'), artifact_id, version,
+                             f'{artifact_id}-{version}.pom')
+
+    def find(self, group_id: str, artifact_id: str, version: str) -> Optional[str]:
+        """
+        Return the path to the POM file of the given artifact version.
+
+        The artifacts missing from the index (e.g., installed after the
+        last refresh) are looked up directly in the repository.
+
+        Parameters
+        ----------
+        group_id : str
+            The group ID of the artifact.
+
+        artifact_id : str
+            The artifact ID.
+
+        version : str
+            The version of the artifact.
+
+        Returns
+        -------
+        str or None :
+            The path to the POM file, or None if the artifact is not installed.
+
+        """
+        self.__ensure()
+        if (group_id, artifact_id, version) in self.__poms:
+            return self.__pom_path(group_id, artifact_id, version)
+        if not (group_id and artifact_id and version) or '/' in group_id + artifact_id + version:
+            return None
+        path: str = self.__pom_path(group_id, artifact_id, version)
+        return path if _os.path.isfile(path) else None
+
+    def versions(self, group_id: str, artifact_id: str) -> Tuple[str, ...]:
+        """
+        Return the indexed versions of the artifact, from the oldest to the newest.
+
+        The versions are ordered as Maven does (see `jmbuilder.versions`).
+
+        Parameters
+        ----------
+        group_id : str
+            The group ID of the artifact.
+
+        artifact_id : str
+            The artifact ID.
+
+        Returns
+        -------
+        tuple of str :
+            The versions of the artifact, empty if not installed.
+
+        """
+        self.__ensure()
+        return self.__versions.get((group_id, artifact_id), ())
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Dict, Iterator, List, Optional, Tuple
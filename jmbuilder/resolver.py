@@ -0,0 +1,357 @@
+"""Resolver Module for `JMBuilder`
+
+This module resolves the transitive dependencies of a project offline,
+walking the POM files installed in the local repository (see
+`jmbuilder.repository`), for example::
+
+    >>> from jmbuilder.resolver import Resolver
+    >>> resolution = Resolver().resolve('pom.xml')
+    >>> resolution.class_path()
+    ['commons-lang3-3.14.0.jar', 'slf4j-api-2.0.9.jar', ...]
+
+The graph is walked breadth-first, as in Maven:
+
+- the scope of a transitive dependency is derived from the scope of the
+  dependency pulling it in, the ``provided`` and ``test`` dependencies of
+  the dependencies are omitted, and so are their optional dependencies;
+- the exclusions are inherited by the whole subtree of the dependency;
+- the nearest declaration of an artifact wins over the deeper ones, and
+  the first one wins at the same depth (i.e., nearest-wins mediation);
+- the versions and scopes managed by the project override the transitive ones;
+- the version ranges (e.g., ``[1.0,2.0)``) resolve to the highest version
+  installed within the range (see `jmbuilder.versions`).
+
+Each POM is loaded only once per `Resolver` (including by concurrent
+resolutions), and the POM files of each level of the graph are loaded
+in parallel on a thread pool.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+Node
+    A dependency resolved into the graph.
+
+Omitted
+    A dependency omitted from the graph, and the reason.
+
+Resolution
+    The resolved graph of the dependencies of a project.
+
+Resolver
+    The resolver of transitive dependencies, memoizing the loaded POMs.
+
+"""
+
+import threading as _threading
+from concurrent.futures import Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from .core import Dependency, PomModel, PomParser
+from .repository import LocalRepository
+from .versions import VersionRange
+from . import _globals
+
+
+__all__ = ['Node', 'Omitted', 'Resolution', 'Resolver']
+
+# The scopes resolved by default, i.e. the runtime class path
+DEFAULT_SCOPES: Tuple[str, ...] = ('compile', 'runtime')
+
+# The scope of a transitive dependency, by the scope of the dependency pulling
+# it in and its own scope. The other transitive scopes are omitted, as in Maven
+_TRANSITIVE_SCOPES: Dict[Tuple[str, str], str] = {
+    ('compile', 'compile'): 'compile', ('compile', 'runtime'): 'runtime',
+    ('provided', 'compile'): 'provided', ('provided', 'runtime'): 'provided',
+    ('runtime', 'compile'): 'runtime', ('runtime', 'runtime'): 'runtime',
+    ('test', 'compile'): 'test', ('test', 'runtime'): 'test'
+}
+
+# The scopes from the widest, to widen the scope of a mediated dependency
+_SCOPE_RANKS: Dict[str, int] = {'compile': 0, 'runtime': 1, 'provided': 2, 'test': 3}
+
+_Coords = Tuple[str, str, str]
+
+
+class Node(NamedTuple):
+    """
+    A dependency resolved into the graph.
+
+    The `dependency` has its version and scope mediated. The `parent` is the
+    conflict key (see `Resolution`) of the node that pulled it in, None for
+    the direct dependencies. The `model` and `path` of its POM are None if
+    the POM is not installed in the local repository.
+
+    """
+    dependency: Dependency
+    depth: int
+    parent: Optional[Tuple[str, str, str, Optional[str]]]
+    model: Optional[PomModel]
+    path: Optional[str]
+
+
+class Omitted(NamedTuple):
+    """A dependency omitted from the graph, as pulled in by its parent."""
+    dependency: Dependency
+    parent: Optional[Tuple[str, str, str, Optional[str]]]
+    reason: str  # 'conflict', 'duplicate', 'excluded', 'optional' or 'scope'
+
+
+class Resolution(NamedTuple):
+    """
+    The resolved graph of the dependencies of a project.
+
+    The nodes are keyed by their conflict keys, i.e. the coordinates
+    ``(groupId, artifactId, type, classifier)``, in the order of resolution
+    (breadth-first). The `missing` dependencies are those whose POM is not
+    installed, whose version is not declared, or whose version range is
+    not satisfied by the installed versions; their dependencies are not
+    resolved. The latter two have no version to be used, so they are not
+    part of the nodes (nor of the `class_path`).
+
+    """
+    model: PomModel
+    nodes: Dict[Tuple[str, str, str, Optional[str]], Node]
+    omitted: Tuple[Omitted, ...]
+    missing: Tuple[Dependency, ...]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterable[Node]:
+        return iter(self.nodes.values())
+
+    def children(self, key: Optional[Tuple[str, str, str, Optional[str]]]) -> Tuple[Node, ...]:
+        """Return the nodes pulled in by the given node, or the direct ones if None."""
+        return tuple(node for node in self.nodes.values() if node.parent == key)
+
+    def class_path(self, scopes: Sequence[str] = DEFAULT_SCOPES) -> List[str]:
+        """
+        Return the file names of the JAR dependencies, for the ``Class-Path``
+        attribute of the manifest.
+
+        Parameters
+        ----------
+        scopes : sequence of str, optional
+            The scopes to be included. Defaults to ``compile`` and ``runtime``.
+
+        Returns
+        -------
+        list of str :
+            The file names (e.g., ``slf4j-api-2.0.9.jar``), in the order of resolution.
+
+        """
+        return [
+            f'{dep.artifact_id}-{dep.version}' + (f'-{dep.classifier}' if dep.classifier else '')
+            + '.jar' for dep in (node.dependency for node in self.nodes.values())
+            if dep.type == 'jar' and (dep.scope or 'compile') in scopes
+        ]
+
+
+def _conflict_key(dep: Dependency) -> Tuple[str, str, str, Optional[str]]:
+    return dep.group_id, dep.artifact_id, dep.type, dep.classifier
+
+
+def _is_excluded(dep: Dependency, exclusions: Iterable[Tuple[str, str]]) -> bool:
+    return any(group in ('*', dep.group_id) and artifact in ('*', dep.artifact_id)
+               for group, artifact in exclusions)
+
+
+class Resolver:
+    """
+    The resolver of transitive dependencies, memoizing the loaded POMs.
+
+    Parameters
+    ----------
+    repository : LocalRepository, optional
+        The local repository to load the POM files from.
+        Defaults to a new `LocalRepository` of the default path.
+
+    workers : int, optional
+        The number of threads loading the POM files. Defaults to the
+        default of `concurrent.futures.ThreadPoolExecutor`.
+
+    """
+
+    def __init__(self, repository: Optional[LocalRepository] = None, *,
+                 workers: Optional[int] = None) -> None:
+        """Create a new resolver."""
+        self.repository: LocalRepository = \
+            repository if repository is not None else LocalRepository()
+        self.workers: Optional[int] = workers
+        self.__lock: _threading.Lock = _threading.Lock()
+        self.__loads: Dict[_Coords, '_Future[Tuple[Optional[str], Optional[PomModel]]]'] = {}
+
+    def load(self, group_id: str, artifact_id: str,
+             version: str) -> Tuple[Optional[str], Optional[PomModel]]:
+        """
+        Return the path and model of the POM of the given artifact version.
+
+        Each POM is loaded only once, the concurrent calls for the same
+        artifact wait for the first one.
+
+        Returns
+        -------
+        tuple :
+            The path and model of the POM, both None if not installed.
+
+        """
+        coords: _Coords = (group_id, artifact_id, version)
+        with self.__lock:
+            future: Optional[_Future] = self.__loads.get(coords)
+            owner: bool = future is None
+            if owner:
+                future = self.__loads[coords] = _Future()
+
+        if owner:
+            try:
+                path: Optional[str] = self.repository.find(*coords)
+                future.set_result((path, PomParser.parse(
+                    path, repository=self.repository).to_model() if path else None))
+            except BaseException as exc:  # Let the waiting calls raise it as well
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+    def __managed(self, model: PomModel) -> Dict[Tuple[str, str, str, Optional[str]], Dependency]:
+        """Return the dependencies managed by the project, expanding the imported BOMs."""
+        managed: Dict[Tuple[str, str, str, Optional[str]], Dependency] = {}
+        pending: List[Dependency] = list(reversed(model.managed_dependencies))
+        imported: Set[Tuple[str, str]] = set()
+        while pending:
+            dep: Dependency = pending.pop()
+            if dep.scope == 'import' and dep.type == 'pom':
+                if dep.version and (dep.group_id, dep.artifact_id) not in imported:
+                    imported.add((dep.group_id, dep.artifact_id))
+                    bom: Optional[PomModel] = self.load(dep.group_id, dep.artifact_id,
+                                                        dep.version)[1]
+                    pending.extend(reversed(bom.managed_dependencies if bom else ()))
+            else:
+                managed.setdefault(_conflict_key(dep), dep)  # The first declaration wins
+        return managed
+
+    def __select(self, dep: Dependency) -> Optional[str]:
+        """Return the highest installed version within the version range of the dependency."""
+        try:
+            version_range: VersionRange = VersionRange.parse(dep.version)
+        except ValueError:
+            return None
+        return version_range.select(self.repository.versions(dep.group_id, dep.artifact_id))
+
+    def resolve(self, project: Union[str, PomParser, PomModel], *,
+                scopes: Sequence[str] = DEFAULT_SCOPES) -> Resolution:
+        """
+        Resolve the transitive dependencies of the project.
+
+        Parameters
+        ----------
+        project : str, PomParser or PomModel
+            The path to the POM file of the project, or its parser or model.
+            A POM file is parsed with the local repository, so that its
+            parents and imported BOMs are resolved as well.
+
+        scopes : sequence of str, optional
+            The scopes of the direct dependencies to be resolved, the others
+            are omitted. Defaults to ``compile`` and ``runtime``.
+
+        Returns
+        -------
+        Resolution :
+            The resolved graph.
+
+        """
+        if isinstance(project, str):
+            project = PomParser.parse(project, repository=self.repository)
+        model: PomModel = project.to_model() if isinstance(project, PomParser) else project
+        managed: Dict[Tuple[str, str, str, Optional[str]], Dependency] = self.__managed(model)
+
+        nodes: Dict[Tuple[str, str, str, Optional[str]], Node] = {}
+        omitted: List[Omitted] = []
+        missing: List[Dependency] = []
+        unresolved: Set[Tuple[str, str, str, Optional[str]]] = set()
+
+        # The dependencies of the current level, along with their parents
+        # and the exclusions inherited from their ancestors
+        level: List[Tuple[Dependency, Optional[tuple], Tuple[Tuple[str, str], ...]]] = [
+            (dep, None, ()) for dep in model.dependencies
+        ]
+        depth: int = 1
+        with _ThreadPoolExecutor(self.workers) as pool:
+            while level:
+                expand: List[Tuple[Node, Tuple[Tuple[str, str], ...]]] = []
+                for dep, parent, exclusions in level:
+                    dep = dep._replace(scope=dep.scope or 'compile')
+                    key: Tuple[str, str, str, Optional[str]] = _conflict_key(dep)
+                    if depth > 1 and key in managed:
+                        base: Dependency = managed[key]
+                        dep = dep._replace(version=base.version or dep.version,
+                                           scope=base.scope or dep.scope)
+                    if dep.version and dep.version.startswith(('[', '(')):
+                        dep = dep._replace(version=self.__select(dep) or dep.version)
+
+                    reason: Optional[str] = None
+                    if depth == 1 and dep.scope not in scopes:
+                        reason = 'scope'
+                    elif _is_excluded(dep, exclusions):
+                        reason = 'excluded'
+                    elif key in unresolved:
+                        reason = 'conflict'  # The nearest declaration is unresolved
+                    elif key in nodes:
+                        winner: Node = nodes[key]
+                        reason = 'duplicate' if winner.dependency.version == dep.version \
+                            else 'conflict'
+                        # Widen the scope of the nearest declaration, as in Maven
+                        if _SCOPE_RANKS.get(dep.scope, 0) < \
+                                _SCOPE_RANKS.get(winner.dependency.scope, 0):
+                            nodes[key] = winner._replace(
+                                dependency=winner.dependency._replace(scope=dep.scope))
+                    if reason is not None:
+                        omitted.append(Omitted(dep, parent, reason))
+                        continue
+
+                    if not dep.version or dep.version.startswith(('[', '(')):
+                        # No version, or an unsatisfied version range, kept out of the graph
+                        unresolved.add(key)
+                        missing.append(dep)
+                        continue
+
+                    node: Node = Node(dep, depth, parent, None, None)
+                    nodes[key] = node
+                    expand.append((node, exclusions + dep.exclusions))
+
+                # Load the POM files of the whole level at once, then get them all
+                # from the memoized loads
+                with self.__lock:
+                    pending: Set[_Coords] = {tuple(node.dependency[:3]) for node, _ in expand
+                                             if tuple(node.dependency[:3]) not in self.__loads}
+                list(pool.map(lambda coords: self.load(*coords), pending))
+                loaded: List[Tuple[Optional[str], Optional[PomModel]]] = [
+                    self.load(*node.dependency[:3]) for node, _ in expand]
+
+                level = []
+                for (node, inherited), (path, pom) in zip(expand, loaded):
+                    key = _conflict_key(node.dependency)
+                    nodes[key] = nodes[key]._replace(model=pom, path=path)
+                    if pom is None:
+                        missing.append(node.dependency)
+                        continue
+                    for dep in pom.dependencies:
+                        scope: Optional[str] = _TRANSITIVE_SCOPES.get(
+                            (node.dependency.scope, dep.scope or 'compile'))
+                        if scope is None or dep.optional:
+                            omitted.append(Omitted(dep, key, 'optional' if scope else 'scope'))
+                            continue
+                        level.append((dep._replace(scope=scope), key, inherited))
+                depth += 1
+
+        return Resolution(model, nodes, tuple(omitted), tuple(missing))
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
@@ -3,10 +3,19 @@
 Copyright (c) 2023-2024 Ryuu Mitsuki.
 """
 
-from . import test_utils
+from . import (
+    test_cli, test_core, test_daemon, test_exception, test_globals,
+    test_imports, test_logger, test_placeholders, test_profiler, test_profiles, test_reactor,
+    test_repository, test_resolver, test_utils, test_versions, test_watch
+)
 from .._globals import AUTHOR, VERSION, VERSION_INFO
 
-__all__ = ['test_utils']
+__all__ = [
+    'test_cli', 'test_core', 'test_daemon', 'test_exception', 'test_globals',
+    'test_imports', 'test_logger', 'test_placeholders', 'test_profiler', 'test_profiles',
+    'test_reactor', 'test_repository', 'test_resolver', 'test_utils', 'test_versions',
+    'test_watch'
+]
 
 __author__       = AUTHOR
 __version__      = VERSION
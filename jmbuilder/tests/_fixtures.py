@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the test suites, so they do not depend on each other.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+
+
+# A minimal POM, with the values rendered by most of the tests
+POM: str = '''\
+<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>example</artifactId>
+  <version>1.2.3</version>
+  <name>Example</name>
+</project>
+'''
+
+
+def artifact_pom(group_id: str, artifact_id: str, version: str, body: str = '') -> str:
+    """Return the content of a POM file of the given artifact."""
+    return (f'<?xml version="1.0" encoding="UTF-8"?><project><groupId>{group_id}</groupId>'
+            f'<artifactId>{artifact_id}</artifactId><version>{version}</version>'
+            f'{body}</project>')
+
+
+__author__       = AUTHOR
+__version__      = VERSION
+__version_info__ = VERSION_INFO
+
+
+# Delete unused imported objects
+del AUTHOR, VERSION, VERSION_INFO
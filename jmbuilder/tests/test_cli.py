@@ -0,0 +1,202 @@
+"""
+Test suite for the command-line argument grammar and job runner,
+exclusively for `jmbuilder._cli` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import io
+import os
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from .. import _cli as jmcli
+from .. import core as jmcore
+from ..exception import JMException
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import POM
+
+
+class TestArgumentParser(unittest.TestCase):
+    """Test class for the `jmbuilder._cli.parse_args` function."""
+
+    def test_flags(self) -> None:
+        """Test parsing the flag options."""
+        args = jmcli.parse_args(['-V', '--help', '-VV', '-V'])
+        self.assertSetEqual(args.flags, {'version', 'help', 'only_version'})
+        self.assertListEqual(args.jobs, [])
+
+    def test_multiple_jobs(self) -> None:
+        """Test parsing several jobs, including jobs sharing the same POM."""
+        args = jmcli.parse_args([
+            '--fix-mf', 'pom.xml', 'MANIFEST.MF', 'out/MANIFEST.MF',
+            '--fix-prop', 'pom.xml', 'a.properties',
+            '--fix-properties', 'pom.xml', 'b.properties', 'b.properties',
+            '--render', 'pom.xml', 'README.md.in', 'README.md',
+            '-V'
+        ])
+
+        self.assertSetEqual(args.flags, {'version'})
+        self.assertListEqual(args.jobs, [
+            jmcli.Job('manifest', 'pom.xml', 'MANIFEST.MF', 'out/MANIFEST.MF'),
+            jmcli.Job('properties', 'pom.xml', 'a.properties', 'a.properties'),
+            jmcli.Job('properties', 'pom.xml', 'b.properties', 'b.properties'),
+            jmcli.Job('text', 'pom.xml', 'README.md.in', 'README.md')
+        ])
+
+    def test_profiles_and_properties(self) -> None:
+        """Test parsing the repeated ``-P`` and ``-D`` options, with attached values."""
+        args = jmcli.parse_args([
+            '-P', 'release', '-Pci,!local', '--activate-profiles=extra',
+            '-Dskip', '-D', 'a=1', '--define', 'b=x=y', '-Da=2'
+        ])
+        self.assertListEqual(args.profiles, ['release', 'ci,!local', 'extra'])
+        self.assertDictEqual(args.properties, {'skip': 'true', 'a': '2', 'b': 'x=y'})
+
+    def test_errors(self) -> None:
+        """Test parsing the invalid arguments."""
+        for argv in (['--unknown'], ['--fix-mf'], ['--fix-mf', 'pom.xml', '-V'],
+                     ['--fix-prop', 'pom.xml', 'in', 'out', 'extra'], ['-P'], ['-D=1'],
+                     ['--diff=unified']):
+            with self.assertRaises(JMException, msg=argv):
+                jmcli.parse_args(argv)
+
+
+class TestJobRunner(unittest.TestCase):
+    """Test class for the `jmbuilder._cli.run_jobs` function."""
+
+    def test_parse_pom_once(self) -> None:
+        """Test that each distinct POM file is parsed only once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pom: str = os.path.join(tmpdir, 'pom.xml')
+            props: str = os.path.join(tmpdir, 'a.properties')
+            with open(pom, 'w', encoding='utf-8') as file:
+                file.write(POM)
+            with open(props, 'w', encoding='utf-8') as file:
+                file.write('version = ${project.version}\nname = ${project.name}\n')
+
+            args = jmcli.parse_args([
+                '--fix-prop', pom, props, os.path.join(tmpdir, 'out', 'a.properties'),
+                '--fix-prop', os.path.join(tmpdir, '.', 'pom.xml'), props, props
+            ])
+
+            with mock.patch.object(jmcore.PomParser, 'parse',
+                                   wraps=jmcore.PomParser.parse) as parse:
+                jmcli.run_jobs(args.jobs)
+                self.assertEqual(parse.call_count, 1)
+
+            for outfile in (props, os.path.join(tmpdir, 'out', 'a.properties')):
+                with open(outfile, 'r', encoding='utf-8') as file:
+                    self.assertListEqual(file.read().splitlines(),
+                                         ['version = 1.2.3', 'name = Example'])
+
+    def test_metrics_json(self) -> None:
+        """Test writing the metrics of each POM file with ``--metrics-json``."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, 'pom.xml'), 'w', encoding='utf-8') as file:
+                file.write(POM)
+            with open(os.path.join(tmpdir, 'a.properties'), 'w', encoding='utf-8') as file:
+                file.write('version = ${project.version}\n')
+
+            self.assertEqual(jmcli.main([
+                '--fix-prop', 'pom.xml', 'a.properties', 'out.properties',
+                '--metrics-json=metrics/run.json'
+            ], cwd=tmpdir), 0)
+
+            with open(os.path.join(tmpdir, 'metrics', 'run.json'), 'r', encoding='utf-8') as file:
+                metrics: dict = json.load(file)['modules'][os.path.join(tmpdir, 'pom.xml')]
+            self.assertEqual(metrics['placeholders_resolved'], 1)
+            self.assertEqual(metrics['files_written'], 1)
+            self.assertIn('parse', metrics['phases'])
+
+
+class TestDryRun(unittest.TestCase):
+    """Test class for the dry runs, i.e. ``--dry-run`` and ``--diff``."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        for name, contents in (('pom.xml', POM), ('a.properties', 'version = ${project.version}\n'),
+                               ('b.properties', 'name = ${project.name}\n')):
+            with open(os.path.join(self.tmpdir.name, name), 'w', encoding='utf-8') as file:
+                file.write(contents)
+        self.argv: list = ['--fix-prop', 'pom.xml', 'a.properties', 'out/a.properties',
+                           '--fix-prop', 'pom.xml', 'b.properties', 'out/b.properties']
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _main(self, *argv: str) -> tuple:
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            code: int = jmcli.main([*self.argv, *argv], cwd=self.tmpdir.name)
+        return code, stdout.getvalue()
+
+    def test_change_list(self) -> None:
+        """Test the change list and the exit codes, without writing the outputs."""
+        self.assertTupleEqual(self._main('--dry-run'), (
+            jmcli.EXIT_CHANGED, 'A\tout/a.properties\nA\tout/b.properties\n'))
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, 'out')))
+
+        self.assertTupleEqual(self._main(), (0, ''))
+        outfile: str = os.path.join(self.tmpdir.name, 'out', 'b.properties')
+        with open(outfile, 'w', encoding='utf-8') as file:
+            file.write('name = Old' + os.linesep)
+        mtime: int = os.stat(outfile).st_mtime_ns
+
+        code, output = self._main('--dry-run=json')
+        self.assertEqual(code, jmcli.EXIT_CHANGED)
+        self.assertDictEqual(json.loads(output), {
+            'changed': [{'path': 'out/b.properties', 'status': 'modified', 'kind': 'properties',
+                         'pom': os.path.join(self.tmpdir.name, 'pom.xml'),
+                         'infile': os.path.join(self.tmpdir.name, 'b.properties')}],
+            'unchanged': 1
+        })
+        self.assertEqual(os.stat(outfile).st_mtime_ns, mtime)
+
+        self.assertEqual(self._main()[0], 0)
+        self.assertTupleEqual(self._main('--dry-run'), (0, ''))
+
+    def test_diff(self) -> None:
+        """Test printing the unified diff of the outputs that would change."""
+        self.assertEqual(self._main()[0], 0)
+        with open(os.path.join(self.tmpdir.name, 'out', 'b.properties'), 'w',
+                  encoding='utf-8') as file:
+            file.write('name = Old' + os.linesep)
+
+        code, output = self._main('--diff')
+        self.assertEqual(code, jmcli.EXIT_CHANGED)
+        self.assertListEqual(output.splitlines(), [
+            '--- a/out/b.properties', '+++ b/out/b.properties', '@@ -1 +1 @@',
+            '-name = Old', '+name = Example'
+        ])
+
+    def test_errors(self) -> None:
+        """Test the invalid combinations of the dry run options."""
+        for argv in (['--dry-run=xml'], ['--diff', '--watch'],
+                     ['--dry-run=json', '--metrics-json'], ['--diff', '--metrics-json']):
+            with self.assertRaises(JMException, msg=argv):
+                self._main(*argv)
+
+        # The standard output only holds the changes, the metrics are written to the file
+        code, output = self._main('--dry-run=json', '--metrics-json=metrics.json')
+        self.assertEqual(code, jmcli.EXIT_CHANGED)
+        self.assertEqual(len(json.loads(output)['changed']), 2)
+        with open(os.path.join(self.tmpdir.name, 'metrics.json'), 'r', encoding='utf-8') as file:
+            self.assertIn('modules', json.load(file))
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
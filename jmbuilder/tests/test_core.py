@@ -0,0 +1,347 @@
+"""
+Test suite for the POM parser and the repairer, exclusively for
+`jmbuilder.core` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import gc
+import io
+import os
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+
+from .. import core as jmcore
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import POM
+
+
+DEPS_POM: str = '''<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <parent><groupId>com.example</groupId><artifactId>parent</artifactId>
+    <version>2.0</version></parent>
+  <artifactId>example</artifactId>
+  <developers>
+    <developer><id>dev1</id><email>dev1@example.com</email></developer>
+    <developer><id>dev2</id><email>dev2@example.com</email></developer>
+  </developers>
+  <licenses>
+    <license><name>MIT License</name></license>
+    <license><name>Apache License 2.0</name></license>
+  </licenses>
+  <properties>
+    <package.mainClass>com.example.Main</package.mainClass>
+    <junit.version>4.${junit.minor}</junit.version>
+    <junit.minor>13</junit.minor>
+  </properties>
+  <dependencyManagement><dependencies>
+    <dependency><groupId>junit</groupId><artifactId>junit</artifactId>
+      <version>${junit.version}</version><scope>test</scope></dependency>
+    <dependency><groupId>junit</groupId><artifactId>junit</artifactId>
+      <classifier>sources</classifier><version>1.0</version></dependency>
+  </dependencies></dependencyManagement>
+  <dependencies>
+    <dependency><groupId>junit</groupId><artifactId>junit</artifactId></dependency>
+    <dependency><groupId>${project.groupId}</groupId><artifactId>core</artifactId>
+      <version>${project.version}</version><optional>true</optional></dependency>
+  </dependencies>
+  <build>
+    <pluginManagement><plugins>
+      <plugin><artifactId>maven-jar-plugin</artifactId><version>3.3.0</version></plugin>
+    </plugins></pluginManagement>
+    <plugins>
+      <plugin><artifactId>maven-jar-plugin</artifactId></plugin>
+      <plugin><groupId>org.example</groupId><artifactId>custom-plugin</artifactId>
+        <configuration combine.self="override"><skip>true</skip></configuration></plugin>
+    </plugins>
+  </build>
+</project>
+'''
+
+NESTED_POM: str = '''<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <developers>
+    <developer><name>Alice</name><organization><name>Org</name></organization></developer>
+    <developer><organization><name>Other</name></organization><name>Bob</name></developer>
+  </developers>
+  <name>app</name>
+  <build><plugins><plugin><artifactId>x</artifactId></plugin></plugins></build>
+</project>
+'''
+
+
+class TestPomParser(unittest.TestCase):
+    """Test class for the `jmbuilder.core.PomParser` class."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        pom: str = os.path.join(self.tmpdir.name, 'pom.xml')
+        with open(pom, 'w', encoding='utf-8') as file:
+            file.write(DEPS_POM)
+        self.pom = jmcore.PomParser.parse(pom)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_dependencies(self) -> None:
+        """Test that the dependencies are filled in from the managed ones and properties."""
+        self.assertTupleEqual(self.pom.get_dependencies(), (
+            jmcore.Dependency('junit', 'junit', '4.13', 'test'),
+            jmcore.Dependency('com.example', 'core', '2.0', None, optional=True)
+        ))
+        self.assertIs(self.pom.get_dependencies(), self.pom.get_dependencies())
+        self.assertListEqual([dep.classifier for dep in self.pom.get_managed_dependencies()],
+                             [None, 'sources'])
+
+    def test_model(self) -> None:
+        """Test the immutable model, which does not keep the parsed document alive."""
+        model = self.pom.to_model()
+        self.assertEqual((model.group_id, model.artifact_id, model.version),
+                         ('com.example', 'example', '2.0'))
+        self.assertEqual(model.parent, jmcore.Parent('com.example', 'parent', '2.0'))
+        self.assertListEqual([dev.email for dev in model.developers],
+                             ['dev1@example.com', 'dev2@example.com'])
+        self.assertEqual(model.licenses[1], jmcore.License('Apache License 2.0'))
+        self.assertEqual(model.get_property('properties.package.mainClass'), 'com.example.Main')
+        self.assertTupleEqual(model.dependencies, self.pom.get_dependencies())
+
+        with self.assertRaises(AttributeError):
+            model.version = '3.0'
+        with self.assertRaises(TypeError):
+            model.properties['junit.minor'] = '12'
+
+        soup = weakref.ref(self.pom.soup)
+        del self.pom
+        gc.collect()
+        self.assertIsNone(soup())
+        self.assertEqual(model.name, None)
+
+    def test_query(self) -> None:
+        """Test the query language of `PomParser.get` and `PomParser.get_all`."""
+        def texts(query) -> list:
+            return [tag.text.strip() for tag in self.pom.get_all(query)]
+
+        self.assertListEqual(texts('project.developers.developer[*].email'),
+                             ['dev1@example.com', 'dev2@example.com'])
+        self.assertListEqual(texts('licenses.license[1].name'), ['Apache License 2.0'])
+        self.assertListEqual(texts('licenses.license[-1].name'), ['Apache License 2.0'])
+        self.assertListEqual(texts('developer[0].*'), ['dev1', 'dev1@example.com'])
+        self.assertListEqual(texts("plugin.configuration[@combine.self='override'].skip"),
+                             ['true'])
+        self.assertListEqual(texts('plugin.configuration[@combine.self=append]'), [])
+        self.assertListEqual(texts('properties."package.mainClass"'), ['com.example.Main'])
+        self.assertListEqual(texts(['properties', 'package.mainClass']), ['com.example.Main'])
+        self.assertEqual(self.pom.get('project.developers.developer.id').text, 'dev1')
+        self.assertIsNone(self.pom.get('project.developers.developer[2]'))
+        self.assertEqual(self.pom.get_property('package.mainClass', dot=False),
+                         'com.example.Main')
+
+        self.assertIs(jmcore.compile_query('licenses.license[1].name'),
+                      jmcore.compile_query('licenses.license[1].name'))
+        for query in ('', 'project..name', 'project.', 'license[x]'):
+            with self.assertRaises(ValueError):
+                self.pom.get(query)
+
+    def test_query_nested(self) -> None:
+        """Test that the names after the first one only match the direct children."""
+        pom: str = os.path.join(self.tmpdir.name, 'nested.xml')
+        with open(pom, 'w', encoding='utf-8') as file:
+            file.write(NESTED_POM)
+        parser = jmcore.PomParser.parse(pom)
+        self.assertEqual(parser.get('developers.developer.name').text, 'Alice')
+        self.assertListEqual([tag.text for tag in parser.get_all('developers.developer.name')],
+                             ['Alice', 'Bob'])
+        self.assertListEqual([tag.text for tag in parser.get_all('organization.name')],
+                             ['Org', 'Other'])
+        self.assertEqual(parser.get('project.name').text, 'app')
+        self.assertEqual(parser.get(['project', 'name']).text, 'app')
+        self.assertEqual(parser.get('build.plugins.plugin.artifactId').text, 'x')
+        self.assertIsNone(parser.get('build.plugin'))
+        self.assertIsNone(parser.get('project.developer'))
+
+    def test_plugins(self) -> None:
+        """Test the plugins, with the default group ID and the managed versions."""
+        self.assertTupleEqual(self.pom.get_plugins(), (
+            jmcore.Plugin(jmcore.DEFAULT_PLUGIN_GROUP, 'maven-jar-plugin', '3.3.0'),
+            jmcore.Plugin('org.example', 'custom-plugin', None)
+        ))
+        self.assertListEqual([plugin.key for plugin in self.pom.get_plugins(managed=True)],
+                             ['org.apache.maven.plugins:maven-jar-plugin'])
+
+
+class TestRepairer(unittest.TestCase):
+    """Test class for the `jmbuilder.core.JMRepairer` class."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        pom: str = os.path.join(self.tmpdir.name, 'pom.xml')
+        with open(pom, 'w', encoding='utf-8') as file:
+            file.write(POM)
+        self.pom_file: str = pom
+        self.repairer = jmcore.JMRepairer(pom)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_render_manifest(self) -> None:
+        """Test rendering the in-memory manifest contents."""
+        text: str = 'Manifest-Version: 1.0\nID: ${project.id}\nName: ${project.name}\n'
+        expected: bytes = os.linesep.join([
+            'Manifest-Version: 1.0', 'ID: com.example:example', 'Name: Example', '', ''
+        ]).encode('UTF-8')
+
+        for source in (text, text.encode('UTF-8'), io.StringIO(text),
+                       io.BytesIO(text.encode('UTF-8'))):
+            self.assertEqual(self.repairer.render_manifest(source), expected)
+
+    def test_render_properties(self) -> None:
+        """Test rendering the in-memory properties contents."""
+        text: str = '# Comment\nversion = ${project.version}\nunknown = ${foo.bar}\n'
+        expected: bytes = os.linesep.join([
+            'version = 1.2.3', 'unknown = ${foo.bar}', ''
+        ]).encode('UTF-8')
+
+        self.assertEqual(self.repairer.render_properties(text), expected)
+        self.assertEqual(self.repairer.render_properties(io.StringIO(text)), expected)
+
+        with self.assertRaises(TypeError):
+            self.repairer.render_properties(12345)
+
+    def test_fix_files(self) -> None:
+        """Test that the file-based methods write the rendered contents."""
+        infile: str = os.path.join(self.tmpdir.name, 'app.properties')
+        outfile: str = os.path.join(self.tmpdir.name, 'out', 'app.properties')
+        with open(infile, 'w', encoding='utf-8') as file:
+            file.write('version = ${project.version}\n')
+
+        self.repairer.fix_properties(infile, outfile)
+        with open(outfile, 'rb') as file:
+            self.assertEqual(file.read(),
+                             self.repairer.render_properties('version = ${project.version}'))
+
+        with self.assertRaises(FileNotFoundError):
+            self.repairer.fix_manifest(os.path.join(self.tmpdir.name, 'nonexistent'))
+
+    def test_dry_run(self) -> None:
+        """Test comparing the rendered contents against the output, without writing."""
+        infile: str = os.path.join(self.tmpdir.name, 'app.properties')
+        outfile: str = os.path.join(self.tmpdir.name, 'out', 'app.properties')
+        with open(infile, 'w', encoding='utf-8') as file:
+            file.write('version = ${project.version}\n' + 'x' * 100 + ' = ${project.name}\n')
+
+        change = self.repairer.fix_properties(infile, outfile, dry_run=True)
+        self.assertEqual(change.status, 'added')
+        self.assertFalse(os.path.exists(outfile))
+        self.assertEqual(self.repairer.fix_properties(infile, outfile).status, 'added')
+        self.assertEqual(self.repairer.fix_properties(infile, outfile, dry_run=True),
+                         jmcore.OutputChange(outfile, 'unchanged', change.data))
+
+        # The same size, differing only within the last chunk
+        with open(outfile, 'r+b') as file:
+            file.seek(-2, os.SEEK_END)
+            file.write(b'X')
+        mtime: int = os.stat(outfile).st_mtime_ns
+        with mock.patch.object(jmcore, 'COMPARE_CHUNK_SIZE', 16):
+            change = self.repairer.fix_properties(infile, outfile, dry_run=True)
+        self.assertEqual(change.status, 'modified')
+        self.assertTrue(change.changed)
+        self.assertEqual(os.stat(outfile).st_mtime_ns, mtime)
+        self.assertEqual(self.repairer.stats()['files_written'], 1)
+
+    def test_render_text(self) -> None:
+        """Test rendering any text, including the placeholders split across chunks."""
+        text: str = ('class BuildInfo {\r\n  String VERSION = "${project.version}";\r\n'
+                     '  String RAW = "\\${project.version}", UNKNOWN = "${foo.bar}";\r\n'
+                     '  int PRICE = $5; String NAME = "${project.name}"; } \\')
+        expected: bytes = ('class BuildInfo {\r\n  String VERSION = "1.2.3";\r\n'
+                           '  String RAW = "${project.version}", UNKNOWN = "${foo.bar}";\r\n'
+                           '  int PRICE = $5; String NAME = "Example"; } \\').encode('UTF-8')
+
+        self.assertEqual(self.repairer.render_text(text), expected)
+        for size in range(1, 24):
+            with mock.patch.object(jmcore, 'RENDER_CHUNK_SIZE', size):
+                self.assertEqual(self.repairer.render_text(io.StringIO(text)), expected, size)
+        self.assertEqual(self.repairer.stats()['placeholders_unresolved'], 24)
+
+        with self.assertRaises(TypeError):
+            self.repairer.render_text(12345)
+
+    def test_render_file(self) -> None:
+        """Test streaming the text files, keeping the permissions and the unchanged outputs."""
+        infile: str = os.path.join(self.tmpdir.name, 'run.sh')
+        outfile: str = os.path.join(self.tmpdir.name, 'out', 'run.sh')
+        with open(infile, 'w', encoding='utf-8') as file:
+            file.write('#!/bin/sh\necho ${project.version} \\${HOME}\n')
+        os.chmod(infile, 0o755)
+
+        change = self.repairer.render_file(infile, outfile, dry_run=True)
+        self.assertTupleEqual(change, (outfile, 'added', b'#!/bin/sh\necho 1.2.3 ${HOME}\n'))
+        self.assertFalse(os.path.exists(os.path.dirname(outfile)))
+
+        with mock.patch.object(jmcore, 'RENDER_CHUNK_SIZE', 4):
+            self.assertEqual(self.repairer.render_file(infile, outfile).status, 'added')
+        with open(outfile, 'rb') as file:
+            self.assertEqual(file.read(), change.data)
+        self.assertEqual(os.stat(outfile).st_mode & 0o777, 0o755)
+
+        mtime: int = os.stat(outfile).st_mtime_ns
+        self.assertEqual(self.repairer.render_file(infile, outfile).status, 'unchanged')
+        self.assertEqual(os.stat(outfile).st_mtime_ns, mtime)
+        self.assertListEqual(os.listdir(os.path.dirname(outfile)), ['run.sh'])
+
+        # Rendered in place
+        self.assertEqual(self.repairer.render_file(infile).status, 'modified')
+        with open(infile, 'rb') as file:
+            self.assertEqual(file.read(), change.data)
+
+        with self.assertRaises(FileNotFoundError):
+            self.repairer.render_file(os.path.join(self.tmpdir.name, 'nonexistent'))
+
+    def test_model(self) -> None:
+        """Test that the repairer accepts the model of a POM."""
+        text: str = 'version = ${project.version}\nmain = ${package.mainClass}\n'
+        repairer = jmcore.JMRepairer(jmcore.PomParser.parse(self.pom_file).to_model())
+        self.assertEqual(repairer.render_properties(text), self.repairer.render_properties(text))
+
+    def test_stats(self) -> None:
+        """Test the metrics collected while rendering, including the unchanged outputs."""
+        infile: str = os.path.join(self.tmpdir.name, 'app.properties')
+        outfile: str = os.path.join(self.tmpdir.name, 'out', 'app.properties')
+        text: str = 'version = ${project.version}\nname = ${project.version}\nx = ${foo}\n'
+        with open(infile, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+        self.repairer.fix_properties(infile, outfile)
+        mtime: int = os.stat(outfile).st_mtime_ns
+        self.repairer.fix_properties(infile, outfile)
+        self.assertEqual(os.stat(outfile).st_mtime_ns, mtime)
+
+        stats: dict = self.repairer.stats()
+        self.assertEqual(stats['placeholders_seen'], 6)
+        self.assertEqual(stats['placeholders_resolved'], 4)
+        self.assertEqual(stats['placeholders_unresolved'], 2)
+        self.assertEqual(stats['distinct_keys'], 2)
+        self.assertEqual(stats['bytes_read'], 2 * len(text))
+        self.assertEqual(stats['bytes_written'], os.stat(outfile).st_size)
+        self.assertEqual(stats['files_written'], 1)
+        self.assertEqual(stats['files_skipped'], 1)
+        self.assertListEqual(list(stats['phases']), [
+            'parse', 'index', 'read template', 'resolve', 'render', 'write'
+        ])
+        self.assertEqual(stats['phases']['write']['calls'], 2)
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Test suite for the warm daemon and its client, exclusively for
+`jmbuilder._daemon` and `jmbuilder.client` modules.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import io
+import os
+import json
+import time
+import socket
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+
+from .. import _cli, _daemon, client
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import POM
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported')
+class TestDaemon(unittest.TestCase):
+    """Test class for the warm daemon."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.pom: str = os.path.join(self.tmpdir.name, 'pom.xml')
+        with open(self.pom, 'w', encoding='utf-8') as file:
+            file.write(POM)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_pom_cache(self) -> None:
+        """Test that the cached POM files are invalidated by modification time."""
+        cache = _daemon.PomCache()
+        first = cache(self.pom)
+        self.assertIs(cache(self.pom), first)
+
+        with open(self.pom, 'w', encoding='utf-8') as file:
+            file.write(POM.replace('1.2.3', '1.2.4'))
+        stat = os.stat(self.pom)
+        os.utime(self.pom, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = cache(self.pom)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.version, '1.2.4')
+        self.assertEqual(len(cache), 1)
+
+    def test_serve(self) -> None:
+        """Test serving the requests until idle."""
+        path: str = os.path.join(self.tmpdir.name, 'daemon.sock')
+        props: str = os.path.join(self.tmpdir.name, 'app.properties')
+        with open(props, 'w', encoding='utf-8') as file:
+            file.write('version = ${project.version}\n')
+
+        server = threading.Thread(target=_daemon.serve, args=(path,),
+                                  kwargs={'idle_timeout': 1})
+        server.start()
+        while not os.path.exists(path):
+            time.sleep(0.01)
+        self.assertEqual(os.stat(path).st_mode & 0o077, 0)
+
+        # Relative paths are resolved against the forwarded working directory
+        code, _, stderr = client.request(
+            ['--fix-prop', 'pom.xml', 'app.properties', 'out.properties'],
+            cwd=self.tmpdir.name, socket_path=path)
+        self.assertEqual(code, 0, msg=stderr)
+        with open(os.path.join(self.tmpdir.name, 'out.properties'),
+                  'r', encoding='utf-8') as file:
+            self.assertEqual(file.read().strip(), 'version = 1.2.3')
+
+        code, stdout, _ = client.request(['-VV'], socket_path=path)
+        self.assertEqual((code, stdout.strip()), (0, f'v{VERSION}'))
+
+        code, _, stderr = client.request(['--unknown'], socket_path=path)
+        self.assertEqual(code, 1)
+        self.assertIn('Unknown argument', stderr)
+
+        server.join(timeout=5)
+        self.assertFalse(server.is_alive())
+        self.assertFalse(os.path.exists(path))
+
+    def test_environ(self) -> None:
+        """Test running each request with the environment variables of its client."""
+        infile: str = os.path.join(self.tmpdir.name, 'build.txt')
+        with open(infile, 'w', encoding='utf-8') as file:
+            file.write('${build.number}\n')
+
+        env: dict = dict(os.environ, BUILD_NUMBER='42', JM_DAEMON_TEST='client')
+        with mock.patch.dict(os.environ, {'JM_DAEMON_TEST': 'daemon'}):
+            with _daemon._environ(env):
+                self.assertEqual(os.environ['JM_DAEMON_TEST'], 'client')
+            self.assertEqual(os.environ['JM_DAEMON_TEST'], 'daemon')
+
+            conn, peer = socket.socketpair()
+            with conn, peer:
+                peer.sendall(json.dumps({
+                    'argv': ['--render', 'pom.xml', 'build.txt', 'out.txt'],
+                    'cwd': self.tmpdir.name, 'env': env
+                }).encode('utf-8'))
+                peer.shutdown(socket.SHUT_WR)
+                _daemon._handle(conn, _daemon.PomCache())
+                conn.close()
+                response: dict = json.loads(peer.makefile('rb').read())
+            self.assertEqual(os.environ['JM_DAEMON_TEST'], 'daemon')
+        self.assertEqual(response['code'], 0, msg=response['stderr'])
+        with open(os.path.join(self.tmpdir.name, 'out.txt'), 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read().strip(), '42')
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'requires the file owners')
+    def test_private_socket(self) -> None:
+        """Test refusing the sockets and directories not private to the current user."""
+        path: str = os.path.join(self.tmpdir.name, 'other.sock')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(path)
+            listener.listen(1)
+            with mock.patch.object(os, 'getuid', return_value=os.getuid() + 1):
+                with self.assertRaises(PermissionError):
+                    client.request(['-VV'], socket_path=path)
+
+        shared: str = os.path.join(self.tmpdir.name, 'shared')
+        os.mkdir(shared, 0o755)
+        os.chmod(shared, 0o755)
+        with mock.patch.dict(os.environ, {'XDG_RUNTIME_DIR': shared}):
+            os.environ.pop(client.SOCKET_ENV, None)
+            self.assertEqual(client.default_socket_path(),
+                             os.path.join(shared, 'jmbuilder.sock'))
+            with self.assertRaises(PermissionError):
+                _daemon.serve(idle_timeout=1)
+        self.assertListEqual(os.listdir(shared), [])
+
+    def test_client_no_rerun(self) -> None:
+        """Test that a request already sent is never run again in the client."""
+        path: str = os.path.join(self.tmpdir.name, 'broken.sock')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+            listener.bind(path)
+            listener.listen(1)
+
+            def accept() -> None:
+                conn, _ = listener.accept()
+                with conn:
+                    conn.recv(65536)  # Then close without any response
+
+            server = threading.Thread(target=accept)
+            server.start()
+            stderr = io.StringIO()
+            with mock.patch.dict(os.environ, {client.SOCKET_ENV: path}), \
+                    mock.patch.object(_cli, 'main') as cold_main, redirect_stderr(stderr):
+                self.assertEqual(client.main(['-VV']), 1)
+            server.join(timeout=5)
+
+        cold_main.assert_not_called()
+        self.assertIn('The daemon failed to respond', stderr.getvalue())
+
+        # Without a daemon, it is run in this process instead
+        with mock.patch.dict(os.environ, {client.SOCKET_ENV: path}), \
+                mock.patch.object(_cli, 'main', return_value=0) as cold_main:
+            self.assertEqual(client.main(['-VV']), 0)
+        cold_main.assert_called_once_with(['-VV'])
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
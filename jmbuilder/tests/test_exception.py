@@ -0,0 +1,56 @@
+"""
+Test suite for the custom exceptions, exclusively for `jmbuilder.exception` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import linecache
+import traceback
+import unittest
+from unittest import mock
+
+from .. import exception as jmexc
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+
+
+class TestException(unittest.TestCase):
+    """Test class for the `jmbuilder.exception` module."""
+
+    def test_lazy_traces(self) -> None:
+        """Test that the source lines are read only when the traces are accessed."""
+        with mock.patch.object(linecache, 'getline', wraps=linecache.getline) as getline:
+            errors: list = [cls('Invalid index: %d', 5) for cls in (
+                jmexc.JMException, jmexc.JMUnknownTypeError, jmexc.JMParserError
+            )]
+            self.assertEqual(getline.call_count, 0)
+
+            for err in errors:
+                traces: traceback.StackSummary = err.traces
+                self.assertIs(err.traces, traces)
+                self.assertEqual(traces[-1].name, '__init__')
+                caller: traceback.FrameSummary = next(
+                    frame for frame in traces if frame.name == 'test_lazy_traces')
+                self.assertIn('cls(', caller.line)
+            self.assertGreater(getline.call_count, 0)
+
+    def test_custom_traces(self) -> None:
+        """Test that the custom stack traces are kept as is."""
+        stack: traceback.StackSummary = traceback.extract_stack()
+        for key in ('tb', 'trace', 'traces'):
+            err = jmexc.JMException('An error occurred', **{key: stack})
+            self.assertIs(err.traces, stack)
+            self.assertEqual(repr(err), "JMException('An error occurred', custom_traceback=True)")
+
+
+__author__       = AUTHOR
+__version__      = VERSION
+__version_info__ = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Test suite for the setup metadata, exclusively for `jmbuilder._globals`
+and `jmbuilder._setupgen` modules.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import sys
+import subprocess
+import tempfile
+import unittest
+
+from .. import _globals, _setupconf, _setupgen
+from .._globals import AUTHOR, BASEDIR, VERSION, VERSION_INFO
+
+
+class TestSetupMetadata(unittest.TestCase):
+    """Test class for the generated setup metadata."""
+
+    def test_generated_in_sync(self) -> None:
+        """Test that ``_setupconf`` matches the setup configuration file."""
+        self.assertDictEqual(
+            _setupconf.SETUP, _setupgen.load_setupjson(),
+            msg='Outdated `_setupconf`, run `python -m jmbuilder._setupgen`')
+
+    def test_generate(self) -> None:
+        """Test the `jmbuilder._setupgen.generate` function."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target: str = _setupgen.generate(target=os.path.join(tmpdir, 'conf.py'))
+
+            namespace: dict = {}
+            with open(target, 'r', encoding='utf-8') as file:
+                exec(file.read(), namespace)  # pylint: disable=exec-used
+
+        self.assertDictEqual(namespace['SETUP'], _setupconf.SETUP)
+
+    def test_generated_file(self) -> None:
+        """Test that the committed ``_setupconf`` is exactly the generated module."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(_setupgen.generate(target=os.path.join(tmpdir, 'conf.py')), 'r',
+                      encoding='utf-8') as file:
+                generated: str = file.read()
+        with open(_setupgen.SETUPCONF, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), generated,
+                msg='Outdated `_setupconf`, run `python -m jmbuilder._setupgen`')
+
+    def test_retriever(self) -> None:
+        """Test the `jmbuilder._globals.JMSetupConfRetriever` class."""
+        setup = _globals.JMSetupConfRetriever()
+        self.assertEqual(setup.progname, _setupconf.SETUP['progname'])
+        self.assertEqual(setup.author, _globals.AUTHOR)
+        self.assertEqual(setup.version, _globals.VERSION_INFO)
+        self.assertEqual('.'.join(map(str, setup.version)), _globals.VERSION)
+        self.assertEqual(setup.version.major, _globals.VERSION_INFO[0])
+
+    def test_import_without_io(self) -> None:
+        """Test that importing the modules of the CLI never loads the setup metadata."""
+        code: str = '\n'.join([
+            'import sys',
+            'opened = []',
+            "sys.addaudithook(lambda e, a: opened.append(a[0]) if e == 'open' else None)",
+            'import jmbuilder._globals, jmbuilder.exception, jmbuilder.utils',
+            'import jmbuilder.__main__, jmbuilder._cli, jmbuilder._daemon, jmbuilder._watch',
+            "assert not [f for f in opened if str(f).endswith('setup.json')], opened",
+            "assert 'jmbuilder._setupconf' not in sys.modules, 'setup module loaded'",
+            "assert '__jmsetup__' not in vars(jmbuilder._globals), 'setup metadata loaded'",
+            'assert jmbuilder.__version__ == jmbuilder._globals.VERSION',
+            'assert jmbuilder._cli.__version__ == jmbuilder.core.__version__',
+            'import _globals',  # Import under another path, must not raise
+            'assert _globals.VERSION == jmbuilder._globals.VERSION',
+            "assert not [f for f in opened if str(f).endswith('setup.json')], opened"
+        ])
+        env: dict = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(BASEDIR), BASEDIR])
+
+        proc = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                              text=True, env=env, check=False)
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Test suite for the import-time cost of `jmbuilder` package, based on
+the ``-X importtime`` output of Python interpreter.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import re
+import sys
+import subprocess
+import unittest
+from typing import Dict, List
+
+from .._globals import AUTHOR, BASEDIR, VERSION, VERSION_INFO
+
+
+class TestImportTime(unittest.TestCase):
+    """Test class for lazy imports and the import-time budgets."""
+
+    # Modules that must not be imported until a POM is actually parsed
+    heavy_modules: tuple = ('bs4', 'lxml')
+
+    # The maximum cumulative import time (in microseconds) for each module.
+    # These are generous on purpose, the real regression guard against
+    # eager imports is the heavy modules check.
+    budgets: Dict[str, int] = {
+        'jmbuilder': 100_000,
+        'jmbuilder._globals': 30_000,
+        'jmbuilder.exception': 60_000
+    }
+
+    # import time: <self [us]> | <cumulative [us]> | <module name>
+    _line_pattern: re.Pattern = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)')
+
+    def _importtime(self, *args: str) -> Dict[str, int]:
+        """Run Python with ``-X importtime`` and return the cumulative times."""
+        env: dict = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            filter(None, [os.path.dirname(BASEDIR), env.get('PYTHONPATH')]))
+
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', *args],
+            capture_output=True, text=True, env=env, check=False
+        )
+        self.assertEqual(proc.returncode, 0, msg=proc.stderr)
+
+        lines: List[str] = proc.stderr.splitlines()
+        return {
+            match[3]: int(match[2]) for match in map(self._line_pattern.match, lines)
+            if match
+        }
+
+    def _assert_no_heavy_modules(self, times: Dict[str, int]) -> None:
+        for module in times:
+            self.assertNotIn(module.split('.')[0], self.heavy_modules,
+                msg=f'{module!r} was imported eagerly')
+
+    def test_import_package(self) -> None:
+        """Test that importing `jmbuilder` does not load the XML stack."""
+        times: Dict[str, int] = self._importtime('-c', 'import jmbuilder')
+        self._assert_no_heavy_modules(times)
+
+        for module, budget in self.budgets.items():
+            self.assertIn(module, times)
+            self.assertLessEqual(times[module], budget,
+                msg=f'{module!r} exceeded its import-time budget')
+
+    def test_import_core(self) -> None:
+        """Test that importing `jmbuilder.core` does not load the XML stack."""
+        self._assert_no_heavy_modules(self._importtime('-c', 'import jmbuilder.core'))
+
+    def test_cli_version(self) -> None:
+        """Test that ``python -m jmbuilder -V`` does not load the XML stack."""
+        self._assert_no_heavy_modules(self._importtime('-m', 'jmbuilder', '-V'))
+
+    def test_lazy_attributes(self) -> None:
+        """Test that the lazy members resolve to the real objects."""
+        # pylint: disable=import-outside-toplevel
+        import jmbuilder
+        from jmbuilder import core, utils
+        from jmbuilder.utils import utils as jmutils
+
+        self.assertIs(jmbuilder.PomParser, core.PomParser)
+        self.assertIs(jmbuilder.JMRepairer, core.JMRepairer)
+        self.assertIs(jmbuilder.JMProperties, jmutils.JMProperties)
+        self.assertIs(utils.readfile, jmutils.readfile)
+        self.assertIn('PomParser', dir(jmbuilder))
+
+        with self.assertRaises(AttributeError):
+            getattr(jmbuilder, 'NonExistingAttribute')
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Test suite for the custom logger, exclusively for `jmbuilder.utils.logger` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from ..utils import logger as jmlogger
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+
+
+class TestLogger(unittest.TestCase):
+    """Test class for the `jmbuilder.utils.logger` module."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _read_lines(self, path: str) -> list:
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read().splitlines()
+
+    def test_idempotent(self) -> None:
+        """Test that initializing the same logger again does not duplicate the records."""
+        filename: str = os.path.join(self.tmpdir.name, 'logs', 'idempotent')
+        log = jmlogger.init_logger(filename, fmt='%(message)s')
+        self.assertIs(jmlogger.init_logger(filename, fmt='%(message)s', level=jmlogger.INFO), log)
+        self.assertEqual(len(log.handlers), 1)
+        self.assertEqual(log.level, jmlogger.INFO)
+
+        log.info('first')
+        log.debug('filtered')
+        jmlogger.stop_logger(log)
+        self.assertListEqual(self._read_lines(filename + '.log'), ['first'])
+        self.assertListEqual(log.handlers, [])
+
+        # Stopped loggers can be initialized again
+        log = jmlogger.init_logger(filename, fmt='%(message)s')
+        log.info('second')
+        jmlogger.stop_logger('idempotent.log')
+        self.assertListEqual(self._read_lines(filename + '.log'), ['first', 'second'])
+
+    def test_background_thread(self) -> None:
+        """Test that the records are written from the listener's thread."""
+        filename: str = os.path.join(self.tmpdir.name, 'thread.log')
+        threads: set = set()
+
+        def emit(handler, _record) -> None:
+            if handler.baseFilename == filename:
+                threads.add(threading.get_ident())
+
+        # pylint: disable=protected-access
+        with mock.patch.object(jmlogger._log.FileHandler, 'emit', emit):
+            log = jmlogger.init_logger(filename)
+            log.info('message')
+            jmlogger.stop_logger(log)
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_rotation(self) -> None:
+        """Test the size-based rotation of a bare file name inside `LOGSDIR`."""
+        with mock.patch.object(jmlogger, 'LOGSDIR', self.tmpdir.name):
+            log = jmlogger.init_logger('rotating', fmt='%(message)s',
+                                       max_bytes=100, backup_count=2)
+        for idx in range(50):
+            log.info('record %02d', idx)
+        jmlogger.stop_logger(log)
+
+        self.assertListEqual(sorted(os.listdir(self.tmpdir.name)),
+                             ['rotating.log', 'rotating.log.1', 'rotating.log.2'])
+        self.assertEqual(self._read_lines(os.path.join(self.tmpdir.name, 'rotating.log'))[-1],
+                         'record 49')
+
+
+__author__       = AUTHOR
+__version__      = VERSION
+__version_info__ = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+Test suite for the plug-in placeholders, exclusively for
+`jmbuilder.placeholders` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from typing import List
+from unittest import mock
+
+from .. import core as jmcore
+from .. import placeholders as jmplaceholders
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import POM
+
+
+class TestPlaceholders(unittest.TestCase):
+    """Test class for the `jmbuilder.placeholders.Placeholders` class."""
+
+    def setUp(self) -> None:
+        self.calls: List[str] = []
+        self.addCleanup(jmplaceholders.unregister, 'test')
+        self.addCleanup(jmplaceholders.unregister, 'test.sub')
+        jmplaceholders.register('test', self.resolve)
+
+    def resolve(self, name: str, basedir: str) -> str:
+        """Resolve the name to itself, recording the call."""
+        self.calls.append(name)
+        return f'{name}@{os.path.basename(basedir)}'
+
+    def test_lookup(self) -> None:
+        """Test finding the resolvers by the longest registered namespace."""
+        jmplaceholders.register('test.sub', str.upper, expensive=True)
+        self.assertTupleEqual(jmplaceholders.lookup('test.a.b'), (self.resolve, 'a.b', False))
+        self.assertTupleEqual(jmplaceholders.lookup('test.sub.c'), (str.upper, 'c', True))
+        self.assertIsNone(jmplaceholders.lookup('test'))
+        self.assertIsNone(jmplaceholders.lookup('unknown.key'))
+
+        for namespace in ('', '.test', 'test.'):
+            with self.assertRaises(ValueError):
+                jmplaceholders.register(namespace, self.resolve)
+        jmplaceholders.unregister('test')
+        self.assertIsNone(jmplaceholders.lookup('test.a'))
+
+    def test_memoized(self) -> None:
+        """Test evaluating each key only once per directory."""
+        placeholders = jmplaceholders.Placeholders()
+        self.assertEqual(placeholders.get('test.a', '/tmp/x'), 'a@x')
+        self.assertEqual(placeholders.get('test.a', '/tmp/x'), 'a@x')
+        self.assertEqual(placeholders.get('test.a', '/tmp/y'), 'a@y')
+        self.assertIsNone(placeholders.get('unknown.key'))
+        self.assertListEqual(self.calls, ['a', 'a'])
+        self.assertEqual(len(placeholders), 2)
+
+        # Another run evaluates them again
+        jmplaceholders.Placeholders().get('test.a', '/tmp/x')
+        self.assertListEqual(self.calls, ['a', 'a', 'a'])
+
+    def test_scope(self) -> None:
+        """Test sharing the values between the directories of the same scope."""
+        jmplaceholders.register('test', self.resolve, scope=os.path.dirname)
+        placeholders = jmplaceholders.Placeholders()
+        self.assertEqual(placeholders.get('test.a', '/tmp/x/module-1'), 'a@module-1')
+        self.assertEqual(placeholders.get('test.a', '/tmp/x/module-2'), 'a@module-1')
+        self.assertEqual(placeholders.get('test.a', '/tmp/y/module-1'), 'a@module-1')
+        self.assertListEqual(self.calls, ['a', 'a'])
+        self.assertEqual(len(placeholders), 2)
+
+    def test_prefetch(self) -> None:
+        """Test evaluating the expensive keys concurrently, and the others lazily."""
+        barrier = threading.Barrier(3, timeout=10)
+
+        def resolve(name: str, basedir: str) -> str:  # pylint: disable=unused-argument
+            barrier.wait()  # Broken unless the three keys are evaluated at once
+            return name
+
+        jmplaceholders.register('test.sub', resolve, expensive=True)
+        placeholders = jmplaceholders.Placeholders()
+        placeholders.prefetch(['test.sub.a', 'test.sub.b', 'test.sub.c', 'test.sub.a',
+                               'test.d', 'unknown.key'], '/tmp')
+        self.assertEqual(len(placeholders), 3)
+        self.assertListEqual(self.calls, [])
+        self.assertEqual(placeholders.get('test.sub.b', '/tmp'), 'b')
+
+        # A single key is left to be evaluated by its first use
+        placeholders.prefetch(['test.sub.a', 'test.sub.e'], '/tmp')
+        self.assertEqual(len(placeholders), 3)
+
+    def test_errors(self) -> None:
+        """Test raising the errors of the resolvers, on every call."""
+        jmplaceholders.register('test', mock.Mock(side_effect=OSError('failed')))
+        placeholders = jmplaceholders.Placeholders()
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                placeholders.get('test.a')
+
+    def test_repairer(self) -> None:
+        """Test rendering the placeholders, after the POM and user properties."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pom: str = os.path.join(tmpdir, 'pom.xml')
+            with open(pom, 'w', encoding='utf-8') as file:
+                file.write(POM)
+
+            placeholders = jmplaceholders.Placeholders()
+            repairer = jmcore.JMRepairer(pom, properties={'test.b': 'user'},
+                                         placeholders=placeholders)
+            self.assertEqual(repairer.render_text(
+                '${project.version} ${test.a} ${test.b} \\${test.c} ${test.a}'),
+                f'1.2.3 a@{os.path.basename(tmpdir)} user ${{test.c}} '
+                f'a@{os.path.basename(tmpdir)}'.encode('UTF-8'))
+            self.assertEqual(repairer.render_properties('a = ${test.d}\nb = ${test.e.f}\n'),
+                             f'a = d@{os.path.basename(tmpdir)}\n'
+                             f'b = e.f@{os.path.basename(tmpdir)}\n'.encode('UTF-8'))
+            self.assertEqual(repairer.render_manifest('X: ${unknown.key}\n'),
+                             b'X: ${unknown.key}\n\n')
+
+            # The same run shares the values between the repairers
+            jmcore.JMRepairer(pom, placeholders=placeholders).render_text('${test.a}')
+            self.assertListEqual(self.calls, ['a', 'd', 'e.f'])
+            self.assertEqual(repairer.stats()['placeholders_unresolved'], 1)
+
+            # The expensive ones are evaluated at once, on the first one met
+            barrier = threading.Barrier(2, timeout=10)
+
+            def resolve(name: str, basedir: str) -> str:  # pylint: disable=unused-argument
+                barrier.wait()
+                return name
+
+            jmplaceholders.register('test.sub', resolve, expensive=True)
+            self.assertEqual(repairer.render_text('${test.sub.a} ${project.name} ${test.sub.b}'),
+                             b'a Example b')
+
+
+class TestBuiltins(unittest.TestCase):
+    """Test class for the built-in namespaces."""
+
+    def test_build(self) -> None:
+        """Test the build number from the environment of the CI services."""
+        with mock.patch.dict(os.environ, {'GITHUB_RUN_NUMBER': '42'}):
+            os.environ.pop('BUILD_NUMBER', None)
+            self.assertEqual(jmplaceholders.Placeholders().get('build.number'), '42')
+        self.assertTrue(jmplaceholders.Placeholders().get('build.host'))
+        self.assertIsNone(jmplaceholders.Placeholders().get('build.unknown'))
+
+    def test_java(self) -> None:
+        """Test running the JDK once for all the system properties."""
+        output: str = ('Property settings:\n    java.home = /opt/jdk\n    java.vendor = Example\n'
+                       '    java.library.path = /usr/lib\n        /lib\n    java.version = 17\n\n'
+                       'openjdk version "17"')
+        with mock.patch.object(jmplaceholders, '_run', side_effect=[None, output]) as run, \
+                mock.patch.dict(jmplaceholders._JAVA_PROPERTIES, clear=True), \
+                mock.patch.dict(os.environ, {'JAVA_HOME': '/opt/jdk'}):
+            # A failed run is tried again
+            self.assertIsNone(jmplaceholders.Placeholders().get('java.home', '/tmp'))
+
+            placeholders = jmplaceholders.Placeholders()
+            placeholders.prefetch(['java.home', 'java.vendor', 'java.library.path',
+                                   'java.version'], '/tmp')
+            self.assertEqual(placeholders.get('java.home', '/tmp'), '/opt/jdk')
+            self.assertEqual(placeholders.get('java.vendor', '/tmp'), 'Example')
+            self.assertEqual(placeholders.get('java.library.path', '/tmp'),
+                             f'/usr/lib{os.pathsep}/lib')
+            self.assertEqual(placeholders.get('java.version', '/tmp'), '17')
+            self.assertIsNone(jmplaceholders.Placeholders().get('java.unknown', '/tmp'))
+            self.assertEqual(run.call_count, 2)
+
+    @unittest.skipUnless(shutil.which('git'), 'requires Git')
+    def test_git(self) -> None:
+        """Test the commit, branch and state of the repository containing the POM."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertIsNone(jmplaceholders.Placeholders().get('git.commit', tmpdir))
+
+            def git(*args: str) -> None:
+                subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@test',
+                                '-c', 'commit.gpgsign=false', *args], cwd=tmpdir, check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+            git('init', '-q')
+            git('checkout', '-q', '-b', 'release')
+            git('commit', '-q', '--allow-empty', '-m', 'init')
+            git('tag', 'v1.0')
+
+            placeholders = jmplaceholders.Placeholders()
+            placeholders.prefetch(['git.commit', 'git.commit.short', 'git.branch',
+                                   'git.tag', 'git.dirty'], tmpdir)
+            self.assertRegex(placeholders.get('git.commit', tmpdir), r'^[0-9a-f]{40}$')
+            self.assertTrue(placeholders.get('git.commit', tmpdir).startswith(
+                placeholders.get('git.commit.short', tmpdir)))
+            self.assertEqual(placeholders.get('git.branch', tmpdir), 'release')
+            self.assertEqual(placeholders.get('git.tag', tmpdir), 'v1.0')
+            self.assertEqual(placeholders.get('git.dirty', tmpdir), 'false')
+            self.assertIsNone(placeholders.get('git.unknown', tmpdir))
+
+            # The modules of the repository share the values
+            module: str = os.path.join(tmpdir, 'module')
+            os.mkdir(module)
+            evaluated: int = len(placeholders)
+            self.assertEqual(placeholders.get('git.branch', module), 'release')
+            self.assertEqual(len(placeholders), evaluated)
+
+            with open(os.path.join(tmpdir, 'new.txt'), 'w', encoding='utf-8'):
+                pass
+            self.assertEqual(placeholders.get('git.dirty', tmpdir), 'false')  # Memoized
+            self.assertEqual(jmplaceholders.Placeholders().get('git.dirty', tmpdir), 'true')
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Test suite for the phase hooks and the profiler, exclusively for
+`jmbuilder.profiler` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import io
+import os
+import json
+import pstats
+import tempfile
+import threading
+import tracemalloc
+import unittest
+from unittest import mock
+
+from .. import _cli as jmcli
+from .. import profiler as jmprof
+from ..exception import JMException
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import POM
+
+
+class TestProfiler(unittest.TestCase):
+    """Test class for the `jmbuilder.profiler` module."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.pom: str = os.path.join(self.tmpdir.name, 'pom.xml')
+        self.props: str = os.path.join(self.tmpdir.name, 'a.properties')
+        with open(self.pom, 'w', encoding='utf-8') as file:
+            file.write(POM)
+        with open(self.props, 'w', encoding='utf-8') as file:
+            file.write('version = ${project.version}\n')
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_phase_disabled(self) -> None:
+        """Test that phases are no-ops while no recorder is registered."""
+        self.assertIs(jmprof.phase('parse'), jmprof.phase('write', 'out'))
+
+    def test_profiler(self) -> None:
+        """Test that the profiler records all phases and writes the pstats file."""
+        path: str = os.path.join(self.tmpdir.name, 'logs', 'run.pstats')
+        table: io.StringIO = io.StringIO()
+
+        with jmprof.Profiler(path, file=table) as prof:
+            jmcli.run_jobs([jmcli.Job('properties', self.pom, self.props, self.props)])
+
+        self.assertListEqual(list(prof.phases.calls), [
+            'parse', 'index', 'read template', 'resolve', 'render', 'write'
+        ])
+        self.assertEqual(prof.phases.calls['read template'], 2)
+        self.assertIn('resolve', table.getvalue())
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
+        self.assertIs(jmprof.phase('parse'), jmprof.phase('index'))
+
+    def test_trace(self) -> None:
+        """Test that the spans of each worker are written as Chrome trace events."""
+        path: str = os.path.join(self.tmpdir.name, 'trace.json')
+        jobs: list = [jmcli.Job('properties', self.pom, self.props, self.props)]
+
+        with mock.patch('sys.stderr', new_callable=io.StringIO):
+            with jmprof.TraceRecorder(path):
+                worker = threading.Thread(target=jmcli.run_jobs, args=(jobs,), name='worker-1')
+                worker.start()
+                worker.join()
+                jmcli.run_jobs(jobs)
+
+        with open(path, 'r', encoding='utf-8') as file:
+            events: list = json.load(file)['traceEvents']
+
+        spans: list = [event for event in events if event['ph'] == 'X']
+        self.assertEqual(len({span['tid'] for span in spans}), 2)
+        self.assertIn('worker-1', {span['args']['worker'] for span in spans})
+        self.assertIn(self.pom,
+                      {span['args']['path'] for span in spans if span['name'] == 'parse'})
+        self.assertTrue(all(span['dur'] >= 0 for span in spans))
+        self.assertIs(jmprof.phase('parse'), jmprof.phase('index'))
+
+    def test_memory_profiler(self) -> None:
+        """Test that the memory profiler reports the allocations of each phase."""
+        path: str = os.path.join(self.tmpdir.name, 'mem')
+
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            with jmprof.MemoryProfiler(path + '.json', top=3):
+                jmcli.run_jobs([jmcli.Job('properties', self.pom, self.props, self.props)])
+
+        with open(path + '.json', 'r', encoding='utf-8') as file:
+            report: dict = json.load(file)
+        self.assertIn('memory profile written to', stderr.getvalue())
+        self.assertTrue(os.path.isfile(path + '.txt'))
+        self.assertEqual(report['phases']['read template']['calls'], 2)
+        for stats in report['phases'].values():
+            self.assertGreaterEqual(stats['peak_bytes'], 0)
+            self.assertLessEqual(len(stats['top']), 3)
+        self.assertGreater(report['phases']['parse']['peak_bytes'], 0)
+        self.assertIs(jmprof.phase('parse'), jmprof.phase('index'))
+
+    def test_memory_profiler_no_reset(self) -> None:
+        """Test reporting no peak of each phase if it cannot be reset (Python < 3.9)."""
+        path: str = os.path.join(self.tmpdir.name, 'mem')
+        if hasattr(tracemalloc, 'reset_peak'):
+            self.addCleanup(setattr, tracemalloc, 'reset_peak', tracemalloc.reset_peak)
+            del tracemalloc.reset_peak
+
+        with mock.patch('sys.stderr', new_callable=io.StringIO):
+            with jmprof.MemoryProfiler(path):
+                jmcli.run_jobs([jmcli.Job('properties', self.pom, self.props, self.props)])
+
+        with open(path + '.json', 'r', encoding='utf-8') as file:
+            report: dict = json.load(file)
+        self.assertTrue(all(stats['peak_bytes'] is None for stats in report['phases'].values()))
+        self.assertGreater(report['peak_bytes'], 0)
+        with open(path + '.txt', 'r', encoding='utf-8') as file:
+            self.assertIn('n/a', file.read())
+
+    def test_cli_profile(self) -> None:
+        """Test the ``--profile[=path]`` and ``--trace[=path]`` command-line options."""
+        self.assertDictEqual(jmcli.parse_args(['--profile']).options, {'profile': ''})
+        with self.assertRaises(JMException):
+            jmcli.parse_args(['--profile', 'run.pstats'])
+
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            code: int = jmcli.main(
+                ['--fix-prop', 'pom.xml', 'a.properties',
+                 '--profile=run.pstats', '--trace=run.json'],
+                cwd=self.tmpdir.name)
+
+        self.assertEqual(code, 0)
+        self.assertIn('render', stderr.getvalue())
+        self.assertIn('trace written to', stderr.getvalue())
+        for name in ('run.pstats', 'run.json'):
+            self.assertTrue(os.path.isfile(os.path.join(self.tmpdir.name, name)))
+
+
+__author__       = AUTHOR
+__version__      = VERSION
+__version_info__ = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
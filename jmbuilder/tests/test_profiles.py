@@ -0,0 +1,172 @@
+"""
+Test suite for the profile activation, exclusively for `jmbuilder.profiles` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .. import core as jmcore
+from .. import profiles as jmprofiles
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+
+
+PROFILES_POM: str = '''<?xml version="1.0" encoding="UTF-8"?>
+<project>
+  <groupId>com.example</groupId>
+  <artifactId>example</artifactId>
+  <version>1.0</version>
+  <properties>
+    <env.name>dev</env.name>
+    <build.label>${env.name}-${project.version}</build.label>
+  </properties>
+  <profiles>
+    <profile>
+      <id>default</id>
+      <activation><activeByDefault>true</activeByDefault></activation>
+      <properties><env.name>local</env.name></properties>
+    </profile>
+    <profile>
+      <id>release</id>
+      <activation><property><name>release</name></property></activation>
+      <properties><env.name>prod</env.name></properties>
+    </profile>
+    <profile>
+      <id>marker</id>
+      <activation><file><exists>release.marker</exists></file></activation>
+      <properties><marker>found</marker></properties>
+    </profile>
+    <profile>
+      <id>unix</id>
+      <activation><os><family>unix</family></os></activation>
+      <properties><os.label>unix</os.label></properties>
+    </profile>
+  </profiles>
+</project>
+'''
+
+
+class TestActivation(unittest.TestCase):
+    """Test class for the activation conditions of profiles."""
+
+    def test_jdk(self) -> None:
+        """Test matching the JDK version against prefixes and ranges."""
+        activation = jmprofiles.Activation
+        for spec, expected in (('11', True), ('1.8', False), ('!1.8', True),
+                               ('[11,)', True), ('[11]', True), ('(11,17)', False),
+                               ('[1.8,11)', False), ('(,1.8],[11,12)', True)):
+            self.assertEqual(jmprofiles.is_active(
+                activation(jdk=spec), {'java.version': '11.0.2'}), expected, msg=spec)
+        self.assertFalse(jmprofiles.is_active(activation(active_by_default=True)))
+
+        # Ordered as the other versions, see `jmbuilder.versions`
+        for spec, version, expected in (('[17,)', '17-ea', True), ('[17.0,)', '17-beta', False),
+                                        ('[1.8,11)', '1.8.0_292', True), ('[1.8,11)', '11', False),
+                                        ('(,17-ea]', '17-beta', True), ('[11,', '11', False)):
+            self.assertEqual(jmprofiles.is_active(
+                activation(jdk=spec), {'java.version': version}), expected, msg=(spec, version))
+
+    def test_property(self) -> None:
+        """Test the property conditions, including the environment variables."""
+        activation = jmprofiles.Activation
+        props: dict = {'mode': 'ci'}
+        self.assertTrue(jmprofiles.is_active(activation(property_name='mode'), props))
+        self.assertFalse(jmprofiles.is_active(activation(property_name='!mode'), props))
+        self.assertTrue(jmprofiles.is_active(
+            activation(property_name='mode', property_value='!dev'), props))
+        self.assertFalse(jmprofiles.is_active(
+            activation(property_name='mode', property_value='dev'), props))
+
+        with mock.patch.dict(os.environ, {'JM_PROFILE_TEST': 'yes'}):
+            self.assertTrue(jmprofiles.is_active(
+                activation(property_name='env.JM_PROFILE_TEST', property_value='yes')))
+
+
+class TestResolveProperties(unittest.TestCase):
+    """Test class for the `jmbuilder.profiles.resolve_properties` function."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.pom_file: str = os.path.join(self.tmpdir.name, 'pom.xml')
+        with open(self.pom_file, 'w', encoding='utf-8') as file:
+            file.write(PROFILES_POM)
+        self.model = jmcore.PomParser.parse(self.pom_file).to_model()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _active(self, *activate: str, **properties: str) -> list:
+        return [profile.id for profile in jmprofiles.active_profiles(
+            self.model.profiles, activate, properties, self.tmpdir.name)]
+
+    def test_active_profiles(self) -> None:
+        """Test the explicit, conditional and default activation of profiles."""
+        self.assertListEqual([profile.id for profile in self.model.profiles],
+                             ['default', 'release', 'marker', 'unix'])
+        unix: list = ['unix'] if os.pathsep == ':' else []
+        self.assertListEqual(self._active('!unix'), ['default'])
+        self.assertListEqual(self._active('-unix', release=''), ['release'])
+        self.assertListEqual(self._active('default,release', '!unix'), ['default', 'release'])
+
+        with open(os.path.join(self.tmpdir.name, 'release.marker'), 'w', encoding='utf-8'):
+            pass
+        self.assertListEqual(self._active(), ['marker'] + unix)
+
+    def test_merge(self) -> None:
+        """Test the precedence of the merged properties and their cache."""
+        merged = jmprofiles.resolve_properties(self.model, ['release', '!unix'],
+                                               basedir=self.tmpdir.name)
+        self.assertEqual(merged['env.name'], 'prod')
+        self.assertDictEqual(dict(jmprofiles.resolve_properties(
+            self.model, ['release,!unix'], basedir=self.tmpdir.name)), dict(merged))
+        # Found by the arguments, without activating the profiles again
+        with mock.patch.object(jmprofiles, 'active_profiles') as active_profiles:
+            self.assertIs(jmprofiles.resolve_properties(self.model, ('release', '!unix'),
+                                                        basedir=self.tmpdir.name), merged)
+        active_profiles.assert_not_called()
+
+        merged = jmprofiles.resolve_properties(self.model, ['release'], {'env.name': 'qa'},
+                                               basedir=self.tmpdir.name)
+        self.assertEqual(merged['env.name'], 'qa')
+        with self.assertRaises(TypeError):
+            merged['env.name'] = 'dev'  # pylint: disable=unsupported-assignment-operation
+
+    def test_render(self) -> None:
+        """Test rendering the properties of the active profiles."""
+        text: str = 'label = ${build.label}\n'
+        for kwargs, expected in (({'profiles': ['!unix']}, 'local-1.0'),
+                                 ({'profiles': ['release']}, 'prod-1.0'),
+                                 ({'properties': {'env.name': 'qa'}}, 'qa-1.0')):
+            repairer = jmcore.JMRepairer(self.pom_file, **kwargs)
+            self.assertEqual(repairer.render_properties(text),
+                             f'label = {expected}{os.linesep}'.encode('UTF-8'), msg=kwargs)
+
+    def test_render_parsed(self) -> None:
+        """Test activating the file profiles of a parsed POM against its base directory."""
+        with open(os.path.join(self.tmpdir.name, 'release.marker'), 'w', encoding='utf-8'):
+            pass
+        pom = jmcore.PomParser.parse(self.pom_file)
+        with mock.patch.object(jmcore.PomParser, 'get_dependencies') as dependencies, \
+                mock.patch.object(jmcore.PomParser, 'get_plugins') as plugins:
+            repairer = jmcore.JMRepairer(pom, basedir=self.tmpdir.name)
+        self.assertEqual(repairer.render_text('${marker}'), b'found')
+        # Only the rendered values are extracted
+        dependencies.assert_not_called()
+        plugins.assert_not_called()
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+Test suite for the reactor discovery, exclusively for `jmbuilder.reactor` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from .. import profiler as jmprof
+from .. import reactor as jmreactor
+from ..exception import JMException
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+
+
+def _pom(artifact_id: str, *, parent: str = None, modules: tuple = (),
+         dependencies: tuple = (), group_id: str = None) -> str:
+    """Return the content of a POM file with the given elements."""
+    parts: list = ['<?xml version="1.0" encoding="UTF-8"?>', '<project>']
+    if parent:
+        parts.append('<parent><groupId>com.example</groupId>'
+                     f'<artifactId>{parent}</artifactId><version>1.0</version></parent>')
+    if group_id:
+        parts.append(f'<groupId>{group_id}</groupId>')
+    parts.append(f'<artifactId>{artifact_id}</artifactId>')
+    if modules:
+        parts.append('<modules>' + ''.join(f'<module>{name}</module>' for name in modules)
+                     + '</modules>')
+    if dependencies:
+        parts.append('<dependencies>' + ''.join(
+            f'<dependency><groupId>{group}</groupId><artifactId>{name}</artifactId>'
+            '</dependency>' for group, name in dependencies) + '</dependencies>')
+    parts.append('</project>')
+    return '\n'.join(parts)
+
+
+class TestReactor(unittest.TestCase):
+    """Test class for the `jmbuilder.reactor` module."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _write(self, relpath: str, content: str) -> str:
+        path: str = os.path.join(self.tmpdir.name, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def _write_project(self) -> None:
+        self._write('pom.xml', _pom('parent', group_id='com.example',
+                                    modules=('app', 'core', 'libs')))
+        self._write('app/pom.xml', _pom('app', parent='parent', dependencies=(
+            ('${project.groupId}', 'core'), ('org.junit', 'junit'))))
+        self._write('core/pom.xml', _pom('core', parent='parent', dependencies=(
+            ('com.example', 'util'),)))
+        self._write('libs/pom.xml', _pom('libs', parent='parent', modules=('util/pom.xml',)))
+        self._write('libs/util/pom.xml', _pom('util', parent='libs'))
+        self._write('unlinked/pom.xml', _pom('unlinked', group_id='com.example'))
+
+    def test_modules(self) -> None:
+        """Test the discovery by following the modules, parsing each POM once."""
+        self._write_project()
+        parsed: Counter = Counter()
+
+        def recorder(name, _start, _end, path) -> None:
+            if name == 'parse':
+                parsed[path] += 1
+
+        jmprof.add_recorder(recorder)
+        try:
+            reactor = jmreactor.scan(self.tmpdir.name)
+        finally:
+            jmprof.remove_recorder(recorder)
+
+        self.assertEqual(len(reactor), 5)
+        self.assertNotIn('com.example:unlinked', reactor)
+        self.assertEqual(len(parsed), 5)
+        self.assertEqual(max(parsed.values()), 1)
+
+        self.assertEqual(reactor['com.example:app'].group_id, 'com.example')
+        self.assertTupleEqual(reactor.upstream('com.example:app'),
+                              ('com.example:parent', 'com.example:core'))
+        self.assertTupleEqual(reactor.downstream('com.example:util'), ('com.example:core',))
+        self.assertListEqual(
+            [[module.artifact_id for module in level] for level in reactor.levels()],
+            [['parent'], ['libs'], ['util'], ['core'], ['app']])
+        self.assertListEqual([module.artifact_id for module in reactor],
+                             ['parent', 'libs', 'util', 'core', 'app'])
+
+    def test_parent(self) -> None:
+        """Test that the parents are discovered from a nested module."""
+        self._write_project()
+        reactor = jmreactor.scan(os.path.join(self.tmpdir.name, 'libs', 'util', 'pom.xml'))
+        self.assertListEqual([module.artifact_id for module in reactor],
+                             ['parent', 'libs', 'util'])
+
+    def test_relative_path_not_parent(self) -> None:
+        """Test that a module at the relative path of another one's parent is still walked."""
+        self._write('pom.xml', _pom('root', group_id='com.example', modules=('group/app',)))
+        self._write('group/pom.xml', _pom('group', group_id='com.example'))
+        self._write('group/app/pom.xml', _pom('app', parent='parent'))
+
+        reactor = jmreactor.scan(self.tmpdir.name, walk=True)
+        self.assertListEqual(sorted(module.artifact_id for module in reactor),
+                             ['app', 'group', 'root'])
+        self.assertNotIn('com.example:group', jmreactor.scan(self.tmpdir.name, walk=False))
+
+    def test_loose_tree(self) -> None:
+        """Test the discovery by walking a tree without an aggregator POM."""
+        self._write('a/pom.xml', _pom('a', group_id='com.example'))
+        self._write('b/nested/pom.xml', _pom('b', group_id='com.example', dependencies=(
+            ('com.example', 'a'),)))
+        self._write('a/target/pom.xml', _pom('skipped', group_id='com.example'))
+        self._write('.git/pom.xml', _pom('hidden', group_id='com.example'))
+
+        reactor = jmreactor.scan(self.tmpdir.name)
+        self.assertListEqual([[module.artifact_id for module in level]
+                              for level in reactor.levels()], [['a'], ['b']])
+
+    def test_cycle(self) -> None:
+        """Test that cyclic dependencies between the modules are rejected."""
+        self._write('a/pom.xml', _pom('a', group_id='com.example', dependencies=(
+            ('com.example', 'b'),)))
+        self._write('b/pom.xml', _pom('b', group_id='com.example', dependencies=(
+            ('com.example', 'a'),)))
+        self._write('c/pom.xml', _pom('c', group_id='com.example'))
+
+        reactor = jmreactor.scan(self.tmpdir.name)
+        with self.assertRaises(JMException) as ctx:
+            reactor.levels()
+        self.assertIn('com.example:a, com.example:b', str(ctx.exception))
+
+
+__author__       = AUTHOR
+__version__      = VERSION
+__version_info__ = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
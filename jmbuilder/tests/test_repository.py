@@ -0,0 +1,144 @@
+"""
+Test suite for the local repository index, exclusively for `jmbuilder.repository`
+module, and the offline resolution of parents and imported BOMs by `PomParser`.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import time
+import tempfile
+import unittest
+
+from .. import core as jmcore
+from .. import repository as jmrepo
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import artifact_pom
+
+
+class TestLocalRepository(unittest.TestCase):
+    """Test class for the `jmbuilder.repository.LocalRepository` class."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.root: str = os.path.join(self.tmpdir.name, 'repository')
+        self.index_file: str = os.path.join(self.tmpdir.name, 'index.json')
+        for group in range(5):
+            for artifact in range(4):
+                for version in ('1.0', '1.1', '2.0-SNAPSHOT'):
+                    self._install(f'com.example.g{group}', f'a{artifact}', version)
+        # Leave no directory as recent as the walk, see `jmrepo._RACY_PERIOD`
+        self._age()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _install(self, group_id: str, artifact_id: str, version: str, body: str = '') -> None:
+        versiondir: str = os.path.join(self.root, *group_id.split('.'), artifact_id, version)
+        os.makedirs(versiondir, exist_ok=True)
+        with open(os.path.join(versiondir, f'{artifact_id}-{version}.pom'), 'w',
+                  encoding='utf-8') as file:
+            file.write(artifact_pom(group_id, artifact_id, version, body))
+        with open(os.path.join(versiondir, f'{artifact_id}-{version}.jar'), 'wb'):
+            pass
+
+    def _age(self) -> None:
+        # Only the recently modified directories, the others must stay unchanged
+        now: float = time.time()
+        for dirpath, _, _ in os.walk(self.root):
+            if os.stat(dirpath).st_mtime > now - 30:
+                os.utime(dirpath, (now - 60, now - 60))
+
+    def _repository(self) -> jmrepo.LocalRepository:
+        return jmrepo.LocalRepository(self.root, index_file=self.index_file, workers=4)
+
+    def test_index(self) -> None:
+        """Test the lookups of the artifacts in the index."""
+        repo = self._repository()
+        self.assertEqual(len(repo), 60)
+        self.assertEqual(repo.find('com.example.g3', 'a2', '1.1'), os.path.join(
+            self.root, 'com', 'example', 'g3', 'a2', '1.1', 'a2-1.1.pom'))
+        self.assertIn(('com.example.g0', 'a0', '2.0-SNAPSHOT'), repo)
+        self.assertNotIn(('com.example.g0', 'a0', '3.0'), repo)
+        self.assertNotIn(('com.example', 'g0', 'a0'), repo)
+        self.assertTupleEqual(repo.versions('com.example.g1', 'a3'),
+                              ('1.0', '1.1', '2.0-SNAPSHOT'))
+        self.assertTupleEqual(repo.versions('com.example.g1', 'missing'), ())
+
+        # Installed after the walk, found by probing the repository
+        self._install('com.example.g0', 'a0', '3.0')
+        self.assertIsNotNone(repo.find('com.example.g0', 'a0', '3.0'))
+
+    def test_incremental_refresh(self) -> None:
+        """Test that only the changed directories are read again, across instances."""
+        scanned: int = self._repository().refresh()
+        self.assertTrue(os.path.isfile(self.index_file))
+
+        repo = self._repository()
+        self.assertEqual(repo.refresh(), 0)
+        self.assertEqual(len(repo), 60)
+
+        self._install('com.example.g4', 'a1', '1.2')
+        self._install('org.other', 'b', '0.1')
+        self._age()
+        # The artifact and new version directories of `g4:a1`, the root directory
+        # and the four new directories of `org/other/b/0.1`
+        self.assertEqual(repo.refresh(), 7)
+        self.assertLess(7, scanned)
+        self.assertEqual(len(repo), 62)
+        self.assertEqual(self._repository().versions('org.other', 'b'), ('0.1',))
+
+    def test_versions_order(self) -> None:
+        """Test that the versions are ordered as Maven does, not by their names."""
+        for version in ('1.10', '1.9', '1.10-rc1', '1.10.0-sp'):
+            self._install('org.other', 'c', version)
+        self.assertTupleEqual(self._repository().versions('org.other', 'c'),
+                              ('1.9', '1.10-rc1', '1.10', '1.10.0-sp'))
+
+    def test_offline_resolution(self) -> None:
+        """Test resolving the parent and imported BOMs of a POM from the repository."""
+        self._install('com.example', 'bom', '1.0', (
+            '<properties><junit.version>5.10.0</junit.version></properties>'
+            '<dependencyManagement><dependencies><dependency><groupId>org.junit</groupId>'
+            '<artifactId>junit</artifactId><version>${junit.version}</version>'
+            '</dependency></dependencies></dependencyManagement>'))
+        self._install('com.example', 'parent', '1.0', (
+            '<properties><slf4j.version>2.0.9</slf4j.version></properties>'
+            '<dependencyManagement><dependencies><dependency><groupId>org.slf4j</groupId>'
+            '<artifactId>slf4j-api</artifactId><version>${slf4j.version}</version>'
+            '</dependency><dependency><groupId>com.example</groupId><artifactId>bom</artifactId>'
+            '<version>1.0</version><type>pom</type><scope>import</scope></dependency>'
+            '</dependencies></dependencyManagement>'))
+        pom: str = os.path.join(self.tmpdir.name, 'project', 'pom.xml')
+        os.makedirs(os.path.dirname(pom))
+        with open(pom, 'w', encoding='utf-8') as file:
+            file.write(
+                '<project><parent><groupId>com.example</groupId><artifactId>parent</artifactId>'
+                '<version>1.0</version></parent><artifactId>app</artifactId>'
+                '<properties><slf4j.version>1.7.36</slf4j.version></properties>'
+                '<dependencies><dependency><groupId>org.junit</groupId>'
+                '<artifactId>junit</artifactId></dependency><dependency>'
+                '<groupId>org.slf4j</groupId><artifactId>slf4j-api</artifactId></dependency>'
+                '</dependencies></project>')
+
+        self.assertTupleEqual(tuple(dep.version for dep in
+                                    jmcore.PomParser.parse(pom).get_dependencies()), (None, None))
+
+        parser = jmcore.PomParser.parse(pom, repository=self._repository())
+        self.assertListEqual([model.artifact_id for model in parser.get_parents()], ['parent'])
+        self.assertTupleEqual(tuple(dep.version for dep in parser.get_dependencies()),
+                              ('5.10.0', '1.7.36'))
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Test suite for the transitive dependency resolution, exclusively for
+`jmbuilder.resolver` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from .. import profiler as jmprof
+from .. import resolver as jmresolver
+from ..repository import LocalRepository
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import artifact_pom
+
+
+def _dependencies(*deps: str) -> str:
+    """Return the ``<dependencies>`` of the given ``artifactId:version[:scope[:extra]]``."""
+    parts: list = []
+    for dep in deps:
+        artifact_id, version, scope, extra = (dep.split(':', 3) + ['', '', ''])[:4]
+        parts.append(f'<dependency><groupId>com.example</groupId><artifactId>{artifact_id}'
+                     '</artifactId>' + (f'<version>{version}</version>' if version else '') +
+                     (f'<scope>{scope}</scope>' if scope else '') + extra + '</dependency>')
+    return '<dependencies>' + ''.join(parts) + '</dependencies>'
+
+
+class TestResolver(unittest.TestCase):
+    """Test class for the `jmbuilder.resolver.Resolver` class."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.root: str = os.path.join(self.tmpdir.name, 'repository')
+        self._install('a', '1.0', _dependencies(
+            'c:1.0', 'd:1.0::<optional>true</optional>', 'e:1.0', 'p:1.0:provided'))
+        self._install('b', '1.0', _dependencies('c:2.0', 'x:1.0', 'z:9.9'))
+        self._install('c', '1.0', _dependencies('y:1.0'))
+        for artifact_id, version in (('c', '2.0'), ('d', '1.0'), ('e', '1.0'), ('m', '2.0'),
+                                     ('p', '1.0'), ('t', '1.0'), ('x', '1.0'), ('y', '1.5')):
+            self._install(artifact_id, version)
+
+        self.pom_file: str = os.path.join(self.tmpdir.name, 'project', 'pom.xml')
+        os.makedirs(os.path.dirname(self.pom_file))
+        with open(self.pom_file, 'w', encoding='utf-8') as file:
+            file.write(artifact_pom('com.example', 'project', '1.0', (
+                '<dependencyManagement>' + _dependencies('m:2.0', 'y:1.5') +
+                '</dependencyManagement>' + _dependencies(
+                    'a:1.0::<exclusions><exclusion><groupId>com.example</groupId>'
+                    '<artifactId>e</artifactId></exclusion></exclusions>',
+                    'b:1.0:runtime', 't:1.0:test', 'm'))))
+
+        self.resolver = jmresolver.Resolver(
+            LocalRepository(self.root, index_file=''), workers=4)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _install(self, artifact_id: str, version: str, body: str = '') -> None:
+        versiondir: str = os.path.join(self.root, 'com', 'example', artifact_id, version)
+        os.makedirs(versiondir)
+        with open(os.path.join(versiondir, f'{artifact_id}-{version}.pom'), 'w',
+                  encoding='utf-8') as file:
+            file.write(artifact_pom('com.example', artifact_id, version, body))
+
+    def test_resolve(self) -> None:
+        """Test the scopes, exclusions, optional dependencies and mediation."""
+        resolution = self.resolver.resolve(self.pom_file)
+        self.assertListEqual(
+            [(node.dependency.artifact_id, node.dependency.version, node.dependency.scope,
+              node.depth) for node in resolution],
+            [('a', '1.0', 'compile', 1), ('b', '1.0', 'runtime', 1), ('m', '2.0', 'compile', 1),
+             ('c', '1.0', 'compile', 2), ('x', '1.0', 'runtime', 2), ('z', '9.9', 'runtime', 2),
+             ('y', '1.5', 'compile', 3)])
+        self.assertListEqual(
+            sorted((item.dependency.artifact_id, item.reason) for item in resolution.omitted),
+            [('c', 'conflict'), ('d', 'optional'), ('e', 'excluded'), ('p', 'scope'),
+             ('t', 'scope')])
+        self.assertListEqual([dep.artifact_id for dep in resolution.missing], ['z'])
+        self.assertListEqual([node.dependency.artifact_id for node in resolution.children(
+            ('com.example', 'a', 'jar', None))], ['c'])
+        self.assertListEqual(resolution.class_path(('compile',)),
+                             ['a-1.0.jar', 'm-2.0.jar', 'c-1.0.jar', 'y-1.5.jar'])
+
+        resolution = self.resolver.resolve(self.pom_file, scopes=('compile', 'runtime', 'test'))
+        self.assertIn(('com.example', 't', 'jar', None), resolution.nodes)
+
+    def test_version_ranges(self) -> None:
+        """Test that the version ranges resolve to the highest installed version within."""
+        for version in ('1.9', '1.10', '2.0'):
+            self._install('r', version, _dependencies('c:[1.0]'))
+        with open(self.pom_file, 'w', encoding='utf-8') as file:
+            file.write(artifact_pom('com.example', 'project', '1.0', _dependencies(
+                'r:[1.0,2.0)', 'x:(,1.0]', 'y:[2.0,)', 'z:[1.0')))
+
+        resolution = self.resolver.resolve(self.pom_file)
+        self.assertListEqual(
+            [(node.dependency.artifact_id, node.dependency.version) for node in resolution],
+            [('r', '1.10'), ('x', '1.0'), ('c', '1.0')])
+        self.assertListEqual([dep.version for dep in resolution.missing], ['[2.0,)', '[1.0'])
+
+    def test_unresolved_versions(self) -> None:
+        """Test that the dependencies without a version to be used are kept out of the graph."""
+        with open(self.pom_file, 'w', encoding='utf-8') as file:
+            file.write(artifact_pom('com.example', 'project', '1.0', _dependencies(
+                'a:[2.0,3.0)', 'b', 'c:1.0')))
+
+        resolution = self.resolver.resolve(self.pom_file)
+        self.assertListEqual(resolution.class_path(), ['c-1.0.jar', 'y-1.0.jar'])
+        self.assertListEqual([(dep.artifact_id, dep.version) for dep in resolution.missing],
+                             [('a', '[2.0,3.0)'), ('b', None), ('y', '1.0')])
+        self.assertNotIn(('com.example', 'a', 'jar', None), resolution.nodes)
+
+    def test_memoized_loads(self) -> None:
+        """Test that each POM of the repository is loaded only once across resolutions."""
+        parsed: Counter = Counter()
+
+        def recorder(name, _start, _end, path) -> None:
+            if name == 'parse' and path.startswith(self.root):
+                parsed[path] += 1
+
+        jmprof.add_recorder(recorder)
+        try:
+            first = self.resolver.resolve(self.pom_file)
+            second = self.resolver.resolve(self.pom_file)
+        finally:
+            jmprof.remove_recorder(recorder)
+
+        self.assertEqual(first.nodes, second.nodes)
+        self.assertEqual(len(parsed), 6)  # a, b, c, m, x and y, i.e. not the omitted ones
+        self.assertEqual(max(parsed.values()), 1)
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
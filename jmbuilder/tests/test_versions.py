@@ -0,0 +1,138 @@
+"""
+Test suite for the version ordering and ranges, exclusively for
+`jmbuilder.versions` module.
+
+The orderings are the examples published with Maven's ``ComparableVersion``
+(and its test suite).
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import random
+import unittest
+from typing import Sequence
+
+from .. import versions as jmversions
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+
+
+VERSIONS_QUALIFIER: Sequence[str] = (
+    '1-alpha2snapshot', '1-alpha2', '1-alpha-123', '1-beta-2', '1-beta123', '1-m2', '1-m11',
+    '1-rc', '1-cr2', '1-rc123', '1-SNAPSHOT', '1', '1-sp', '1-sp2', '1-sp123', '1-abc',
+    '1-def', '1-pom-1', '1-1-snapshot', '1-1', '1-2', '1-123'
+)
+
+VERSIONS_NUMBER: Sequence[str] = (
+    '2.0', '2.0.a', '2-1', '2.0.2', '2.0.123', '2.1.0', '2.1-a', '2.1b', '2.1-c', '2.1-1',
+    '2.1.0.1', '2.2', '2.123', '11.a2', '11.a11', '11.b2', '11.b11', '11.m2', '11.m11', '11',
+    '11.a', '11b', '11c', '11m'
+)
+
+
+class TestComparableVersion(unittest.TestCase):
+    """Test class for the version ordering."""
+
+    def assert_order(self, versions: Sequence[str]) -> None:
+        """Assert that the versions are in ascending order, pairwise and once sorted."""
+        for lower, higher in zip(versions, versions[1:]):
+            self.assertLess(jmversions.ComparableVersion(lower),
+                            jmversions.ComparableVersion(higher), f'{lower} < {higher}')
+        shuffled: list = list(versions)
+        random.Random(0).shuffle(shuffled)
+        self.assertListEqual(sorted(shuffled, key=jmversions.version_key), list(versions))
+
+    def test_order(self) -> None:
+        """Test the ordering of the qualifiers and numbers."""
+        self.assert_order(VERSIONS_QUALIFIER)
+        self.assert_order(VERSIONS_NUMBER)
+        self.assert_order(('1-snapshot', '1', '1-sp'))
+        self.assert_order(('1-foo2', '1-foo10'))
+        self.assert_order(('1.foo', '1-1', '1.1'))
+        self.assert_order(('1-ga', '1-sp'))
+        self.assert_order(('1-ga.1', '1-sp.1'))
+        self.assert_order(('6.1.0rc3', '6.1.0', '6.1H.5-beta'))
+        self.assert_order(('1', '99999999999999999999', '100000000000000000000'))
+
+    def test_equal(self) -> None:
+        """Test the versions equal after the aliases and the normalization."""
+        for first, second in (
+                ('1', '1.0'), ('1', '1.0.0'), ('1', '1-0'), ('1', '1.0-0'), ('1.0', '1.0-0'),
+                ('1a', '1-a'), ('1a', '1.0-a'), ('1a', '1.0.0-a'), ('1.0a', '1-a'),
+                ('1.0.0a', '1-a'), ('1x', '1.0.0-x'), ('1.ga', '1'), ('1-ga', '1'),
+                ('1ga', '1'), ('1release', '1'), ('1final', '1'), ('1cr', '1rc'),
+                ('1.foo', '1-foo'), ('1a1', '1-alpha-1'), ('1-a1', '1-alpha-1'),
+                ('1b2', '1-beta-2'), ('1m3', '1-milestone-3'), ('1X', '1x'), ('1A', '1a')):
+            self.assertEqual(jmversions.ComparableVersion(first),
+                             jmversions.ComparableVersion(second), f'{first} = {second}')
+            self.assertEqual(hash(jmversions.ComparableVersion(first)),
+                             hash(jmversions.ComparableVersion(second)))
+
+    def test_comparable_version(self) -> None:
+        """Test the comparisons with strings, and the cached keys."""
+        version = jmversions.ComparableVersion('1.0-SNAPSHOT')
+        self.assertTrue(version < '1.0')
+        self.assertEqual(version, '1-snapshot')
+        self.assertEqual(str(version), '1.0-SNAPSHOT')
+        self.assertEqual(max(map(jmversions.ComparableVersion, ('1.9', '1.10', '1.2'))),
+                         '1.10')
+
+        hits: int = jmversions.version_key.cache_info().hits
+        jmversions.version_key('1.0-SNAPSHOT')
+        self.assertEqual(jmversions.version_key.cache_info().hits, hits + 1)
+
+
+class TestVersionRange(unittest.TestCase):
+    """Test class for the `jmbuilder.versions.VersionRange` class."""
+
+    def test_parse(self) -> None:
+        """Test parsing the ranges, and their string forms."""
+        for spec in ('1.0', '[1.0]', '[1.0,2.0)', '(1.0,2.0]', '[1.5,)', '(,1.0]',
+                     '(,1.0],[1.2,)'):
+            self.assertEqual(str(jmversions.VersionRange.parse(spec)), spec)
+        self.assertTrue(jmversions.VersionRange.parse('1.0').is_soft)
+        self.assertTupleEqual(jmversions.VersionRange.parse('[1.0, 2.0)').restrictions, (
+            jmversions.Restriction('1.0', True, '2.0', False),))
+
+        for spec in ('', '[1.0', '[1.0,2.0', '(1.0)', '[]', '[2.0,1.0]', '[,1.0]', '[1.0,]',
+                     '[1.0,2.0,3.0]', '[1.0,)x', '[1.2,),[1.0,1.1]', '[1.0,1.5],[1.2,2.0]'):
+            with self.assertRaises(ValueError, msg=spec):
+                jmversions.VersionRange.parse(spec)
+
+    def test_contains(self) -> None:
+        """Test the versions within the ranges, the bounds are ordered as Maven does."""
+        version_range = jmversions.VersionRange.parse('[1.0,2.0)')
+        self.assertIn('1.0', version_range)
+        self.assertIn('1.10', version_range)
+        self.assertIn('2.0-SNAPSHOT', version_range)
+        self.assertNotIn('2.0', version_range)
+        self.assertNotIn('1.0-rc1', version_range)
+
+        version_range = jmversions.VersionRange.parse('(,1.0],[1.2,)')
+        self.assertIn('1.0.0', version_range)
+        self.assertNotIn('1.1', version_range)
+        self.assertIn('3', version_range)
+        self.assertIn('0.1', jmversions.VersionRange.parse('1.0'))
+
+    def test_select(self) -> None:
+        """Test selecting the version to be used from the available ones."""
+        available: Sequence[str] = ('1.9', '1.10', '2.0', '2.1-SNAPSHOT')
+        self.assertEqual(jmversions.VersionRange.parse('[1.0,2.0)').select(available), '1.10')
+        self.assertEqual(jmversions.VersionRange.parse('[2.0,)').select(available),
+                         '2.1-SNAPSHOT')
+        self.assertEqual(jmversions.VersionRange.parse('[1.9]').select(available), '1.9')
+        self.assertIsNone(jmversions.VersionRange.parse('[3.0,)').select(available))
+        self.assertEqual(jmversions.VersionRange.parse('3.0').select(available), '3.0')
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
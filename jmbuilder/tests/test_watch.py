@@ -0,0 +1,134 @@
+"""
+Test suite for the watch mode, exclusively for `jmbuilder._watch` module.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from .. import _cli as jmcli
+from .. import _watch as jmwatch
+from .. import core as jmcore
+from .._globals import AUTHOR, VERSION, VERSION_INFO
+from ._fixtures import POM
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    """Wait until the predicate returns True, or the timeout is reached."""
+    deadline: float = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class TestWatch(unittest.TestCase):
+    """Test class for the watch mode."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.files: dict = {
+            'pom': os.path.join(self.tmpdir.name, 'pom.xml'),
+            'a': os.path.join(self.tmpdir.name, 'a.properties'),
+            'b': os.path.join(self.tmpdir.name, 'b.properties')
+        }
+        self._write('pom', POM)
+        self._write('a', 'version = ${project.version}\n')
+        self._write('b', 'name = ${project.name}\n')
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _write(self, name: str, contents: str) -> None:
+        with open(self.files[name], 'w', encoding='utf-8') as file:
+            file.write(contents)
+        # Make sure the modification time differs, even on coarse filesystems
+        stat = os.stat(self.files[name])
+        os.utime(self.files[name], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+    def _read(self, path: str) -> str:
+        with open(path, 'r', encoding='utf-8') as file:
+            return file.read().strip()
+
+    def test_poll_watcher(self) -> None:
+        """Test detecting the changed files by polling."""
+        watcher = jmwatch._PollWatcher(self.files.values(), interval=0.01)
+        self.assertSetEqual(watcher.wait(0.05), set())
+
+        self._write('a', 'foo = bar\n')
+        self.assertSetEqual(watcher.wait(0.05), {self.files['a']})
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'requires inotify')
+    def test_inotify_overflow(self) -> None:
+        """Test returning all the watched files when the inotify events were lost."""
+        watcher = jmwatch._InotifyWatcher(self.files.values())
+        self.addCleanup(watcher.close)
+        self._write('a', 'foo = bar\n')
+        self.assertSetEqual(watcher.wait(5), {self.files['a']})
+
+        self._write('b', 'foo = bar\n')  # Readable, but its events are read as lost
+        overflow: bytes = jmwatch._IN_EVENT_HEADER.pack(-1, jmwatch._IN_Q_OVERFLOW, 0, 0)
+        with mock.patch.object(jmwatch._os, 'read', return_value=overflow):
+            self.assertSetEqual(watcher.wait(5), set(self.files.values()))
+
+    def test_watch(self) -> None:
+        """Test re-rendering only the affected outputs."""
+        out_a: str = os.path.join(self.tmpdir.name, 'out', 'a.properties')
+        out_b: str = os.path.join(self.tmpdir.name, 'out', 'b.properties')
+        jobs = jmcli.parse_args([
+            '--fix-prop', self.files['pom'], self.files['a'], out_a,
+            '--fix-prop', self.files['pom'], self.files['b'], out_b
+        ]).jobs
+
+        parsed: list = []
+        stopped = threading.Event()
+
+        def parse_pom(path: str) -> jmcore.PomParser:
+            parsed.append(path)
+            return jmcore.PomParser.parse(path)
+
+        watcher = threading.Thread(target=jmwatch.watch, args=(jobs,), kwargs={
+            'parse_pom': parse_pom, 'interval': 0.02, 'debounce': 0.05,
+            'stop': stopped.is_set
+        })
+        watcher.start()
+        try:
+            self.assertTrue(_wait_for(lambda: os.path.exists(out_b)))
+            self.assertEqual(len(parsed), 1)
+            time.sleep(0.2)  # Let the watcher start watching
+            mtime_b: int = os.stat(out_b).st_mtime_ns
+
+            # Changing a template re-renders only its output, without parsing the POM
+            self._write('a', 'version = ${project.version}\nname = ${project.name}\n')
+            self.assertTrue(_wait_for(lambda: 'name' in self._read(out_a)))
+            self.assertEqual(len(parsed), 1)
+            self.assertEqual(os.stat(out_b).st_mtime_ns, mtime_b)
+
+            # Changing the POM re-parses it and re-renders all outputs
+            self._write('pom', POM.replace('Example', 'Changed'))
+            self.assertTrue(_wait_for(lambda: 'Changed' in self._read(out_b)))
+            self.assertEqual(len(parsed), 2)
+        finally:
+            stopped.set()
+            watcher.join(timeout=5)
+
+
+__author__     = AUTHOR
+__version__    = VERSION
+__version_info = VERSION_INFO
+
+
+# Remove imported objects that are no longer used
+del AUTHOR, VERSION, VERSION_INFO
+
+
+if __name__ == '__main__':
+    unittest.main()
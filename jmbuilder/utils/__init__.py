@@ -2,24 +2,71 @@
 
 This module provide utilities for `JMBuilder` package.
 
+The submodules (`logger` and `utils`) and their members are loaded lazily
+on first access, see ``__getattr__`` below.
+
 Copyright (c) 2023-2024 Ryuu Mitsuki.
 """
 
-from . import logger, utils
-from .logger import *
-from .utils import *
+from importlib import import_module as _import_module
+
+from .. import _globals
+
 
-from .._globals import AUTHOR, VERSION, VERSION_INFO
+_LAZY_SUBMODULES = ('logger', 'utils')
+_LAZY_ATTRS = {
+    # logger
+    'init_logger': 'logger',
+    'stop_logger': 'logger',
+    # utils
+    'json_parser': 'utils',
+    'remove_comments': 'utils',
+    'remove_blanks': 'utils',
+    'readfile': 'utils',
+    'remove_duplicates': 'utils',
+    'JMProperties': 'utils'
+}
 
 __all__ = ['logger', 'utils']
-__all__.extend(logger.__all__)
-__all__.extend(utils.__all__)
+__all__.extend(['init_logger', 'stop_logger'])  # logger.__all__
+__all__.extend([                 # utils.__all__
+    'json_parser', 'remove_comments', 'remove_blanks', 'JMProperties'
+])
+
+
+def __getattr__(name: str):
+    """
+    Lazily import the submodules and their members on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of attribute to be retrieved.
+
+    Returns
+    -------
+    Any :
+        The requested submodule or member.
+
+    Raises
+    ------
+    AttributeError :
+        If the given name is neither a lazy submodule nor a lazy member.
+
+    """
+    if name in _LAZY_SUBMODULES:
+        return _import_module(f'.{name}', __name__)
+
+    if name in _LAZY_ATTRS:
+        value = getattr(_import_module(f'.{_LAZY_ATTRS[name]}', __name__), name)
+        globals()[name] = value
+        return value
 
+    # The setup metadata (e.g., `__version__`) are loaded on first access as well
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
 
-__author__       = AUTHOR
-__version__      = VERSION
-__version_info__ = VERSION_INFO
 
+def __dir__():
+    """Return the list of module attributes, including the lazy ones."""
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES) | set(_LAZY_ATTRS))
 
-# Delete imported objects that are no longer used
-del AUTHOR, VERSION, VERSION_INFO
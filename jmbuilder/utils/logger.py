@@ -6,6 +6,11 @@ This module provides a custom logger utility that initializes and creates a new
 To use the custom logger in your project, you can import the `init_logger` function
 from this module and create a new `Logger` object with desired settings.
 
+Initializing a logger is idempotent per logger name, calling `init_logger`
+again returns the same logger without adding another handler. The records
+are passed through a queue to a background thread (`QueueListener`), so the
+console and file I/O never happen on the logging thread.
+
 Copyright (c) 2023-2024 Ryuu Mitsuki.
 
 
@@ -16,6 +21,10 @@ init_logger
     information or errors to file, if specified, otherwise the output
     will be written to console standard error.
 
+stop_logger
+    Stop the background listener of the logger, writing all pending
+    records, and remove its handler.
+
 Available Constants
 -------------------
 BASIC_FORMAT : str
@@ -90,17 +99,19 @@ ZeroDivisionError: division by zero
 
 import os as _os
 import sys as _sys
+import queue as _queue
+import atexit as _atexit
 import logging as _log
-from typing import Union
+import logging.handlers as _loghandlers
+import threading as _threading
+from typing import Any, Dict, Union
 
-from .._globals import AUTHOR, VERSION, VERSION_INFO, STDERR
+from .. import _globals
+from .._globals import STDERR, LOGSDIR
 from ..exception import JMUnknownTypeError as _JMTypeError
 
 
-__all__ = ['init_logger']
-__author__ = AUTHOR
-__version__ = VERSION
-__version_info__ = VERSION_INFO
+__all__ = ['init_logger', 'stop_logger']
 
 
 # References of formatter
@@ -117,18 +128,40 @@ ERROR    = _log.ERROR       # 40
 CRITICAL = _log.CRITICAL    # 50
 FATAL    = _log.FATAL       # 50
 
+# The background listeners of initialized loggers, keyed by the logger name
+_LISTENERS: Dict[str, _loghandlers.QueueListener] = {}
+_LISTENERS_LOCK: _threading.Lock = _threading.Lock()
+
+
+class _QueueHandler(_loghandlers.QueueHandler):
+    """
+    A queue handler passing the records as is, the listener runs in the
+    same process, so the records need not to be formatted (made picklable)
+    by the logging thread.
+    """
+
+    def prepare(self, record: _log.LogRecord) -> _log.LogRecord:
+        return record
+
 
 def init_logger(filename: str = None, *, fmt: Union[str, _log.Formatter] = None,
-                level: int = DEBUG) -> _log.Logger:
+                level: int = DEBUG, max_bytes: int = 0,
+                backup_count: int = 0) -> _log.Logger:
     """
     Initializes and creates a new `Logger` object.
 
+    The logger is named after the base name of `filename`, or
+    ``'JMBuilder log'`` if not specified. If a logger with the same name
+    has been initialized, it is returned as is (only its level is updated),
+    so that calling this function several times does not duplicate the records.
+
     Parameters
     ----------
     filename : str or None, optional
         A string representing the name of the logger file. If specified,
         logs will be written to the specified file, otherwise logs
-        will be printed to `stderr` (standard error). Default is ``None``.
+        will be printed to `stderr` (standard error). A file name without
+        any directory is placed in `LOGSDIR`. Default is ``None``.
 
     fmt : str or logging.Formatter, optional
         A string representation of the log formatter or an object
@@ -139,6 +172,15 @@ def init_logger(filename: str = None, *, fmt: Union[str, _log.Formatter] = None,
         An integer value that specifies the logging level for the logger.
         Default is ``logger.DEBUG`` (equal to 10).
 
+    max_bytes : int, optional
+        If greater than zero, the log file is rotated whenever it would
+        exceed this size in bytes. Only used if `filename` is specified.
+        Default is ``0`` (never rotate).
+
+    backup_count : int, optional
+        The number of rotated log files to keep (i.e., ``<filename>.1``
+        up to ``<filename>.<backup_count>``). Default is ``0``.
+
     Returns
     -------
     logging.Logger :
@@ -151,45 +193,105 @@ def init_logger(filename: str = None, *, fmt: Union[str, _log.Formatter] = None,
 
     """
 
-    handler: _log.Handler = None
-
-    # Check whether the 'filename' are specified
-    if not filename:
-        handler = _log.StreamHandler(STDERR)
-    else:
+    if filename:
         if not isinstance(filename, str):
             filename = str(filename)
 
         if isinstance(filename, str) and not filename.endswith('.log'):
             filename += '.log'
 
-        # Check whether the parent directory of 'filename' exist
-        if not _os.path.exists(_os.path.dirname(filename)):
-            # Create the directory if not exist
-            _os.mkdir(_os.path.dirname(filename))
-        handler = _log.FileHandler(filename)
-
-    # Check whether the 'fmt' as log formatter are specified
-    if not fmt:
-        handler.setFormatter(_log.Formatter(CUSTOM_FORMAT))
-    elif fmt and isinstance(fmt, (str, _log.Formatter)):
-        if isinstance(fmt, str):
-            handler.setFormatter(_log.Formatter(fmt))
-        else:
-            handler.setFormatter(fmt)
-    else:
-        raise _JMTypeError(
-            f'Invalid type of `fmt`: "{type(fmt).__name__}". ' + \
-            'Expected "str" and "logging.Formatter"')
-
-    logger = _log.getLogger(
-        _os.path.basename(filename)
-    ) if filename else _log.getLogger('JMBuilder log')
+    name: str = _os.path.basename(filename) if filename else 'JMBuilder log'
+    logger: _log.Logger = _log.getLogger(name)
     logger.setLevel(level)      # set the logger level, default is DEBUG
-    logger.addHandler(handler)  # set the handler
+
+    with _LISTENERS_LOCK:
+        # Already initialized, do not add another handler
+        if name in _LISTENERS:
+            return logger
+
+        handler: _log.Handler = None
+
+        # Check whether the 'filename' are specified
+        if not filename:
+            handler = _log.StreamHandler(STDERR)
+        else:
+            # Place the bare file name in the logs directory
+            if not _os.path.dirname(filename):
+                filename = _os.path.join(LOGSDIR, filename)
+
+            # Create the parent directory of 'filename' if not exist
+            _os.makedirs(_os.path.dirname(filename), exist_ok=True)
+            handler = _loghandlers.RotatingFileHandler(
+                filename, maxBytes=max_bytes, backupCount=backup_count) \
+                if max_bytes > 0 else _log.FileHandler(filename)
+
+        # Check whether the 'fmt' as log formatter are specified
+        if not fmt:
+            handler.setFormatter(_log.Formatter(CUSTOM_FORMAT))
+        elif fmt and isinstance(fmt, (str, _log.Formatter)):
+            if isinstance(fmt, str):
+                handler.setFormatter(_log.Formatter(fmt))
+            else:
+                handler.setFormatter(fmt)
+        else:
+            raise _JMTypeError(
+                f'Invalid type of `fmt`: "{type(fmt).__name__}". ' + \
+                'Expected "str" and "logging.Formatter"')
+
+        # Pass the records through a queue, the handler
+        # is called from the listener's background thread
+        records: _queue.SimpleQueue = _queue.SimpleQueue()
+        listener: _loghandlers.QueueListener = _loghandlers.QueueListener(records, handler)
+        listener.start()
+
+        logger.addHandler(_QueueHandler(records))  # set the handler
+        _LISTENERS[name] = listener
 
     return logger
 
 
+def stop_logger(logger: Union[str, _log.Logger] = None) -> None:
+    """
+    Stop the background listener of the logger, writing all pending
+    records, and remove its handler.
+
+    Stopped loggers can be initialized again using `init_logger`.
+    All loggers are stopped automatically at the interpreter exit.
+
+    Parameters
+    ----------
+    logger : str or logging.Logger, optional
+        The logger or its name. Defaults to ``'JMBuilder log'``,
+        the name of the console logger.
+
+    """
+    name: str = logger.name if isinstance(logger, _log.Logger) else (logger or 'JMBuilder log')
+    with _LISTENERS_LOCK:
+        listener = _LISTENERS.pop(name, None)
+    if listener is None:
+        return
+
+    listener.stop()  # Wait until all pending records are handled
+    for handler in listener.handlers:
+        handler.close()
+
+    target: _log.Logger = _log.getLogger(name)
+    for handler in list(target.handlers):
+        if isinstance(handler, _loghandlers.QueueHandler) and handler.queue is listener.queue:
+            target.removeHandler(handler)
+
+
+@_atexit.register
+def _stop_all() -> None:
+    """Stop all background listeners, so that no pending record is lost at exit."""
+    for name in list(_LISTENERS):
+        stop_logger(name)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
 # Remove unnecessary variables
-del AUTHOR, VERSION, VERSION_INFO, Union
+del Any, Dict, Union
@@ -73,18 +73,17 @@ readfile
 """
 
 import os as _os
-import io as _io
 import sys as _sys
 import json as _json
 import locale as _locale
 import collections as _collections
 from pathlib import Path as _Path
 from typing import (
-    Dict, List, Optional,
+    Any, Dict, List, Optional,
     Union, Type, TextIO, Sequence
 )
 
-from .._globals import AUTHOR, VERSION, VERSION_INFO
+from .. import _globals
 from ..exception import (
     JMUnknownTypeError as _JMTypeError,
     JMParserError as _JMParserError
@@ -353,8 +352,9 @@ class JMProperties(_collections.UserDict):
     filename : str or TextIO
         The filename or file object to read properties from. If a filename is
         provided, it checks for the file's existence, opens the file stream,
-        and retrieves the properties. If a file object is provided, it directly
-        reads the properties from it.
+        and retrieves the properties. If a file object is provided (including
+        in-memory text streams, such as `io.StringIO`), it directly reads
+        the properties from it.
 
     encoding : str, optional
         The encoding to use when opening the file stream. If not specified,
@@ -366,8 +366,9 @@ class JMProperties(_collections.UserDict):
     data : Dict[str, str]
         A dictionary containing all the parsed properties.
 
-    filename : str
-        An absolute path to the specified property file.
+    filename : str or None
+        An absolute path to the specified property file, or ``None`` if
+        the properties were read from an unnamed stream.
 
     Raises
     ------
@@ -474,11 +475,11 @@ class JMProperties(_collections.UserDict):
         if isinstance(filename, str):
             with open(filename, 'r', encoding=encoding) as prop:
                 contents = prop.readlines()
-        elif isinstance(filename, _io.TextIOWrapper):
+        elif hasattr(filename, 'readlines'):
             contents = filename.readlines()
 
-            # Get the name of property file
-            self.filename = filename.name
+            # Get the name of property file, in-memory streams have no name
+            self.filename = getattr(filename, 'name', None)
 
         # Extract file contents, remove comments and empty strings
         contents = __blank_remover(contents)
@@ -515,11 +516,10 @@ class JMProperties(_collections.UserDict):
         super().__init__(properties_data)
 
 
-__author__       = AUTHOR
-__version__      = VERSION
-__version_info__ = VERSION_INFO
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
 
 
 # Delete imported objects that are no longer used
-del AUTHOR, VERSION, VERSION_INFO
-del Dict, List, Optional, Union, Type, TextIO, Sequence
+del Any, Dict, List, Optional, Union, Type, TextIO, Sequence
@@ -0,0 +1,425 @@
+"""Versions Module for `JMBuilder`
+
+This module orders the versions of artifacts as Maven does (see Maven's
+``ComparableVersion``), and parses the version ranges used by the
+dependencies, for example::
+
+    >>> from jmbuilder.versions import VersionRange, version_key
+    >>> sorted(['1.0', '1.0-SNAPSHOT', '1.0-sp', '1.0-rc1', '1.0.1'], key=version_key)
+    ['1.0-rc1', '1.0-SNAPSHOT', '1.0', '1.0-sp', '1.0.1']
+    >>> VersionRange.parse('[1.0,2.0)').select(['0.9', '1.5', '2.0'])
+    '1.5'
+
+Each version is parsed once into a sort key made of nested tuples, which
+compare natively (without calling back into Python), and the keys are
+memoized in a LRU cache, so sorting large lists of versions is fast.
+
+The version is split into items: numbers, qualifiers (``alpha``, ``beta``,
+``milestone``, ``rc``, ``snapshot``, the release, ``sp``, then the unknown
+ones sorted lexically), qualifiers followed by a number (e.g., ``rc1``), and
+sublists started by a ``-`` or by a transition between digits and letters.
+The trailing "null" items (``0``, ``ga``, ``final``, ``release``) are
+removed, so ``1.0.0`` equals ``1`` and ``1-ga`` equals ``1``.
+
+Maven's comparison is not transitive for some unusual mixes of separators
+(e.g., a qualifier between dots such as ``1.sp.2``, compared with ``1-alpha``),
+where no sort order can agree with every pair; the keys define a total order
+instead, which agrees with Maven for the usual versions.
+
+Copyright (c) 2023-2024 Ryuu Mitsuki.
+
+
+Available Classes
+-----------------
+ComparableVersion
+    A version ordered as Maven does.
+
+Restriction
+    A single interval of a version range.
+
+VersionRange
+    A version range (e.g., ``[1.0,2.0)``), or a soft version requirement.
+
+Available Functions
+-------------------
+version_key
+    Return the sort key of the version, cached.
+
+"""
+
+import re as _re
+import functools as _functools
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import _globals
+
+
+__all__ = ['ComparableVersion', 'Restriction', 'VersionRange', 'version_key']
+
+# The maximum number of sort keys to be cached
+CACHE_SIZE: int = 262144
+
+# The known qualifiers in their order, the release is the empty qualifier
+QUALIFIERS: Tuple[str, ...] = ('alpha', 'beta', 'milestone', 'rc', 'snapshot', '', 'sp')
+ALIASES: dict = {'ga': '', 'final': '', 'release': '', 'cr': 'rc'}
+_RELEASE: int = QUALIFIERS.index('')
+_QUALIFIER_RANKS: dict = {qualifier: rank for rank, qualifier in enumerate(QUALIFIERS)}
+
+# The plain numeric versions (e.g., ``1.2.0``), encoded without the full parsing
+_NUMERIC_RE: _re.Pattern = _re.compile(r'[0-9]+(?:\.[0-9]+)*')
+
+# The bands of the encoded items, relative to the "null" item padding the shorter
+# lists: the qualifiers and sublists lower than null, null, the qualifiers and
+# sublists greater than null, then the numbers
+_BAND_QUALIFIER_LOW, _BAND_LIST_LOW, _BAND_NULL = 0, 1, 2
+_BAND_QUALIFIER_HIGH, _BAND_LIST_HIGH, _BAND_NUMBER = 3, 4, 5
+
+# Terminates every encoded list, so that the padding of shorter lists is compared
+# as a null item, as in Maven
+_NULL: tuple = (_BAND_NULL,)
+
+
+class _Item(NamedTuple):
+    """An item of a parsed version, of kind 'int', 'str', 'combination' or 'list'."""
+    kind: str
+    value: object  # int, str, (str, int) or a list of _Item
+
+
+def _qualifier(value: str, followed_by_digit: bool) -> str:
+    if followed_by_digit and value in ('a', 'b', 'm'):
+        value = {'a': 'alpha', 'b': 'beta', 'm': 'milestone'}[value]
+    return ALIASES.get(value, value)
+
+
+def _parse_item(is_combination: bool, is_digit: bool, token: str) -> _Item:
+    if is_combination:
+        token = token.replace('-', '')
+        idx: int = next(idx for idx, char in enumerate(token) if '0' <= char <= '9')
+        return _Item('combination', (_qualifier(token[:idx], True), int(token[idx:])))
+    if is_digit:
+        return _Item('int', int(token))
+    return _Item('str', _qualifier(token, False))
+
+
+def _is_null(item: _Item) -> bool:
+    return not item.value if item.kind in ('int', 'str', 'list') else False
+
+
+def _normalize(items: List[_Item]) -> None:
+    """Remove the null items, unless followed by a number or a sublist of numbers."""
+    for idx in range(len(items) - 1, -1, -1):
+        if idx < len(items) and _is_null(items[idx]):
+            following: Optional[_Item] = items[idx + 1] if idx + 1 < len(items) else None
+            if following is None or following.kind == 'str' or (
+                    following.kind == 'list' and
+                    following.value[0].kind in ('combination', 'str')):
+                del items[idx]
+
+
+def _parse(version: str) -> List[_Item]:
+    """Parse the version into items, as Maven's ``ComparableVersion.parseVersion``."""
+    version = version.lower()
+    items: List[_Item] = []
+    current: List[_Item] = items
+    stack: List[List[_Item]] = [items]
+
+    def sublist() -> 'List[_Item]':
+        new: 'List[_Item]' = []
+        current.append(_Item('list', new))
+        stack.append(new)
+        return new
+
+    is_digit: bool = False
+    is_combination: bool = False
+    start: int = 0
+    for idx, char in enumerate(version):
+        if char == '.':
+            current.append(_Item('int', 0) if idx == start else
+                           _parse_item(is_combination, is_digit, version[start:idx]))
+            is_combination = False
+            start = idx + 1
+        elif char == '-':
+            if idx == start:
+                current.append(_Item('int', 0))
+            else:
+                # X-1 is treated as X1
+                if not is_digit and idx + 1 < len(version) and '0' <= version[idx + 1] <= '9':
+                    is_combination = True
+                    continue
+                current.append(_parse_item(is_combination, is_digit, version[start:idx]))
+            start = idx + 1
+            if current:
+                current = sublist()
+            is_combination = False
+        elif '0' <= char <= '9':
+            if not is_digit and idx > start:
+                is_combination = True  # X1
+                if current:
+                    current = sublist()
+            is_digit = True
+        else:
+            if is_digit and idx > start:
+                current.append(_parse_item(is_combination, True, version[start:idx]))
+                start = idx
+                current = sublist()
+                is_combination = False
+            is_digit = False
+
+    if len(version) > start:
+        # Treat .X as -X for any string qualifier X, i.e. 1.0.0.X1 < 1.0.0-X2
+        if not is_digit and current:
+            current = sublist()
+        current.append(_parse_item(is_combination, is_digit, version[start:]))
+
+    while stack:
+        _normalize(stack.pop())
+    return items
+
+
+def _qualifier_key(qualifier: str) -> Tuple[int, str]:
+    """Return the order of the qualifier, the unknown ones lexically after the known."""
+    rank: Optional[int] = _QUALIFIER_RANKS.get(qualifier)
+    return (rank, '') if rank is not None else (len(QUALIFIERS), qualifier)
+
+
+def _sign(item: _Item) -> int:
+    """Return the sign of the comparison of the item with null."""
+    if item.kind == 'int':
+        return 1 if item.value else 0
+    if item.kind == 'list':
+        return next((sign for sign in map(_sign, item.value) if sign), 0)
+    rank: int = _qualifier_key(item.value if item.kind == 'str' else item.value[0])[0]
+    return (rank > _RELEASE) - (rank < _RELEASE)
+
+
+def _encode(item: _Item) -> tuple:
+    """Encode the item into a tuple, ordered as Maven compares the items."""
+    if item.kind == 'int':
+        return _BAND_NUMBER, item.value
+    sign: int = _sign(item)
+    if item.kind == 'list':
+        return (_BAND_LIST_HIGH if sign >= 0 else _BAND_LIST_LOW,
+                tuple(map(_encode, item.value)) + (_NULL,))
+    if item.kind == 'str' and sign == 0:
+        return _NULL  # The release qualifier
+    band: int = _BAND_QUALIFIER_HIGH if sign >= 0 else _BAND_QUALIFIER_LOW
+    if item.kind == 'str':
+        return band, _qualifier_key(item.value), 0, 0
+    # A qualifier followed by a number sorts after the qualifier alone, i.e. X1 > X
+    return band, _qualifier_key(item.value[0]), 1, item.value[1]
+
+
+@_functools.lru_cache(maxsize=CACHE_SIZE)
+def version_key(version: str) -> tuple:
+    """
+    Return the sort key of the version, ordered as Maven does.
+
+    The keys are cached, each version is parsed only once.
+
+    Parameters
+    ----------
+    version : str
+        The version string (e.g., ``1.0-SNAPSHOT``), case-insensitive.
+
+    Returns
+    -------
+    tuple :
+        The sort key, to be compared with the keys of other versions only.
+
+    """
+    if _NUMERIC_RE.fullmatch(version):
+        numbers: List[int] = list(map(int, version.split('.')))
+        while numbers and not numbers[-1]:
+            numbers.pop()  # The trailing zeros, i.e. 1.0.0 = 1
+        return tuple((_BAND_NUMBER, number) for number in numbers) + (_NULL,)
+    return tuple(map(_encode, _parse(version))) + (_NULL,)
+
+
+@_functools.total_ordering
+class ComparableVersion:
+    """
+    A version ordered as Maven does, see `version_key`.
+
+    Parameters
+    ----------
+    version : str
+        The version string.
+
+    """
+
+    __slots__ = ('value', 'key')
+
+    def __init__(self, version: str) -> None:
+        """Create a new comparable version."""
+        self.value: str = version
+        self.key: tuple = version_key(version)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, str):
+            other = ComparableVersion(other)
+        return self.key == other.key if isinstance(other, ComparableVersion) \
+            else NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, str):
+            other = ComparableVersion(other)
+        return self.key < other.key if isinstance(other, ComparableVersion) \
+            else NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.value!r})'
+
+
+class Restriction(NamedTuple):
+    """A single interval of a version range, unbounded where the bound is None."""
+    lower: Optional[str]
+    lower_inclusive: bool
+    upper: Optional[str]
+    upper_inclusive: bool
+
+    def __contains__(self, version: str) -> bool:
+        key: tuple = version_key(version)
+        if self.lower is not None:
+            lower: tuple = version_key(self.lower)
+            if key < lower or (key == lower and not self.lower_inclusive):
+                return False
+        if self.upper is not None:
+            upper: tuple = version_key(self.upper)
+            if key > upper or (key == upper and not self.upper_inclusive):
+                return False
+        return True
+
+    def __str__(self) -> str:
+        if self.lower == self.upper and self.lower is not None and self.lower_inclusive:
+            return f'[{self.lower}]'
+        return ('[' if self.lower_inclusive else '(') + (self.lower or '') + ',' + \
+            (self.upper or '') + (']' if self.upper_inclusive else ')')
+
+
+class VersionRange(NamedTuple):
+    """
+    A version range, as declared by the dependencies.
+
+    A range is either a soft requirement of the `recommended` version
+    (e.g., ``1.0``), matching any version, or a union of `restrictions`
+    (e.g., ``(,1.0],[1.2,)``).
+
+    """
+    recommended: Optional[str]
+    restrictions: Tuple[Restriction, ...]
+
+    @staticmethod
+    @_functools.lru_cache(maxsize=1024)
+    def parse(spec: str) -> 'VersionRange':
+        """
+        Parse the version range, as Maven's ``VersionRange.createFromVersionSpec``.
+
+        Parameters
+        ----------
+        spec : str
+            The version (a soft requirement), or the comma-separated intervals,
+            e.g., ``[1.0]``, ``[1.0,2.0)``, ``[1.5,)`` or ``(,1.0],[1.2,)``.
+
+        Returns
+        -------
+        VersionRange :
+            The parsed range.
+
+        Raises
+        ------
+        ValueError :
+            If the range is malformed, or its intervals overlap or are not in order.
+
+        """
+        spec = spec.strip()
+        if not spec.startswith(('[', '(')):
+            if not spec or any(char in spec for char in '[](),'):
+                raise ValueError(f'Invalid version range: {spec!r}')
+            return VersionRange(spec, ())
+
+        restrictions: List[Restriction] = []
+        rest: str = spec
+        while rest.startswith(('[', '(')):
+            end: int = min((idx for idx in (rest.find(']'), rest.find(')')) if idx >= 0),
+                           default=-1)
+            if end < 0:
+                raise ValueError(f'Unbounded version range: {spec!r}')
+            restriction: Restriction = VersionRange.__restriction(rest[:end + 1], spec)
+            if restrictions and (restrictions[-1].upper is None or restriction.lower is None or
+                                 version_key(restriction.lower) <
+                                 version_key(restrictions[-1].upper)):
+                raise ValueError(f'Ranges overlap or are not in order: {spec!r}')
+            restrictions.append(restriction)
+            rest = rest[end + 1:].lstrip()
+            if rest.startswith(','):
+                rest = rest[1:].lstrip()
+        if rest:
+            raise ValueError(f'Invalid version range: {spec!r}')
+        return VersionRange(None, tuple(restrictions))
+
+    @staticmethod
+    def __restriction(interval: str, spec: str) -> Restriction:
+        lower_inclusive: bool = interval[0] == '['
+        upper_inclusive: bool = interval[-1] == ']'
+        bounds: str = interval[1:-1].strip()
+        if ',' not in bounds:
+            # A single version, e.g., [1.0]
+            if not (lower_inclusive and upper_inclusive) or not bounds:
+                raise ValueError(f'Single version must be surrounded by []: {spec!r}')
+            return Restriction(bounds, True, bounds, True)
+
+        lower, _, upper = (part.strip() for part in bounds.partition(','))
+        if ',' in upper:
+            raise ValueError(f'Invalid version range: {spec!r}')
+        if lower and upper and version_key(upper) < version_key(lower):
+            raise ValueError(f'Range defies version ordering: {spec!r}')
+        if (not lower and lower_inclusive) or (not upper and upper_inclusive):
+            raise ValueError(f'Unbounded ranges must be exclusive: {spec!r}')
+        return Restriction(lower or None, lower_inclusive, upper or None, upper_inclusive)
+
+    @property
+    def is_soft(self) -> bool:
+        """Return whether this range is a soft requirement, i.e. a plain version."""
+        return self.recommended is not None
+
+    def __contains__(self, version: str) -> bool:
+        return self.is_soft or any(version in item for item in self.restrictions)
+
+    def __str__(self) -> str:
+        return self.recommended if self.is_soft else ','.join(map(str, self.restrictions))
+
+    def select(self, versions: Iterable[str]) -> Optional[str]:
+        """
+        Return the version to be used from the available ones.
+
+        Parameters
+        ----------
+        versions : iterable of str
+            The available versions (e.g., installed in the local repository).
+
+        Returns
+        -------
+        str or None :
+            The recommended version for a soft requirement, otherwise the
+            highest version within the range, or None if there is none.
+
+        """
+        if self.is_soft:
+            return self.recommended
+        return max((version for version in versions if version in self),
+                   key=version_key, default=None)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily retrieve the setup metadata (e.g., `__version__`), see `jmbuilder._globals`."""
+    return _globals._module_metadata(name, __name__)  # pylint: disable=protected-access
+
+
+# Delete unused imported objects
+del Any, Iterable, List, NamedTuple, Optional, Tuple